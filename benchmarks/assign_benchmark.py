@@ -0,0 +1,212 @@
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from tabulate import tabulate
+
+import cores.waapi
+import main
+from benchmarks.fake_waapi import FakeWaapiClient, SyntheticProject, SyntheticProjectConfig, NAME_DISTRIBUTION_LIST
+from cores.assignment_solver import ASSIGNMENT_SOLVER, GREEDY_ASSIGNMENT_SOLVER
+from cores.match_registry import MATCH_METHOD
+from cores.session import AssignSession
+from cores.waapi import WaapiWampClient
+from log import LOGGER, CLEAN_LOGGER
+
+# run main.run_job against a synthetic project for every match method, stage times are read from its profile
+# every repeat gets a fresh project generated with the same seed, so numbers are comparable across commits
+
+# stages of the profile reported in the table, stages of the pipeline overlap so total is the wall time of the job
+STAGE_LIST = ["collect", "prefetch", "query", "alias", "tokenize", "score", "assign"]
+FAKE_WAAPI_URL = "ws://127.0.0.1:8080/waapi"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--match_method", type=str, nargs="+", default=list(MATCH_METHOD.keys()),
+                        choices=MATCH_METHOD.keys(), help="Match methods to run, all by default.")
+    parser.add_argument("--assignment_solver", type=str, default=GREEDY_ASSIGNMENT_SOLVER,
+                        choices=[GREEDY_ASSIGNMENT_SOLVER] + list(ASSIGNMENT_SOLVER.keys()))
+    parser.add_argument("--containers", type=int, default=100, help="Switch container count.")
+    parser.add_argument("--switch_groups", type=int, default=10, help="Switch group count.")
+    parser.add_argument("--switches", type=int, default=30, help="Switch count of every switch group.")
+    parser.add_argument("--children", type=int, default=30, help="Child count of every switch container.")
+    parser.add_argument("--name_distribution", type=str, default="noisy", choices=NAME_DISTRIBUTION_LIST,
+                        help="exact: child names contain switch words in order; "
+                             "noisy: shuffled words with extra words; random: random words.")
+    parser.add_argument("--assigned_ratio", type=float, default=0.2,
+                        help="Ratio of switch containers with children already assigned.")
+    parser.add_argument("--assigned_child_ratio", type=float, default=0.5,
+                        help="Ratio of children already assigned in those switch containers.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5, help="Run count of every method, median is reported.")
+    parser.add_argument("--waapi_connections", type=int, default=1)
+    parser.add_argument("--output", type=str, help="Save results to a json file.")
+    parser.add_argument("--baseline", type=str, help="Json file saved by --output to compare with.")
+    return parser.parse_args()
+
+
+def get_project_config(args: argparse.Namespace) -> SyntheticProjectConfig:
+    config = SyntheticProjectConfig()
+    config.container_count = args.containers
+    config.switch_group_count = args.switch_groups
+    config.switch_count = args.switches
+    config.child_count = args.children
+    config.name_distribution = args.name_distribution
+    config.assigned_ratio = args.assigned_ratio
+    config.assigned_child_ratio = args.assigned_child_ratio
+    config.seed = args.seed
+    return config
+
+
+def get_git_commit() -> str:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                                capture_output=True, text=True, check=False)
+    except OSError:
+        return ""
+    return result.stdout.strip()
+
+
+# run one job with --recursive on the work unit
+# return (stage -> seconds, wall seconds, assigned child count, correctly assigned child count, waapi call count)
+def run_once(
+    project: SyntheticProject,
+    match_method: str,
+    assignment_solver: str,
+    waapi_connections: int
+) -> tuple[dict[str, float], float, int, int, int]:
+    fake_client = FakeWaapiClient(project)
+    cores.waapi.WaapiClient = lambda url: fake_client
+    assignment_set_dict: dict[str, set[tuple[str, str]]] = {
+        container_id: set(assignment_list) for container_id, assignment_list in project.assignment_dict.items()
+    }
+
+    waapi_client = WaapiWampClient()
+    waapi_client.connect(FAKE_WAAPI_URL, waapi_connections)
+    session = AssignSession(waapi_client)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        profile_path = os.path.join(temp_dir, "profile.json")
+        # default user config is saved to temp dir, every repeat scores from scratch
+        args = main.parse_args([
+            "--project_root", SyntheticProject.ROOT_PATH,
+            "--object_id", project.root_id,
+            "--recursive",
+            "--match_method", match_method,
+            "--assignment_solver", assignment_solver,
+            "--user_config", os.path.join(temp_dir, "config.json"),
+            "--waapi_connections", str(waapi_connections),
+            "--no_match_cache",
+            "--overwrite_policy", main.OVERWRITE_POLICY_NEVER,
+            "--batch",
+            "--matrix_output", main.MATRIX_OUTPUT_OFF,
+            "--profile", profile_path,
+        ])
+        start_time = time.perf_counter()
+        exit_code = main.run_job(args, session)
+        wall_time = time.perf_counter() - start_time
+        with open(profile_path, "r", encoding="utf-8") as f:
+            stage_data_dict: dict[str, dict] = json.load(f)["stages"]
+    waapi_client.disconnect()
+    if exit_code != 0:
+        print(f"Job of {match_method} finished with exit code {exit_code}.")
+
+    stage_time_dict: dict[str, float] = {
+        stage: stage_data_dict.get(stage, {}).get("ms", 0.0) / 1000 for stage in STAGE_LIST
+    }
+
+    # assignments added by the job, unexpected assignments are never overwritten
+    assigned_count = 0
+    correct_count = 0
+    for container_id, assignment_list in project.assignment_dict.items():
+        for child_id, switch_id in assignment_list:
+            if (child_id, switch_id) in assignment_set_dict.get(container_id, set()):
+                continue
+            assigned_count += 1
+            if project.expected_switch_dict.get(child_id, None) == switch_id:
+                correct_count += 1
+    return stage_time_dict, wall_time, assigned_count, correct_count, fake_client.get_call_count()
+
+
+def run_method(args: argparse.Namespace, match_method: str) -> dict:
+    stage_time_list_dict: dict[str, list[float]] = {stage: [] for stage in STAGE_LIST}
+    total_time_list: list[float] = []
+    assigned_count = correct_count = call_count = 0
+    for _ in range(args.repeat):
+        project = SyntheticProject(get_project_config(args))
+        stage_time_dict, wall_time, assigned_count, correct_count, call_count = run_once(
+            project, match_method, args.assignment_solver, args.waapi_connections
+        )
+        for stage, elapsed in stage_time_dict.items():
+            stage_time_list_dict[stage].append(elapsed)
+        total_time_list.append(wall_time)
+
+    return {
+        "stage_ms": {stage: statistics.median(time_list) * 1000 for stage, time_list in stage_time_list_dict.items()},
+        "total_ms": statistics.median(total_time_list) * 1000,
+        "assigned": assigned_count,
+        "correct": correct_count,
+        "waapi_calls": call_count,
+    }
+
+
+def print_results(result_dict: dict[str, dict], baseline_dict: dict[str, dict] | None):
+    header_list = ["method"] + [f"{stage} ms" for stage in STAGE_LIST] + ["total ms", "assigned", "correct", "waapi calls"]
+    if baseline_dict is not None:
+        header_list.append("speedup")
+    table_data: list[list] = []
+    for match_method, result in result_dict.items():
+        row = [match_method] + [result["stage_ms"][stage] for stage in STAGE_LIST] + \
+              [result["total_ms"], result["assigned"], result["correct"], result["waapi_calls"]]
+        if baseline_dict is not None:
+            baseline_result = baseline_dict.get(match_method, None)
+            row.append(baseline_result["total_ms"] / result["total_ms"] if baseline_result is not None else "")
+        table_data.append(row)
+    print(tabulate(table_data, headers=header_list, floatfmt=".2f"))
+
+
+if __name__ == '__main__':
+
+    args = parse_args()
+
+    # logs of every container would dominate the timings, errors of unexpected assignments are expected
+    LOGGER.setLevel(logging.CRITICAL)
+    CLEAN_LOGGER.setLevel(logging.CRITICAL)
+
+    project_config = get_project_config(args)
+    print(f"Synthetic project: {json.dumps(project_config.__dict__)}")
+    print(f"Assignment solver: {args.assignment_solver}, repeat: {args.repeat}")
+
+    result_dict: dict[str, dict] = {}
+    for method in args.match_method:
+        result_dict[method] = run_method(args, method)
+
+    baseline_result_dict = None
+    if args.baseline is not None:
+        with open(args.baseline, "r") as f:
+            baseline_data = json.load(f)
+        if baseline_data.get("project", {}) != project_config.__dict__:
+            print("Baseline is run with another synthetic project, speedup is not comparable.")
+        baseline_result_dict = baseline_data.get("results", {})
+        print(f"Baseline commit: {baseline_data.get('commit', '')}")
+    print_results(result_dict, baseline_result_dict)
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump({
+                "commit": get_git_commit(),
+                "project": project_config.__dict__,
+                "assignment_solver": args.assignment_solver,
+                "repeat": args.repeat,
+                "results": result_dict,
+            }, f, indent=4)
+        print(f"Results saved to {args.output}")
@@ -0,0 +1,274 @@
+import random
+import re
+import uuid
+from typing import Callable
+
+# in-process stand-in of the waapi router, answering the calls made by cores.waapi
+# from a synthetic project generated with a fixed seed
+
+NAME_DISTRIBUTION_EXACT = "exact"
+NAME_DISTRIBUTION_NOISY = "noisy"
+NAME_DISTRIBUTION_RANDOM = "random"
+NAME_DISTRIBUTION_LIST = [NAME_DISTRIBUTION_EXACT, NAME_DISTRIBUTION_NOISY, NAME_DISTRIBUTION_RANDOM]
+
+WORD_LIST = [
+    "grass", "wood", "metal", "stone", "water", "snow", "sand", "dirt", "tile", "glass", "mud", "gravel",
+    "carpet", "concrete", "ice", "leaves", "plastic", "rubber", "cloth", "bone", "flesh", "paper", "rock",
+    "hollow", "solid", "wet", "dry", "deep", "shallow", "light", "heavy", "soft", "hard", "small", "large",
+]
+PREFIX_WORD_LIST = ["foot", "land", "jump", "hit", "slide", "roll", "drop", "scrape"]
+NOISE_WORD_LIST = ["var", "alt", "new", "old", "loop", "short", "long", "take"]
+
+WAQL_FROM_PROJECT_ID_PATTERN = re.compile(r'^from project where id = "([^"]*)"$')
+WAQL_FROM_OBJECT_PATTERN = re.compile(r'^from object ((?:"[^"]*"(?:, )?)+)\s*(.*)$')
+WAQL_ID_PATTERN = re.compile(r'"([^"]*)"')
+WAQL_WHERE_TYPE_PATTERN = re.compile(r'where type = "([^"]*)"')
+
+
+class SyntheticProjectConfig(object):
+
+    def __init__(self):
+        self.container_count: int = 100
+        self.switch_group_count: int = 10
+        self.switch_count: int = 30
+        self.child_count: int = 30
+        self.name_distribution: str = NAME_DISTRIBUTION_NOISY
+        # ratio of containers with some children already assigned
+        self.assigned_ratio: float = 0.2
+        # ratio of children already assigned in those containers
+        self.assigned_child_ratio: float = 0.5
+        self.seed: int = 0
+
+
+class SyntheticObject(object):
+
+    def __init__(self, object_id: str, name: str, object_type: str, parent_id: str | None):
+        self.id: str = object_id
+        self.name: str = name
+        self.type: str = object_type
+        self.parent_id: str | None = parent_id
+        self.path: str = ""
+        self.switch_group_id: str | None = None
+        self.child_id_list: list[str] = []
+
+
+# work unit -> switch containers -> children, work unit -> switch groups -> switches
+class SyntheticProject(object):
+
+    ROOT_PATH = "C:\\SyntheticProject"
+
+    def __init__(self, config: SyntheticProjectConfig):
+        self.config: SyntheticProjectConfig = config
+        self.object_dict: dict[str, SyntheticObject] = {}
+        # switch container id -> list of (child id, switch id)
+        self.assignment_dict: dict[str, list[tuple[str, str]]] = {}
+        # child id -> switch id its name is generated from, not set for random names
+        self.expected_switch_dict: dict[str, str] = {}
+        self.root_id: str = ""
+
+        self._random: random.Random = random.Random(config.seed)
+        self.generate()
+
+    def new_id(self) -> str:
+        return "{" + str(uuid.UUID(int=self._random.getrandbits(128), version=4)).upper() + "}"
+
+    def add_object(self, name: str, object_type: str, parent_id: str | None) -> SyntheticObject:
+        obj = SyntheticObject(self.new_id(), name, object_type, parent_id)
+        if parent_id is None:
+            obj.path = f"\\{name}"
+        else:
+            parent_obj = self.object_dict[parent_id]
+            parent_obj.child_id_list.append(obj.id)
+            obj.path = f"{parent_obj.path}\\{name}"
+        self.object_dict[obj.id] = obj
+        return obj
+
+    def generate(self):
+        config = self.config
+        rnd = self._random
+        root_obj = self.add_object("Default Work Unit", "WorkUnit", None)
+        self.root_id = root_obj.id
+
+        # switch names are unique word combinations in one group
+        group_switch_words_list: list[tuple[SyntheticObject, list[list[str]]]] = []
+        for group_idx in range(config.switch_group_count):
+            group_obj = self.add_object(f"Surface_{group_idx}", "SwitchGroup", root_obj.id)
+            switch_words_list: list[list[str]] = []
+            used_name_set: set[str] = set()
+            while len(switch_words_list) < config.switch_count:
+                word_count = 1 if len(switch_words_list) < len(WORD_LIST) else rnd.randint(2, 3)
+                words = rnd.sample(WORD_LIST, word_count) if word_count > 1 \
+                    else [WORD_LIST[len(switch_words_list)]]
+                name = "_".join(words)
+                if name in used_name_set:
+                    continue
+                used_name_set.add(name)
+                switch_words_list.append(words)
+                self.add_object(name.title(), "Switch", group_obj.id)
+            group_switch_words_list.append((group_obj, switch_words_list))
+
+        # children are named after switches of their container's group
+        for container_idx in range(config.container_count):
+            group_obj, switch_words_list = group_switch_words_list[container_idx % len(group_switch_words_list)]
+            prefix = PREFIX_WORD_LIST[container_idx % len(PREFIX_WORD_LIST)]
+            container_obj = self.add_object(f"{prefix.title()}_{container_idx}", "SwitchContainer", root_obj.id)
+            container_obj.switch_group_id = group_obj.id
+            self.assignment_dict[container_obj.id] = []
+
+            for child_idx in range(config.child_count):
+                switch_words = switch_words_list[child_idx % len(switch_words_list)]
+                child_name = self.get_child_name(prefix, switch_words, child_idx)
+                child_obj = self.add_object(child_name, "Sound", container_obj.id)
+                if config.name_distribution != NAME_DISTRIBUTION_RANDOM:
+                    switch_id = group_obj.child_id_list[child_idx % len(switch_words_list)]
+                    self.expected_switch_dict[child_obj.id] = switch_id
+
+            # some containers are partly assigned by former runs
+            if rnd.random() < config.assigned_ratio:
+                switch_id_list = group_obj.child_id_list
+                assigned_child_count = int(len(container_obj.child_id_list) * config.assigned_child_ratio)
+                for child_id in container_obj.child_id_list[:assigned_child_count]:
+                    self.assignment_dict[container_obj.id].append((child_id, rnd.choice(switch_id_list)))
+
+    def get_child_name(self, prefix: str, switch_words: list[str], child_idx: int) -> str:
+        rnd = self._random
+        distribution = self.config.name_distribution
+        if distribution == NAME_DISTRIBUTION_EXACT:
+            words = [prefix] + switch_words
+        elif distribution == NAME_DISTRIBUTION_NOISY:
+            words = [prefix] + rnd.sample(switch_words, len(switch_words))
+            if rnd.random() < 0.5:
+                words.insert(rnd.randint(1, len(words)), rnd.choice(NOISE_WORD_LIST))
+        else:
+            words = [prefix] + rnd.sample(WORD_LIST, rnd.randint(1, 3))
+        return "_".join(word.title() for word in words) + f"_{child_idx:02d}"
+
+    # waapi return value of one object
+    def get_object_return(self, obj: SyntheticObject, return_key_list: list[str]) -> dict:
+        result: dict = {}
+        for key in return_key_list:
+            if key == "parent":
+                result[key] = {"id": obj.parent_id} if obj.parent_id is not None else None
+            elif key == "@SwitchGroupOrStateGroup":
+                if obj.switch_group_id is not None:
+                    result[key] = {"id": obj.switch_group_id}
+            elif hasattr(obj, key):
+                result[key] = getattr(obj, key)
+        return result
+
+    def get_descendant_list(self, object_id: str) -> list[SyntheticObject]:
+        descendant_list: list[SyntheticObject] = []
+        id_stack: list[str] = list(reversed(self.object_dict[object_id].child_id_list))
+        while len(id_stack) > 0:
+            obj = self.object_dict[id_stack.pop()]
+            descendant_list.append(obj)
+            id_stack.extend(reversed(obj.child_id_list))
+        return descendant_list
+
+    # only the waql forms used by cores.waapi are supported
+    def query_waql(self, waql: str) -> list[SyntheticObject]:
+        match = WAQL_FROM_PROJECT_ID_PATTERN.match(waql)
+        if match is not None:
+            obj = self.object_dict.get(match.group(1), None)
+            return [obj] if obj is not None else []
+
+        match = WAQL_FROM_OBJECT_PATTERN.match(waql)
+        if match is None:
+            raise ValueError(f"Unsupported waql: {waql}")
+        object_id_list = WAQL_ID_PATTERN.findall(match.group(1))
+        if any(object_id not in self.object_dict for object_id in object_id_list):
+            raise ValueError(f"Object not found in waql: {waql}")
+        waql_select = match.group(2)
+
+        if len(waql_select) == 0:
+            return [self.object_dict[object_id] for object_id in object_id_list]
+        if waql_select == "select children":
+            return [
+                self.object_dict[child_id]
+                for object_id in object_id_list
+                for child_id in self.object_dict[object_id].child_id_list
+            ]
+        if waql_select.startswith("select descendants"):
+            type_match = WAQL_WHERE_TYPE_PATTERN.search(waql_select)
+            return [
+                obj
+                for object_id in object_id_list
+                for obj in self.get_descendant_list(object_id)
+                if type_match is None or obj.type == type_match.group(1)
+            ]
+        raise ValueError(f"Unsupported waql: {waql}")
+
+
+# replaces waapi.WaapiClient, every session shares one synthetic project
+class FakeWaapiClient(object):
+
+    def __init__(self, project: SyntheticProject):
+        self.project: SyntheticProject = project
+        self.call_count_dict: dict[str, int] = {}
+        self._handler_dict: dict[str, Callable[[dict], dict | None]] = {
+            "ak.wwise.core.getProjectInfo": self.on_get_project_info,
+            "ak.wwise.core.object.get": self.on_object_get,
+            "ak.wwise.core.switchContainer.getAssignments": self.on_get_assignments,
+            "ak.wwise.core.switchContainer.addAssignment": self.on_add_assignment,
+            "ak.wwise.core.switchContainer.removeAssignment": self.on_remove_assignment,
+            "ak.wwise.core.undo.beginGroup": self.on_empty_call,
+            "ak.wwise.core.undo.endGroup": self.on_empty_call,
+            "ak.wwise.core.undo.cancelGroup": self.on_empty_call,
+            "ak.wwise.debug.enableAutomationMode": self.on_empty_call,
+        }
+
+    def call(self, uri: str, args: dict | None = None, **kwargs) -> dict | None:
+        self.call_count_dict[uri] = self.call_count_dict.get(uri, 0) + 1
+        handler = self._handler_dict.get(uri, None)
+        if handler is None:
+            return None
+        try:
+            return handler(args if args is not None else {})
+        except (KeyError, ValueError):
+            # waapi returns None for failed calls
+            return None
+
+    def subscribe(self, topic: str, callback: Callable, options: dict | None = None):
+        return None
+
+    def is_connected(self) -> bool:
+        return True
+
+    def disconnect(self):
+        pass
+
+    def get_call_count(self) -> int:
+        return sum(self.call_count_dict.values())
+
+    def on_empty_call(self, args: dict) -> dict:
+        return {}
+
+    def on_get_project_info(self, args: dict) -> dict:
+        return {"name": "SyntheticProject", "directories": {"root": SyntheticProject.ROOT_PATH}}
+
+    def on_object_get(self, args: dict) -> dict:
+        return_key_list = args.get("options", {}).get("return", ["id", "name"])
+        return {
+            "return": [
+                self.project.get_object_return(obj, return_key_list)
+                for obj in self.project.query_waql(args["waql"])
+            ]
+        }
+
+    def on_get_assignments(self, args: dict) -> dict:
+        return {
+            "return": [
+                {"child": child_id, "stateOrSwitch": switch_id}
+                for child_id, switch_id in self.project.assignment_dict[args["id"]]
+            ]
+        }
+
+    def on_add_assignment(self, args: dict) -> dict:
+        container_id = self.project.object_dict[args["child"]].parent_id
+        self.project.assignment_dict[container_id].append((args["child"], args["stateOrSwitch"]))
+        return {}
+
+    def on_remove_assignment(self, args: dict) -> dict:
+        container_id = self.project.object_dict[args["child"]].parent_id
+        self.project.assignment_dict[container_id].remove((args["child"], args["stateOrSwitch"]))
+        return {}
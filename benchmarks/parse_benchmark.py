@@ -0,0 +1,93 @@
+import argparse
+import gc
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from tabulate import tabulate
+
+from models.wwise_object import WwiseObject, WwiseSwitchContainerAssignmentEntry
+
+# parse synthetic results of a project-wide recursive "ak.wwise.core.object.get" query into WwiseObject
+# report items parsed per second and memory kept by the parsed objects
+
+TYPE_NAME_LIST = ["Sound", "Sound", "Sound", "RandomSequenceContainer", "SwitchContainer", "ActorMixer", "Switch"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--objects", type=int, default=50000, help="Object count of the query result.")
+    parser.add_argument("--repeat", type=int, default=5, help="Parse count, median is reported.")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+# every object refers to its parent, guids of parents are new str objects like in a decoded json message
+def create_result_data(object_count: int, seed: int) -> tuple[list[dict], list[dict]]:
+    rnd = random.Random(seed)
+    id_list = ["{" + str(uuid.UUID(int=rnd.getrandbits(128), version=4)).upper() + "}" for _ in range(object_count)]
+    object_data_list: list[dict] = []
+    assignment_data_list: list[dict] = []
+    for object_idx, object_id in enumerate(id_list):
+        parent_id = id_list[object_idx // 8]
+        name = f"Object_{object_idx}"
+        object_data_list.append({
+            "id": object_id,
+            "name": name,
+            "type": TYPE_NAME_LIST[object_idx % len(TYPE_NAME_LIST)],
+            "path": f"\\Actor-Mixer Hierarchy\\Default Work Unit\\{name}",
+            "parent": {"id": "".join(parent_id), "name": ""},
+        })
+        assignment_data_list.append({"child": "".join(object_id), "stateOrSwitch": "".join(parent_id)})
+    return object_data_list, assignment_data_list
+
+
+def parse_objects_one_by_one(object_data_list: list[dict]) -> list[WwiseObject]:
+    return [WwiseObject.from_dict(data) for data in object_data_list]
+
+
+def parse_assignment_entries(assignment_data_list: list[dict]) -> list[WwiseSwitchContainerAssignmentEntry]:
+    return [WwiseSwitchContainerAssignmentEntry.from_dict(data) for data in assignment_data_list]
+
+
+# return (median seconds of one parse, bytes kept by parsed objects)
+def measure(parse_func, data_list: list[dict], repeat: int) -> tuple[float, int]:
+    elapsed_list: list[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        start_time = time.perf_counter()
+        parse_func(data_list)
+        elapsed_list.append(time.perf_counter() - start_time)
+
+    gc.collect()
+    tracemalloc.start()
+    parsed = parse_func(data_list)
+    kept_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return statistics.median(elapsed_list), kept_bytes
+
+
+if __name__ == '__main__':
+
+    args = parse_args()
+    object_data_list, assignment_data_list = create_result_data(args.objects, args.seed)
+    print(f"Objects: {args.objects}, assignment entries: {len(assignment_data_list)}, repeat: {args.repeat}")
+
+    table_data: list[list] = []
+    for parse_name, parse_func, data_list in (
+        ("WwiseObject.from_dict", parse_objects_one_by_one, object_data_list),
+        ("WwiseObject.from_dict_list", WwiseObject.from_dict_list, object_data_list),
+        ("WwiseSwitchContainerAssignmentEntry.from_dict", parse_assignment_entries, assignment_data_list),
+    ):
+        elapsed, kept_bytes = measure(parse_func, data_list, args.repeat)
+        table_data.append([parse_name, elapsed * 1000, len(data_list) / elapsed, kept_bytes / 1024 / 1024,
+                           kept_bytes / len(data_list)])
+    print(tabulate(table_data, headers=["parse", "ms", "items/s", "kept MiB", "bytes/item"], floatfmt=".1f"))
@@ -0,0 +1,93 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# measure launch time of the script and the packaged exe, both only print help and exit
+# first run of every target is reported as cold launch, later runs as warm launches
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_EXE_PATH = os.path.join(ROOT_DIR, "SwitchAutoAssigner.exe" if sys.platform == "win32" else "SwitchAutoAssigner")
+DEFAULT_CLIENT_EXE_PATH = os.path.join(
+    ROOT_DIR, "SwitchAutoAssignerClient.exe" if sys.platform == "win32" else "SwitchAutoAssignerClient")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10, help="Launch count of every target.")
+    parser.add_argument("--exe", type=str, default=DEFAULT_EXE_PATH, help="Packaged exe path.")
+    parser.add_argument("--client_exe", type=str, default=DEFAULT_CLIENT_EXE_PATH, help="Packaged client exe path.")
+    parser.add_argument("--top", type=int, default=15, help="Count of slowest imports to print.")
+    return parser.parse_args()
+
+
+# return wall time of every launch in seconds
+def time_launches(command: list[str], runs: int) -> list[float]:
+    elapsed_list: list[float] = []
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        subprocess.run(command, cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        elapsed_list.append(time.perf_counter() - start_time)
+    return elapsed_list
+
+
+# -X importtime lines: "import time: self [us] | cumulative | imported package"
+def parse_import_time(stderr_text: str) -> list[tuple[str, int, int]]:
+    import_time_list: list[tuple[str, int, int]] = []
+    for line in stderr_text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        field_list = line[len("import time:"):].split("|")
+        if len(field_list) != 3 or not field_list[0].strip().isdigit():
+            continue
+        # package name is indented by nesting level after one separator space
+        import_time_list.append((field_list[2][1:].rstrip(), int(field_list[0]), int(field_list[1])))
+    return import_time_list
+
+
+def print_import_time(script_name: str, top: int):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", script_name, "--help"],
+        cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False
+    )
+    import_time_list = parse_import_time(result.stderr)
+
+    # top level imports sum up to the whole import time
+    total_us = sum(cumulative_us for name, _, cumulative_us in import_time_list if not name.startswith(" "))
+    print(f"\n{script_name} import time: {total_us / 1000:.1f} ms, slowest imports (cumulative ms):")
+    for name, self_us, cumulative_us in sorted(import_time_list, key=lambda x: x[2], reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:8.1f} {self_us / 1000:8.1f}  {name}")
+
+
+def print_launch_time(target_name: str, command: list[str], runs: int):
+    elapsed_list = time_launches(command, runs)
+    warm_list = elapsed_list[1:] if len(elapsed_list) > 1 else elapsed_list
+    print(f"{target_name:<16} cold {elapsed_list[0] * 1000:8.1f} ms   "
+          f"warm median {statistics.median(warm_list) * 1000:8.1f} ms   "
+          f"min {min(warm_list) * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+
+    args = parse_args()
+
+    print(f"Launch time of {args.runs} runs:")
+    target_list: list[tuple[str, list[str]]] = [
+        ("python", [sys.executable, "-c", "pass"]),
+        ("main.py", [sys.executable, "main.py", "--help"]),
+        ("client.py", [sys.executable, "client.py", "--help"]),
+    ]
+    for target_name, exe_path in (("exe", args.exe), ("client exe", args.client_exe)):
+        if os.path.exists(exe_path):
+            target_list.append((target_name, [exe_path, "--help"]))
+        else:
+            print(f"{target_name} not found: {exe_path}")
+
+    for target_name, command in target_list:
+        print_launch_time(target_name, command, args.runs)
+
+    # packaged exe ignores python env options, so import time is only measured with the script
+    print_import_time("main.py", args.top)
+    print_import_time("client.py", args.top)
@@ -0,0 +1,144 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from cores.server_protocol import DEFAULT_SERVER_PORT, send_message, read_messages, connect_server
+
+# thin client of the resident server, it only imports stdlib modules to start fast
+
+SERVER_EXECUTABLE_NAME = "SwitchAutoAssigner.exe"
+SERVER_START_TIMEOUT = 60.0
+SERVER_POLL_INTERVAL = 0.2
+
+# path args of main.py, the server may run in another working dir so relative paths are made absolute here
+PATH_ARG_LIST = ["--user_config", "--object_id_file", "--apply_plan", "--matrix_output_dir", "--cprofile"]
+# path args whose value may be left out, their default file name is resolved in the working dir of the server
+OPTIONAL_PATH_ARG_LIST = ["--dry_run", "--profile"]
+
+
+def parse_client_args(argv: list[str] | None = None) -> tuple[argparse.Namespace, list[str]]:
+    parser = argparse.ArgumentParser(
+        description="Send a job to the resident server, start the server if it is not running. "
+                    "Other args are passed to main.py.")
+    parser.add_argument("--server_port", type=int, default=DEFAULT_SERVER_PORT,
+                        help="Local port of the resident server.")
+    parser.add_argument("--stop_server", action="store_true",
+                        help="Stop the resident server.")
+    parser.add_argument("--batch", action="store_true",
+                        help="Run without waiting for any keyboard input.")
+    return parser.parse_known_args(argv)
+
+
+# support both "--arg value" and "--arg=value"
+def get_absolute_path_argv(job_argv: list[str]) -> list[str]:
+    absolute_argv: list[str] = []
+    arg_idx = 0
+    while arg_idx < len(job_argv):
+        arg = job_argv[arg_idx]
+        arg_name, equal_sign, arg_value = arg.partition("=")
+        if arg_name in PATH_ARG_LIST or arg_name in OPTIONAL_PATH_ARG_LIST:
+            if len(equal_sign) > 0:
+                absolute_argv.append(f"{arg_name}={os.path.abspath(arg_value)}")
+                arg_idx += 1
+                continue
+            absolute_argv.append(arg)
+            has_value = arg_idx + 1 < len(job_argv) and \
+                (arg_name in PATH_ARG_LIST or not job_argv[arg_idx + 1].startswith("-"))
+            if has_value:
+                absolute_argv.append(os.path.abspath(job_argv[arg_idx + 1]))
+                arg_idx += 1
+        else:
+            absolute_argv.append(arg)
+        arg_idx += 1
+    return absolute_argv
+
+
+def get_server_command(port: int) -> list[str]:
+    if getattr(sys, "frozen", False):
+        server_path = os.path.join(os.path.dirname(sys.executable), SERVER_EXECUTABLE_NAME)
+        return [server_path, "--serve", "--batch", "--server_port", str(port)]
+
+    main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    return [sys.executable, main_path, "--serve", "--batch", "--server_port", str(port)]
+
+
+def start_server(port: int):
+    kwargs = {}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = subprocess.CREATE_NEW_CONSOLE
+    else:
+        kwargs["start_new_session"] = True
+    subprocess.Popen(get_server_command(port), **kwargs)
+
+
+# connect to the running server, or start one and wait until it is listening
+def connect_or_start_server(port: int):
+    connection = connect_server(port)
+    if connection is not None:
+        return connection
+
+    print("Starting server...")
+    start_server(port)
+    start_time = time.time()
+    while time.time() - start_time < SERVER_START_TIMEOUT:
+        time.sleep(SERVER_POLL_INTERVAL)
+        connection = connect_server(port)
+        if connection is not None:
+            return connection
+    return None
+
+
+# empty answer if there is no console to read
+def read_input() -> str:
+    try:
+        return input()
+    except EOFError:
+        return ""
+
+
+def run_client(args: argparse.Namespace, job_argv: list[str]) -> int:
+    if args.stop_server:
+        connection = connect_server(args.server_port)
+        if connection is None:
+            print("Server is not running.")
+            return 0
+    else:
+        connection = connect_or_start_server(args.server_port)
+        if connection is None:
+            print("Cannot connect to server.")
+            return -1
+
+    with connection, connection.makefile("rwb") as stream:
+        if args.stop_server:
+            send_message(stream, {"command": "stop"})
+        else:
+            # jobs of a batch client are batch jobs, others ask this console
+            batch_argv = ["--batch"] if args.batch else []
+            send_message(stream, {"argv": get_absolute_path_argv(job_argv) + batch_argv})
+
+        for message in read_messages(stream):
+            if "log" in message:
+                print(message["log"])
+            if "input" in message:
+                send_message(stream, {"input": read_input()})
+            if "exit_code" in message:
+                return message["exit_code"]
+
+    print("Server closed the connection.")
+    return -1
+
+
+if __name__ == '__main__':
+
+    client_args, main_argv = parse_client_args()
+    try:
+        exit_code = run_client(client_args, main_argv)
+    except OSError as e:
+        print(f"Connection error: {e}")
+        exit_code = -1
+
+    if not client_args.batch:
+        input(f"Finished with exit code {exit_code}. Press any key to exit...")
+    sys.exit(exit_code)
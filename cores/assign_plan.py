@@ -0,0 +1,133 @@
+import csv
+import json
+import os
+
+from log import LOGGER
+from models.auto_assign_result import AutoAssignTask, AutoAssignTaskStatus
+from models.wwise_object import WwiseObject
+
+# plan files ending with this are csv, others are json lines
+PLAN_CSV_EXTENSION = ".csv"
+
+PLAN_FIELD_LIST = [
+    "container_id", "container_name",
+    "child_id", "child_name",
+    "expect_switch_id", "expect_switch_name", "score",
+    "current_switch_id", "current_switch_name",
+    "status",
+]
+
+
+# one child of a switch container in an assignment plan, made from an assign task of a dry run
+# status is the name of AutoAssignTaskStatus, Pending means the child would be assigned
+class AssignPlanEntry(object):
+
+    def __init__(self):
+        self.container_id: str = ""
+        self.container_name: str = ""
+        self.child_id: str = ""
+        self.child_name: str = ""
+        self.expect_switch_id: str = ""
+        self.expect_switch_name: str = ""
+        self.score: float | None = None
+        self.current_switch_id: str = ""
+        self.current_switch_name: str = ""
+        self.status: str = AutoAssignTaskStatus.Pending.name
+
+    @staticmethod
+    def from_assign_task(
+        switch_container_obj: WwiseObject,
+        assign_task: AutoAssignTask,
+        score: float | None,
+        current_switch_obj: WwiseObject | None
+    ) -> "AssignPlanEntry":
+        obj = AssignPlanEntry()
+        obj.container_id = switch_container_obj.id
+        obj.container_name = switch_container_obj.name
+        # task of a switch container without switch group has no child
+        if assign_task.wwise_object != switch_container_obj:
+            obj.child_id = assign_task.wwise_object.id
+            obj.child_name = assign_task.wwise_object.name
+        if assign_task.expect_switch_object is not None:
+            obj.expect_switch_id = assign_task.expect_switch_object.id
+            obj.expect_switch_name = assign_task.expect_switch_object.name
+        obj.score = score
+        if current_switch_obj is not None:
+            obj.current_switch_id = current_switch_obj.id
+            obj.current_switch_name = current_switch_obj.name
+        obj.status = assign_task.status.name
+        return obj
+
+    @staticmethod
+    def from_dict(data: dict) -> "AssignPlanEntry":
+        obj = AssignPlanEntry()
+        obj.container_id = data.get("container_id", "")
+        obj.container_name = data.get("container_name", "")
+        obj.child_id = data.get("child_id", "")
+        obj.child_name = data.get("child_name", "")
+        obj.expect_switch_id = data.get("expect_switch_id", "")
+        obj.expect_switch_name = data.get("expect_switch_name", "")
+        # csv gives every value as str
+        score = data.get("score", None)
+        obj.score = float(score) if score is not None and score != "" else None
+        obj.current_switch_id = data.get("current_switch_id", "")
+        obj.current_switch_name = data.get("current_switch_name", "")
+        obj.status = data.get("status", obj.status)
+        return obj
+
+    def to_dict(self) -> dict:
+        return {field_name: getattr(self, field_name) for field_name in PLAN_FIELD_LIST}
+
+    # only children with an expected switch are written by applying the plan
+    def need_apply(self) -> bool:
+        return len(self.child_id) > 0 and len(self.expect_switch_id) > 0
+
+
+# write plan entries one by one, so the plan of a whole project is never kept in memory
+class AssignPlanWriter(object):
+
+    def __init__(self, file_path: str):
+        self.file_path: str = file_path
+        self.entry_count: int = 0
+        self._file = None
+        self._csv_writer: csv.DictWriter | None = None
+
+    def open(self):
+        dir_path = os.path.dirname(self.file_path)
+        if len(dir_path) > 0:
+            os.makedirs(dir_path, exist_ok=True)
+        self._file = open(self.file_path, "w", newline="", encoding="utf-8")
+        if is_csv_plan(self.file_path):
+            self._csv_writer = csv.DictWriter(self._file, fieldnames=PLAN_FIELD_LIST)
+            self._csv_writer.writeheader()
+
+    def write(self, entry: AssignPlanEntry):
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(entry.to_dict())
+        else:
+            self._file.write(json.dumps(entry.to_dict(), ensure_ascii=False) + "\n")
+        self.entry_count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            LOGGER.info(f"Assignment plan of {self.entry_count} children saved to {self.file_path}.")
+
+    def __enter__(self) -> "AssignPlanWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def is_csv_plan(file_path: str) -> bool:
+    return file_path.lower().endswith(PLAN_CSV_EXTENSION)
+
+
+def read_assign_plan(file_path: str) -> list[AssignPlanEntry]:
+    with open(file_path, "r", newline="", encoding="utf-8") as f:
+        if is_csv_plan(file_path):
+            return [AssignPlanEntry.from_dict(row) for row in csv.DictReader(f)]
+        return [AssignPlanEntry.from_dict(json.loads(line)) for line in f if len(line.strip()) > 0]
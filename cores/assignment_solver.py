@@ -0,0 +1,47 @@
+from typing import Callable
+
+import numpy as np
+
+INVALID_INDEX = -1
+
+
+# score_array of solvers: index (switch_index, child_index), -inf if switch is not acceptable for child
+# solvers return best switch index of every child, INVALID_INDEX if no acceptable switch
+
+# every child gets its best switch, several children may share one switch
+def solve_many_to_one(score_array: np.ndarray) -> list[int]:
+    if score_array.shape[0] == 0:
+        return [INVALID_INDEX] * score_array.shape[1]
+    best_row_array = np.argmax(score_array, axis=0)
+    valid_array = np.isfinite(score_array.max(axis=0))
+    return np.where(valid_array, best_row_array, INVALID_INDEX).tolist()
+
+
+# every switch gets at most one child, maximize score sum with Jonker-Volgenant algorithm
+def solve_one_to_one(score_array: np.ndarray) -> list[int]:
+    best_row_list: list[int] = [INVALID_INDEX] * score_array.shape[1]
+    valid_mask = np.isfinite(score_array)
+    if not valid_mask.any():
+        return best_row_list
+
+    # replace not acceptable cells with a score lower than any valid assignment
+    valid_score_array = score_array[valid_mask]
+    score_range = valid_score_array.max() - valid_score_array.min() + 1
+    invalid_score = valid_score_array.min() - score_range * (min(score_array.shape) + 1)
+    cost_array = np.where(valid_mask, score_array, invalid_score)
+
+    # scipy is only imported by this solver
+    from scipy.optimize import linear_sum_assignment
+    row_array, col_array = linear_sum_assignment(cost_array, maximize=True)
+    for row, col in zip(row_array.tolist(), col_array.tolist()):
+        if valid_mask[row, col]:
+            best_row_list[col] = row
+    return best_row_list
+
+
+# solver name -> solver, "greedy" is the per-child loop of SwitchChildrenMatcher.get_best_match_row
+ASSIGNMENT_SOLVER: dict[str, Callable[[np.ndarray], list[int]]] = {
+    "argmax": solve_many_to_one,
+    "hungarian": solve_one_to_one,
+}
+GREEDY_ASSIGNMENT_SOLVER = "greedy"
@@ -1,46 +1,89 @@
+import csv
 from abc import abstractmethod
-from tabulate import tabulate
-import Levenshtein
+from typing import TYPE_CHECKING
 
-from cores.waapi import WaapiWampClient
-from cores.tfidf import SentenceIndex
+import numpy as np
+
+from cores.assignment_solver import ASSIGNMENT_SOLVER, GREEDY_ASSIGNMENT_SOLVER
+from cores.match_cache import MatchCache
+from cores.name_alias import NameAliasReplacer
+from cores.prefix_cut import ParentPrefixCutter
+from cores.switch_group_cache import SwitchGroupCache, SwitchGroupCacheEntry
+from cores.tokenizer import Tokenizer
 from models.auto_assign_result import AutoAssignTask, AutoAssignTaskStatus
 from models.config import UserConfig
-from models.wwise_object import WwiseObject
+from models.wwise_object import WwiseObject, WwiseSwitchContainerInfo
 from log import LOGGER
 
+# waapi client is not imported by scoring processes, which never call waapi
+if TYPE_CHECKING:
+    from cores.waapi import WaapiWampClient
+
 
 class SwitchChildrenMatcher:
 
     INVALID_INDEX = -1
 
+    # init value for min_match_score
+    MIN_MATCH_SCORE: any = None
+
+    # score of a child does not depend on other children,
+    # so new children can be scored alone and added to cached scores
+    COLUMN_INDEPENDENT_SCORE: bool = True
+
+    # cut words shared with the switch container name from children of special_switch_group_cut_words groups
+    CUT_PARENT_PREFIX: bool = False
+
     def __init__(
         self,
         switch_container_obj: WwiseObject,
         user_config: UserConfig,
-        waapi_client: WaapiWampClient
+        waapi_client: "WaapiWampClient | None",
+        switch_container_info: WwiseSwitchContainerInfo | None = None,
+        switch_group_cache: SwitchGroupCache | None = None,
+        name_alias_replacer: NameAliasReplacer | None = None,
+        tokenizer: Tokenizer | None = None,
+        prefix_cutter: ParentPrefixCutter | None = None
     ):
         self.switch_container_obj: WwiseObject = switch_container_obj
         self.user_config: UserConfig = user_config
-        self.waapi_client: WaapiWampClient = waapi_client
+        self.waapi_client: "WaapiWampClient | None" = waapi_client
+
+        # prefetched switch container info, queried by waapi if not given
+        self.switch_container_info: WwiseSwitchContainerInfo | None = switch_container_info
+
+        # switch group cache shared by matchers in one run, private cache if not given
+        self.switch_group_cache: SwitchGroupCache = \
+            switch_group_cache if switch_group_cache is not None else SwitchGroupCache()
+        self.switch_group_cache_entry: SwitchGroupCacheEntry | None = None
 
         # get switch container info
         self.switch_group_object: WwiseObject | None = None
         self.switch_object_list: list[WwiseObject] = []
         self.container_child_list: list[WwiseObject] = []
+        # id -> object, built once per query, kept for assigned children dropped from container_child_list
+        self.switch_object_id_dict: dict[str, WwiseObject] = {}
+        self.container_child_id_dict: dict[str, WwiseObject] = {}
         self.assigned_child_to_switch_dict: dict[WwiseObject, WwiseObject] = {}
         self.assigned_switch_to_child_dict: dict[WwiseObject, WwiseObject] = {}
 
-        # name replacement
+        # name replacement, compiled rules shared by matchers in one run, private rules if not given
+        self.name_alias_replacer: NameAliasReplacer = name_alias_replacer if name_alias_replacer is not None \
+            else NameAliasReplacer(user_config.object_name_replacement, user_config.object_name_regex_replacement)
         self.name_alias_dict: dict[WwiseObject, str] = {}
 
-        # words mapping
+        # words mapping, tokenizer and its cache are shared by matchers in one run, private tokenizer if not given
+        self.tokenizer: Tokenizer = tokenizer if tokenizer is not None else Tokenizer.from_dict(user_config.tokenizer)
         self.object_word_mapping: dict[WwiseObject, list[str]] = {}
 
+        # cut child words, shared by matchers in one run, private cutter if not given
+        self.prefix_cutter: ParentPrefixCutter = prefix_cutter if prefix_cutter is not None \
+            else ParentPrefixCutter(user_config.special_switch_group_cut_words)
+
         # matching matrix
         # index: (switch_index, child_index)
         self.match_score_matrix: list[list] = []
-        self.min_match_score: any = None
+        self.min_match_score: any = self.MIN_MATCH_SCORE
 
         # assign result
         self.assign_task_dict: dict[WwiseObject, AutoAssignTask] = {}
@@ -48,39 +91,48 @@ class SwitchChildrenMatcher:
     # get switch container info
     def query_switch_container(self):
         self.switch_group_object = None
+        self.switch_group_cache_entry = None
         self.switch_object_list.clear()
         self.container_child_list.clear()
+        self.switch_object_id_dict.clear()
+        self.container_child_id_dict.clear()
         self.assigned_child_to_switch_dict.clear()
+        self.assigned_switch_to_child_dict.clear()
+
+        if self.switch_container_info is None:
+            self.switch_container_info = self.waapi_client.get_switch_container_info_dict(
+                [self.switch_container_obj], self.switch_group_cache
+            )[self.switch_container_obj.id]
+        info = self.switch_container_info
 
         # get switch group
-        waql = f'from object "{self.switch_container_obj.id}" select @SwitchGroupOrStateGroup'
-        query_list = self.waapi_client.query_waql(waql)
-        if len(query_list) == 0:
+        if info.switch_group_object is None:
             LOGGER.error(f"Cannot get switch group for {self.switch_container_obj.name}.")
             assign_task = AutoAssignTask(self.switch_container_obj)
             assign_task.status = AutoAssignTaskStatus.SwitchGroupNotSet
             self.assign_task_dict[self.switch_container_obj] = assign_task
             return
-        self.switch_group_object: WwiseObject = query_list[0]
+        self.switch_group_object: WwiseObject = info.switch_group_object
 
-        # get switch objects in switch group
-        waql = f'from object "{self.switch_group_object.id}" select children'
-        self.switch_object_list.extend(self.waapi_client.query_waql(waql))
+        # get switch objects in switch group, shared with other containers by cache
+        self.switch_group_cache_entry = self.switch_group_cache.add(
+            self.switch_group_object, info.switch_object_list
+        )
+        self.switch_object_list.extend(self.switch_group_cache_entry.switch_object_list)
+        self.switch_object_id_dict.update((switch_obj.id, switch_obj) for switch_obj in self.switch_object_list)
 
         # get children of switch container
-        waql = f'from object "{self.switch_container_obj.id}" select children'
-        self.container_child_list.extend(self.waapi_client.query_waql(waql))
+        self.container_child_list.extend(info.container_child_list)
+        self.container_child_id_dict.update((child_obj.id, child_obj) for child_obj in self.container_child_list)
 
         # get already assigned info
-        already_assigned_list = self.waapi_client.get_switch_container_assignments(
-            self.switch_container_obj.id
-        )
+        already_assigned_list = info.assignment_list
         for assigned_entry in already_assigned_list:
-            switch_object = next((obj for obj in self.switch_object_list if obj.id == assigned_entry.state_or_switch), None)
+            switch_object = self.switch_object_id_dict.get(assigned_entry.state_or_switch, None)
             if switch_object is None:
                 LOGGER.error(f"Cannot find assigned switch object {assigned_entry.state_or_switch}.")
                 continue
-            child_object = next((obj for obj in self.container_child_list if obj.id == assigned_entry.child), None)
+            child_object = self.container_child_id_dict.get(assigned_entry.child, None)
             if child_object is None:
                 LOGGER.error(f"Cannot find assigned child object {assigned_entry.child}.")
                 continue
@@ -88,16 +140,38 @@ class SwitchChildrenMatcher:
             self.assigned_child_to_switch_dict[child_object] = switch_object
             self.assigned_switch_to_child_dict[switch_object] = child_object
 
+    # remove already assigned children, so only unassigned children are scored and assigned
+    def drop_assigned_children(self):
+        unassigned_child_list = [
+            child_obj for child_obj in self.container_child_list
+            if child_obj not in self.assigned_child_to_switch_dict
+        ]
+        LOGGER.debug(f"Skip {len(self.container_child_list) - len(unassigned_child_list)} "
+                     f"already assigned children of {self.switch_container_obj.name}.")
+        self.container_child_list.clear()
+        self.container_child_list.extend(unassigned_child_list)
+
     # fulfill name_alias_dict with name replacement config
+    # alias of switches is computed once per switch group
     def apply_name_alias(self):
         self.name_alias_dict.clear()
-        for wwise_object in self.switch_object_list + self.container_child_list:
-            alias_name = wwise_object.name
-            for old_str, new_str in self.user_config.object_name_replacement.items():
-                if old_str in alias_name:
-                    LOGGER.debug(f"Replace {old_str} to {new_str} in {alias_name}.")
-                    alias_name = alias_name.replace(old_str, new_str)
-            self.name_alias_dict[wwise_object] = alias_name
+        cache_entry = self.switch_group_cache_entry
+        if cache_entry is not None:
+            if not cache_entry.name_alias_applied:
+                for switch_obj in cache_entry.switch_object_list:
+                    cache_entry.name_alias_dict[switch_obj] = self.get_alias_name(switch_obj.name)
+                cache_entry.name_alias_applied = True
+            self.name_alias_dict.update(cache_entry.name_alias_dict)
+        else:
+            for switch_obj in self.switch_object_list:
+                self.name_alias_dict[switch_obj] = self.get_alias_name(switch_obj.name)
+
+        for child_obj in self.container_child_list:
+            self.name_alias_dict[child_obj] = self.get_alias_name(child_obj.name)
+
+    # replace name with name replacement config
+    def get_alias_name(self, name: str) -> str:
+        return self.name_alias_replacer.get_alias_name(name)
 
     # get display name like "object_name(alias_name)" if alias_name is different from object_name
     def get_display_name(self, obj: WwiseObject) -> str:
@@ -107,32 +181,142 @@ class SwitchChildrenMatcher:
         return f"{obj.name}({alias_name})"
 
     # create mapping of WwiseObject -> word list
+    # words of switches are split once per switch group
     def create_object_word_mapping(self):
         self.object_word_mapping.clear()
-        for wwise_object in self.switch_object_list + self.container_child_list:
-            alias_name = self.name_alias_dict.get(wwise_object, wwise_object.name)
-            self.object_word_mapping[wwise_object] = alias_name.lower().split("_")
+        cache_entry = self.switch_group_cache_entry
+        if cache_entry is not None:
+            if not cache_entry.word_mapping_created:
+                for switch_obj in cache_entry.switch_object_list:
+                    cache_entry.object_word_mapping[switch_obj] = self.get_word_list(switch_obj)
+                cache_entry.word_mapping_created = True
+            self.object_word_mapping.update(cache_entry.object_word_mapping)
+        else:
+            for switch_obj in self.switch_object_list:
+                self.object_word_mapping[switch_obj] = self.get_word_list(switch_obj)
+
+        for child_obj in self.container_child_list:
+            self.object_word_mapping[child_obj] = self.get_word_list(child_obj)
+
+    # cut words of the switch container name from the start of child words, after create_object_word_mapping
+    def cut_parent_name_prefix(self):
+        if not self.CUT_PARENT_PREFIX or self.switch_group_object is None:
+            return
+        if not self.prefix_cutter.need_cut(self.switch_group_object.name):
+            return
+
+        parent_word_tuple = self.tokenizer.get_word_tuple(self.get_alias_name(self.switch_container_obj.name))
+        for child_obj in self.container_child_list:
+            self.object_word_mapping[child_obj] = self.prefix_cutter.get_cut_word_list(
+                parent_word_tuple, self.object_word_mapping.get(child_obj, [])
+            )
+
+    # split alias name of object into words
+    def get_word_list(self, wwise_object: WwiseObject) -> list[str]:
+        alias_name = self.name_alias_dict.get(wwise_object, wwise_object.name)
+        return list(self.tokenizer.get_word_tuple(alias_name))
+
+    # interned token ids of alias name of object
+    def get_token_id_array(self, wwise_object: WwiseObject) -> np.ndarray:
+        alias_name = self.name_alias_dict.get(wwise_object, wwise_object.name)
+        return self.tokenizer.get_token_id_array(alias_name)
 
     # calculate match score matrix
-    @abstractmethod
     def cal_match_score_matrix(self):
+        self.match_score_matrix = self.cal_score_matrix(self.container_child_list)
+
+    # calculate match score matrix of switches and given children
+    # return: matrix, index: (switch_index, index in child_list)
+    @abstractmethod
+    def cal_score_matrix(self, child_list: list[WwiseObject]) -> list[list]:
         pass
 
-    # get matching matrix text to display
-    def get_matching_matrix_text(self) -> str:
-        table_data: list[list] = [
-            [self.switch_object_list[switch_idx].name] + self.match_score_matrix[switch_idx]
+    # calculate match score matrix, only children not in match cache are scored
+    def cal_match_score_matrix_with_cache(self, match_cache: MatchCache):
+        self.cal_match_score_matrix_with_column_dict(self.get_match_cache_column_dict(match_cache))
+
+    # cached columns of this container scored by this matcher class, after query_switch_container
+    def get_match_cache_column_dict(self, match_cache: MatchCache) -> dict[str, list]:
+        # every child of the container, also children dropped by drop_assigned_children
+        child_list = self.switch_container_info.container_child_list if self.switch_container_info is not None \
+            else self.container_child_list
+        return match_cache.get_column_dict(
+            self.switch_container_obj.id, type(self).__name__, self.get_match_fingerprint(),
+            [child_obj.name for child_obj in child_list]
+        )
+
+    # column_dict: child name -> score of every switch, cached columns of this container, filled with new columns
+    def cal_match_score_matrix_with_column_dict(self, column_dict: dict[str, list]):
+        # score new or renamed children, or every child if scores depend on all children
+        scored_child_list = [child_obj for child_obj in self.container_child_list
+                             if child_obj.name not in column_dict]
+        if len(scored_child_list) > 0:
+            if not self.COLUMN_INDEPENDENT_SCORE:
+                scored_child_list = self.container_child_list
+            scored_matrix = self.cal_score_matrix(scored_child_list)
+            for child_idx, child_obj in enumerate(scored_child_list):
+                column_dict[child_obj.name] = [row_score_list[child_idx] for row_score_list in scored_matrix]
+        LOGGER.debug(f"Scored {len(scored_child_list)} of {len(self.container_child_list)} children "
+                      f"of {self.switch_container_obj.name}, others are got from match cache.")
+
+        self.match_score_matrix = [
+            [column_dict[child_obj.name][switch_idx] for child_obj in self.container_child_list]
             for switch_idx in range(len(self.switch_object_list))
         ]
-        return tabulate(
-            table_data,
-            headers=[""] + [
-                child.name for child in self.container_child_list
-            ]
-        )
+
+    # everything affecting scores of a container, scores are reused only if this is unchanged
+    def get_match_fingerprint(self) -> str:
+        fingerprint_data: list = [
+            type(self).__name__,
+            self.user_config.object_name_replacement,
+            self.user_config.object_name_regex_replacement,
+            self.user_config.tokenizer,
+            [switch_obj.name for switch_obj in self.switch_object_list],
+        ]
+        if self.CUT_PARENT_PREFIX:
+            # cut words come from the container name, and are only cut for groups named in the config
+            fingerprint_data.append(self.user_config.special_switch_group_cut_words)
+            fingerprint_data.append(self.switch_container_obj.name)
+            fingerprint_data.append(self.switch_group_object.name if self.switch_group_object is not None else "")
+        if not self.COLUMN_INDEPENDENT_SCORE:
+            fingerprint_data.append(sorted(child_obj.name for child_obj in self.container_child_list))
+        return MatchCache.get_fingerprint(fingerprint_data)
+
+    # get text of the best top_k switches of every child, much shorter than the full matrix
+    def get_top_match_text(self, top_k: int) -> str:
+        # only imported when matches are printed
+        from tabulate import tabulate
+
+        score_array = self.get_solver_score_array()
+        top_k = min(top_k, len(self.switch_object_list))
+        table_data: list[list] = []
+        for child_idx, child_obj in enumerate(self.container_child_list):
+            row_data: list = [child_obj.name]
+            for switch_idx in np.argsort(-score_array[:, child_idx], kind="stable")[:top_k]:
+                if not np.isfinite(score_array[switch_idx, child_idx]):
+                    break
+                row_data.append(f"{self.switch_object_list[switch_idx].name} "
+                                f"({self.match_score_matrix[switch_idx][child_idx]})")
+            table_data.append(row_data)
+        return tabulate(table_data, headers=["child"] + [f"top {idx + 1}" for idx in range(top_k)])
+
+    # write the full matching matrix row by row, without building the whole text in memory
+    def write_matching_matrix_csv(self, file_path: str):
+        with open(file_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow([""] + [child_obj.name for child_obj in self.container_child_list])
+            for switch_obj, row_score_list in zip(self.switch_object_list, self.match_score_matrix):
+                writer.writerow([switch_obj.name] + row_score_list)
 
     # assign child to best match switch
-    def prepare_assign_task(self):
+    # best_match_row_list is solved from match_score_matrix if not given, e.g. by a scoring process
+    def prepare_assign_task(
+        self,
+        assignment_solver: str = GREEDY_ASSIGNMENT_SOLVER,
+        best_match_row_list: list[int] | None = None
+    ):
+        if best_match_row_list is None:
+            best_match_row_list = self.get_best_match_row_list(assignment_solver)
         for child_idx, child_obj in enumerate(self.container_child_list):
 
             # skip or overwrite child with assign result
@@ -145,7 +329,7 @@ class SwitchChildrenMatcher:
             self.assign_task_dict[child_obj] = assign_task
 
             # get best match switch index
-            best_match_switch_idx = self.get_best_match_row(child_idx)
+            best_match_switch_idx = best_match_row_list[child_idx]
             if best_match_switch_idx == self.INVALID_INDEX:
                 # no match switch found
                 LOGGER.error(f"Cannot find match switch for child {child_obj.name}.")
@@ -153,6 +337,52 @@ class SwitchChildrenMatcher:
                 continue
             assign_task.expect_switch_object = self.switch_object_list[best_match_switch_idx]
 
+    # add assign task of a child to a switch chosen before, e.g. by a reviewed assignment plan
+    # objects are looked up in current info of switch container, so removed or moved objects are skipped
+    def add_planned_assign_task(self, child_id: str, expect_switch_id: str) -> bool:
+        child_obj = self.container_child_id_dict.get(child_id, None)
+        if child_obj is None:
+            LOGGER.error(f"Cannot find planned child {child_id} in {self.switch_container_obj.name}.")
+            return False
+        expect_switch_obj = self.switch_object_id_dict.get(expect_switch_id, None)
+        if expect_switch_obj is None:
+            LOGGER.error(f"Cannot find planned switch {expect_switch_id} for child {child_obj.name}.")
+            return False
+
+        assign_task = AutoAssignTask(child_obj)
+        assign_task.expect_switch_object = expect_switch_obj
+        self.assign_task_dict[child_obj] = assign_task
+        return True
+
+    # child -> solver score of its expected switch
+    def get_expect_switch_score_dict(self) -> dict[WwiseObject, float]:
+        score_array = self.get_solver_score_array()
+        switch_idx_dict = {switch_obj: switch_idx for switch_idx, switch_obj in enumerate(self.switch_object_list)}
+        expect_switch_score_dict: dict[WwiseObject, float] = {}
+        for child_idx, child_obj in enumerate(self.container_child_list):
+            assign_task = self.assign_task_dict.get(child_obj, None)
+            if assign_task is None or assign_task.expect_switch_object is None:
+                continue
+            switch_idx = switch_idx_dict[assign_task.expect_switch_object]
+            expect_switch_score_dict[child_obj] = float(score_array[switch_idx, child_idx])
+        return expect_switch_score_dict
+
+    # get best match row index of every column with assignment solver
+    def get_best_match_row_list(self, assignment_solver: str = GREEDY_ASSIGNMENT_SOLVER) -> list[int]:
+        solver = ASSIGNMENT_SOLVER.get(assignment_solver, None)
+        if solver is None:
+            return [self.get_best_match_row(col_idx) for col_idx in range(len(self.container_child_list))]
+        return solver(self.get_solver_score_array())
+
+    # numeric score matrix for assignment solver, -inf for score not higher than min_match_score
+    def get_solver_score_array(self) -> np.ndarray:
+        score_array = np.array(self.match_score_matrix, dtype=np.float64).reshape(
+            len(self.switch_object_list), len(self.container_child_list)
+        )
+        if self.min_match_score is not None:
+            score_array[score_array <= self.min_match_score] = -np.inf
+        return score_array
+
     # get the highest score row index of the matrix
     def get_best_match_row(self, col_idx: int) -> int:
         min_value = self.min_match_score
@@ -165,16 +395,17 @@ class SwitchChildrenMatcher:
 
         return best_match_idx
 
-    # assign child to switch
-    def run_assign_task(
+    # check assign task before writing by waapi
+    # return: (need to write by waapi, success)
+    def check_assign_task(
         self,
         assign_task: AutoAssignTask,
         overwrite_unexpect: bool = False
-    ) -> bool:
+    ) -> tuple[bool, bool]:
         if assign_task.status != AutoAssignTaskStatus.Pending:
             if not overwrite_unexpect or assign_task.status != AutoAssignTaskStatus.AlreadyAssignedUnexpect:
                 # already done task
-                return True
+                return False, True
 
         child_obj: WwiseObject = assign_task.wwise_object
         expect_switch_obj: WwiseObject = assign_task.expect_switch_object
@@ -188,7 +419,7 @@ class SwitchChildrenMatcher:
                     assign_task.status = AutoAssignTaskStatus.AlreadyAssignedExpected
                     LOGGER.debug(f"Child {child_obj.name} already assigned to "
                                  f"expected switch {self.get_display_name(expect_switch_obj)}.")
-                    return True
+                    return False, True
                 else:
                     # already assigned to unexpect switch
                     assign_task.status = AutoAssignTaskStatus.AlreadyAssignedUnexpect
@@ -197,30 +428,38 @@ class SwitchChildrenMatcher:
                         LOGGER.error(f"Child {child_obj.name} already assigned to "
                                      f"unexpect switch {self.get_display_name(assigned_switch_obj)}. "
                                      f"Expect switch {self.get_display_name(expect_switch_obj)}.")
-                        return False
+                        return False, False
 
-        # remove unexpect switch assignment if overwrite_unexpect is True
-        if overwrite_unexpect and assign_task.status == AutoAssignTaskStatus.AlreadyAssignedUnexpect:
-            unexpect_switch_obj = assign_task.unexpect_switch_object
-            result = self.waapi_client.remove_switch_container_assignment(
-                child_obj.id, unexpect_switch_obj.id
+        return True, True
+
+    # unexpect switch assignment is removed before assigning if overwrite_unexpect is True
+    @staticmethod
+    def need_remove_unexpect(assign_task: AutoAssignTask, overwrite_unexpect: bool) -> bool:
+        return overwrite_unexpect and assign_task.status == AutoAssignTaskStatus.AlreadyAssignedUnexpect
+
+    # apply waapi result of removing unexpect switch assignment
+    def on_remove_assignment_result(self, assign_task: AutoAssignTask, result: bool) -> bool:
+        child_obj: WwiseObject = assign_task.wwise_object
+        unexpect_switch_obj: WwiseObject = assign_task.unexpect_switch_object
+        if result:
+            LOGGER.debug(
+                f"Removed assignment for switch {self.get_display_name(unexpect_switch_obj)} "
+                f"with child {self.get_display_name(child_obj)}."
             )
-            if result:
-                LOGGER.debug(
-                    f"Removed assignment for switch {self.get_display_name(unexpect_switch_obj)} "
-                    f"with child {self.get_display_name(child_obj)}."
-                )
-                self.assigned_child_to_switch_dict.pop(child_obj)
-                self.assigned_switch_to_child_dict.pop(unexpect_switch_obj)
-            else:
-                LOGGER.error(
-                    f"Failed to remove assignment "
-                    f"for switch {self.get_display_name(unexpect_switch_obj)} "
-                    f"with child {self.get_display_name(child_obj)}.")
-                return False
+            self.assigned_child_to_switch_dict.pop(child_obj)
+            self.assigned_switch_to_child_dict.pop(unexpect_switch_obj)
+            return True
 
-        # assign child to switch
-        result = self.waapi_client.set_switch_container_assignment(child_obj.id, expect_switch_obj.id)
+        LOGGER.error(
+            f"Failed to remove assignment "
+            f"for switch {self.get_display_name(unexpect_switch_obj)} "
+            f"with child {self.get_display_name(child_obj)}.")
+        return False
+
+    # apply waapi result of assigning child to switch
+    def on_add_assignment_result(self, assign_task: AutoAssignTask, result: bool) -> bool:
+        child_obj: WwiseObject = assign_task.wwise_object
+        expect_switch_obj: WwiseObject = assign_task.expect_switch_object
         if result:
             self.assigned_child_to_switch_dict[child_obj] = expect_switch_obj
             self.assigned_switch_to_child_dict[expect_switch_obj] = child_obj
@@ -239,110 +478,135 @@ class SwitchChildrenMatcher:
         )
         return False
 
+    # assign child to switch
+    def run_assign_task(
+        self,
+        assign_task: AutoAssignTask,
+        overwrite_unexpect: bool = False
+    ) -> bool:
+        need_write, success = self.check_assign_task(assign_task, overwrite_unexpect)
+        if not need_write:
+            return success
+
+        child_obj: WwiseObject = assign_task.wwise_object
+
+        # remove unexpect switch assignment if overwrite_unexpect is True
+        if self.need_remove_unexpect(assign_task, overwrite_unexpect):
+            result = self.waapi_client.remove_switch_container_assignment(
+                child_obj.id, assign_task.unexpect_switch_object.id
+            )
+            if not self.on_remove_assignment_result(assign_task, result):
+                return False
+
+        # assign child to switch
+        result = self.waapi_client.set_switch_container_assignment(
+            child_obj.id, assign_task.expect_switch_object.id
+        )
+        return self.on_add_assignment_result(assign_task, result)
+
     # run all assign tasks
+    # independent waapi calls of all tasks are sent together, removing before assigning
     def run_all_assign_tasks(self, overwrite_unexpect: bool = False) -> bool:
         success = True
+        write_task_list: list[AutoAssignTask] = []
         for assign_task in self.assign_task_dict.values():
-            if not self.run_assign_task(assign_task, overwrite_unexpect):
+            need_write, task_success = self.check_assign_task(assign_task, overwrite_unexpect)
+            if not task_success:
                 success = False
-        return success
-
-
-class SwitchChildrenTfidfMatcher(SwitchChildrenMatcher):
-
-    # calculate match score matrix
-    def cal_match_score_matrix(self):
-
-        # create tf-idf index for switch names
-        switch_name_sentence_index = SentenceIndex()
-        for switch_obj in self.switch_object_list:
-            word_list: list[str] = self.object_word_mapping.get(switch_obj, [])
-            switch_name_sentence_index.add_sentence(switch_obj, word_list)
-        switch_name_sentence_index.generate_index()
+            if need_write:
+                write_task_list.append(assign_task)
 
-        # create tf-idf index for child names
-        child_name_sentence_index = SentenceIndex()
-        for child_obj in self.container_child_list:
-            word_list: list[str] = self.object_word_mapping.get(child_obj, [])
-            child_name_sentence_index.add_sentence(child_obj, word_list)
-        child_name_sentence_index.generate_index()
-
-        # calculate match score matrix
-        self.match_score_matrix: list[list[float]] = [
-            [
-                switch_name_sentence_index.get_similarity(
-                    self.object_word_mapping.get(child_obj, []),
-                    switch_obj
-                ) + child_name_sentence_index.get_similarity(
-                    self.object_word_mapping.get(switch_obj, []),
-                    child_obj
-                )
-                for child_obj in self.container_child_list
-            ]
-            for switch_obj in self.switch_object_list
+        # remove unexpect switch assignments
+        remove_task_list = [
+            assign_task for assign_task in write_task_list
+            if self.need_remove_unexpect(assign_task, overwrite_unexpect)
         ]
+        remove_result_list = self.waapi_client.remove_switch_container_assignment_list([
+            (assign_task.wwise_object.id, assign_task.unexpect_switch_object.id)
+            for assign_task in remove_task_list
+        ])
+        remove_failed_task_set: set[AutoAssignTask] = set()
+        for assign_task, result in zip(remove_task_list, remove_result_list):
+            if not self.on_remove_assignment_result(assign_task, result):
+                remove_failed_task_set.add(assign_task)
+                success = False
 
-        # set init value for min_match_score
-        self.min_match_score = 1e-6
-
-
-class SwitchChildrenLevenshteinMatcher(SwitchChildrenMatcher):
-
-    # word mapping is not needed for Levenshtein matcher
-    def create_object_word_mapping(self):
-        pass
-
-    # calculate match score matrix
-    def cal_match_score_matrix(self):
-        self.match_score_matrix: list[list[int]] = [
-            [
-                # use negative value to make lower distance score higher
-                - self.cal_levenshtein_distance(
-                    switch_obj.name,
-                    child_obj.name
-                )
-                for child_obj in self.container_child_list
-            ]
-            for switch_obj in self.switch_object_list
+        # assign children to switches
+        add_task_list = [
+            assign_task for assign_task in write_task_list
+            if assign_task not in remove_failed_task_set
         ]
+        add_result_list = self.waapi_client.set_switch_container_assignment_list([
+            (assign_task.wwise_object.id, assign_task.expect_switch_object.id)
+            for assign_task in add_task_list
+        ])
+        for assign_task, result in zip(add_task_list, add_result_list):
+            if not self.on_add_assignment_result(assign_task, result):
+                success = False
 
-        # set init value for min_match_score
-        self.min_match_score = -1e9
-
-    @staticmethod
-    def cal_levenshtein_distance(name_a: str, name_b: str) -> int:
-        name_a = name_a.lower()
-        name_b = name_b.lower()
-        return Levenshtein.distance(name_a, name_b)
+        return success
 
 
 # match every child of switch container to one switch
 # words in child object name should contain every word in switch name
 class SwitchChildrenInclusionMatcher(SwitchChildrenMatcher):
 
-    def cal_match_score_matrix(self):
+    def cal_score_matrix(self, child_list: list[WwiseObject]) -> list[list[tuple[float, int]]]:
+        switch_token_index, switch_token_count_list = self.get_switch_token_index()
+
+        # count shared words of every switch and child with the inverted index,
+        # so only pairs sharing words are visited, pairs without shared words keep intersection 0
+        row_list: list[int] = []
+        col_list: list[int] = []
+        for child_idx, child_obj in enumerate(child_list):
+            for token_id in set(self.get_token_id_array(child_obj).tolist()):
+                switch_idx_list = switch_token_index.get(token_id, None)
+                if switch_idx_list is not None:
+                    row_list.extend(switch_idx_list)
+                    col_list.extend([child_idx] * len(switch_idx_list))
+        intersection_array = np.bincount(
+            np.array(row_list, dtype=np.int64) * len(child_list) + np.array(col_list, dtype=np.int64),
+            minlength=len(self.switch_object_list) * len(child_list)
+        ).reshape(len(self.switch_object_list), len(child_list))
+
         # inclusion matrix element: (intersection size / switch word count, switch word count)
         # index: (switch_index, child_index)
-        self.match_score_matrix: list[list[tuple[float, int]]] = [
-            [
-                self.calculate_inclusion_rate(
-                    self.object_word_mapping[switch_obj],
-                    self.object_word_mapping[child_obj]
-                )
-                for child_obj in self.container_child_list
-            ]
-            for switch_obj in self.switch_object_list
+        switch_token_count_array = np.array(switch_token_count_list, dtype=np.float64)
+        rate_array = np.zeros(intersection_array.shape, dtype=np.float64)
+        np.divide(intersection_array, switch_token_count_array[:, None], out=rate_array,
+                  where=switch_token_count_array[:, None] > 0)
+        return [
+            [(rate, switch_token_count) for rate in row_rate_list]
+            for row_rate_list, switch_token_count in zip(rate_array.tolist(), switch_token_count_list)
         ]
 
-    @staticmethod
-    def calculate_inclusion_rate(
-        subset_list: list[str],
-        superset_list: list[str],
-    ) -> tuple[float, int]:
-        subset_set = set(subset_list)
-        superset_set = set(superset_list)
-        intersection_set = subset_set & superset_set
-        return len(intersection_set) / len(subset_set), len(subset_set)
+    # token id -> indexes of switches with the token, and token count of every switch, once per switch group
+    def get_switch_token_index(self) -> tuple[dict[int, list[int]], list[int]]:
+        cache_entry = self.switch_group_cache_entry
+        if cache_entry is not None and cache_entry.switch_token_index is not None:
+            return cache_entry.switch_token_index, cache_entry.switch_token_count_list
+
+        switch_token_index: dict[int, list[int]] = {}
+        switch_token_count_list: list[int] = []
+        for switch_idx, switch_obj in enumerate(self.switch_object_list):
+            token_id_set = set(self.get_token_id_array(switch_obj).tolist())
+            for token_id in token_id_set:
+                switch_token_index.setdefault(token_id, []).append(switch_idx)
+            switch_token_count_list.append(len(token_id_set))
+
+        if cache_entry is not None:
+            cache_entry.switch_token_index = switch_token_index
+            cache_entry.switch_token_count_list = switch_token_count_list
+        return switch_token_index, switch_token_count_list
+
+    # only accept switch with 100% inclusion rate, score is switch word count
+    def get_solver_score_array(self) -> np.ndarray:
+        score_array = np.full((len(self.switch_object_list), len(self.container_child_list)), -np.inf)
+        for row_idx, row_score_list in enumerate(self.match_score_matrix):
+            for col_idx, (inclusion_rate, switch_word_count) in enumerate(row_score_list):
+                if inclusion_rate >= 1 - 1e-6:
+                    score_array[row_idx, col_idx] = switch_word_count
+        return score_array
 
     # only accept switch with 100% inclusion rate and max word count
     def get_best_match_row(self, col_idx: int) -> int:
@@ -0,0 +1,86 @@
+import os
+import json
+import hashlib
+
+from log import LOGGER
+
+
+# score matrix columns of every switch container and match method, saved between runs
+class MatchCache(object):
+
+    def __init__(self):
+        # (switch container id, match method) -> (fingerprint, child name -> score of every switch)
+        self.container_dict: dict[tuple[str, str], tuple[str, dict[str, list]]] = {}
+
+        # (switch container id, match method) -> names of its children, set for containers handled since loading
+        # columns of other children are dropped when saving
+        self.child_name_set_dict: dict[tuple[str, str], set[str]] = {}
+
+    @staticmethod
+    def get_fingerprint(fingerprint_data: list) -> str:
+        data_str = json.dumps(fingerprint_data, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha1(data_str.encode("utf-8")).hexdigest()
+
+    # get child name -> score column dict of a container scored by a match method
+    # cached columns are dropped if fingerprint changed, returned dict is filled by caller
+    # child_name_list: names of every child of the container, assigned or not
+    def get_column_dict(
+        self,
+        switch_container_id: str,
+        match_method: str,
+        fingerprint: str,
+        child_name_list: list[str]
+    ) -> dict[str, list]:
+        cache_key = (switch_container_id, match_method)
+        cached_fingerprint, column_dict = self.container_dict.get(cache_key, ("", {}))
+        if cached_fingerprint != fingerprint:
+            column_dict = {}
+            self.container_dict[cache_key] = (fingerprint, column_dict)
+        self.child_name_set_dict[cache_key] = set(child_name_list)
+        return column_dict
+
+    def load(self, file_path: str):
+        if not os.path.exists(file_path):
+            LOGGER.debug(f"Match cache not found at {file_path}.")
+            return
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            LOGGER.warning(f"Cannot load match cache from {file_path}: {e}")
+            return
+
+        # switch container id -> match method -> fingerprint and columns
+        for switch_container_id, method_data_dict in data.items():
+            if not isinstance(method_data_dict, dict) or "fingerprint" in method_data_dict:
+                # cache of a former version without match method, scored again
+                continue
+            for match_method, container_data in method_data_dict.items():
+                self.container_dict[(switch_container_id, match_method)] = (
+                    container_data.get("fingerprint", ""),
+                    container_data.get("columns", {})
+                )
+        LOGGER.debug(f"Match cache loaded from {file_path}.")
+
+    def save(self, file_path: str):
+        dir_path = os.path.dirname(file_path)
+        if len(dir_path) > 0:
+            os.makedirs(dir_path, exist_ok=True)
+
+        data: dict[str, dict[str, dict]] = {}
+        for cache_key, (fingerprint, column_dict) in self.container_dict.items():
+            # drop columns of deleted or renamed children
+            child_name_set = self.child_name_set_dict.get(cache_key, None)
+            if child_name_set is not None:
+                for child_name in [child_name for child_name in column_dict if child_name not in child_name_set]:
+                    column_dict.pop(child_name)
+            switch_container_id, match_method = cache_key
+            data.setdefault(switch_container_id, {})[match_method] = {
+                "fingerprint": fingerprint,
+                "columns": column_dict
+            }
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+        LOGGER.debug(f"Match cache saved to {file_path}.")
@@ -0,0 +1,75 @@
+from typing import Callable
+
+import numpy as np
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Levenshtein as RapidfuzzLevenshtein
+
+from cores.match import SwitchChildrenMatcher
+from models.wwise_object import WwiseObject
+
+
+class SwitchChildrenLevenshteinMatcher(SwitchChildrenMatcher):
+
+    # rapidfuzz scorer of two names
+    SCORER: Callable = staticmethod(RapidfuzzLevenshtein.distance)
+    SCORE_DTYPE: type = np.int32
+
+    # distance is negated to make lower distance score higher
+    NEGATE_SCORE: bool = True
+
+    # init value for min_match_score
+    MIN_MATCH_SCORE: float = -1e9
+
+    # word mapping is not needed for Levenshtein matcher
+    def create_object_word_mapping(self):
+        pass
+
+    # name passed to scorer
+    @staticmethod
+    def get_score_name(obj: WwiseObject) -> str:
+        return obj.name.lower()
+
+    # calculate match score matrix with one batched call on all cores
+    def cal_score_matrix(self, child_list: list[WwiseObject]) -> list[list]:
+        score_array = process.cdist(
+            [self.get_score_name(switch_obj) for switch_obj in self.switch_object_list],
+            [self.get_score_name(child_obj) for child_obj in child_list],
+            scorer=self.SCORER,
+            dtype=self.SCORE_DTYPE,
+            workers=-1
+        )
+        if self.NEGATE_SCORE:
+            score_array = -score_array
+        return score_array.tolist()
+
+
+# levenshtein similarity normalized by name length, in [0, 1]
+class SwitchChildrenNormalizedLevenshteinMatcher(SwitchChildrenLevenshteinMatcher):
+
+    SCORER: Callable = staticmethod(RapidfuzzLevenshtein.normalized_similarity)
+    SCORE_DTYPE: type = np.float32
+    NEGATE_SCORE: bool = False
+    MIN_MATCH_SCORE: float = 0
+
+
+# similarity of names with words sorted, in [0, 100]
+class SwitchChildrenTokenSortMatcher(SwitchChildrenLevenshteinMatcher):
+
+    SCORER: Callable = staticmethod(fuzz.token_sort_ratio)
+    SCORE_DTYPE: type = np.float32
+    NEGATE_SCORE: bool = False
+    MIN_MATCH_SCORE: float = 0
+
+    # rapidfuzz splits words by whitespace
+    @staticmethod
+    def get_score_name(obj: WwiseObject) -> str:
+        return obj.name.lower().replace("_", " ")
+
+
+# similarity of the shorter name and best matching part of the longer name, in [0, 100]
+class SwitchChildrenPartialRatioMatcher(SwitchChildrenLevenshteinMatcher):
+
+    SCORER: Callable = staticmethod(fuzz.partial_ratio)
+    SCORE_DTYPE: type = np.float32
+    NEGATE_SCORE: bool = False
+    MIN_MATCH_SCORE: float = 0
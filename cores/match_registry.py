@@ -0,0 +1,28 @@
+import importlib
+from typing import TYPE_CHECKING
+
+# registry itself is imported by packaging script, so matcher modules are not imported here
+if TYPE_CHECKING:
+    from cores.match import SwitchChildrenMatcher
+
+# method_name -> (module, matcher class name)
+# matcher modules are imported on first use, so backends of other methods are never loaded
+MATCH_METHOD: dict[str, tuple[str, str]] = {
+    "tfidf": ("cores.match_tfidf", "SwitchChildrenTfidfMatcher"),
+    "levenshtein": ("cores.match_levenshtein", "SwitchChildrenLevenshteinMatcher"),
+    "inclusion": ("cores.match", "SwitchChildrenInclusionMatcher"),
+    "levenshtein_normalized": ("cores.match_levenshtein", "SwitchChildrenNormalizedLevenshteinMatcher"),
+    "token_sort": ("cores.match_levenshtein", "SwitchChildrenTokenSortMatcher"),
+    "partial_ratio": ("cores.match_levenshtein", "SwitchChildrenPartialRatioMatcher"),
+    "word_dict": ("cores.match_word_dict", "SwitchChildrenWordDictMatcher"),
+    "special_foley": ("cores.match_tfidf", "SwitchChildrenSpecialFoleyMatcher"),
+}
+
+# imported by name only, listed here for packaging tools not seeing importlib calls
+MATCHER_MODULE_LIST: list[str] = sorted(set(module_name for module_name, _ in MATCH_METHOD.values()))
+
+
+def get_matcher_class(match_method: str) -> "type[SwitchChildrenMatcher]":
+    module_name, class_name = MATCH_METHOD[match_method]
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
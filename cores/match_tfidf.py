@@ -0,0 +1,46 @@
+from cores.match import SwitchChildrenMatcher
+from cores.tfidf import SentenceIndex, cal_similarity_matrix
+from models.wwise_object import WwiseObject
+
+
+class SwitchChildrenTfidfMatcher(SwitchChildrenMatcher):
+
+    MIN_MATCH_SCORE: float = 1e-6
+
+    # idf of child words depends on every child
+    COLUMN_INDEPENDENT_SCORE: bool = False
+
+    # calculate match score matrix
+    def cal_score_matrix(self, child_list: list[WwiseObject]) -> list[list[float]]:
+
+        # create tf-idf index for switch names, once per switch group
+        cache_entry = self.switch_group_cache_entry
+        switch_name_sentence_index = cache_entry.switch_name_sentence_index if cache_entry is not None else None
+        if switch_name_sentence_index is None:
+            switch_name_sentence_index = SentenceIndex()
+            for switch_obj in self.switch_object_list:
+                word_list: list[str] = self.object_word_mapping.get(switch_obj, [])
+                switch_name_sentence_index.add_sentence(switch_obj, word_list)
+            switch_name_sentence_index.generate_index()
+            if cache_entry is not None:
+                cache_entry.switch_name_sentence_index = switch_name_sentence_index
+
+        # create tf-idf index for child names
+        child_name_sentence_index = SentenceIndex()
+        for child_obj in child_list:
+            word_list: list[str] = self.object_word_mapping.get(child_obj, [])
+            child_name_sentence_index.add_sentence(child_obj, word_list)
+        child_name_sentence_index.generate_index()
+
+        # calculate match score matrix
+        return cal_similarity_matrix(
+            switch_name_sentence_index, self.switch_object_list,
+            child_name_sentence_index, child_list
+        ).tolist()
+
+
+# tf-idf matcher for foley hierarchies, children of special_switch_group_cut_words groups
+# are matched without the words they share with their switch container name
+class SwitchChildrenSpecialFoleyMatcher(SwitchChildrenTfidfMatcher):
+
+    CUT_PARENT_PREFIX: bool = True
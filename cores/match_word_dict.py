@@ -0,0 +1,22 @@
+from cores.match import SwitchChildrenMatcher
+from cores.sentence_diff import WordDict
+from models.wwise_object import WwiseObject
+
+
+# multiset jaccard similarity of words, counted on names encoded to one sign per word, in [0, 1]
+class SwitchChildrenWordDictMatcher(SwitchChildrenMatcher):
+
+    MIN_MATCH_SCORE: float = 0
+
+    # calculate match score matrix
+    def cal_score_matrix(self, child_list: list[WwiseObject]) -> list[list[float]]:
+        switch_sentence_list = [self.object_word_mapping.get(switch_obj, []) for switch_obj in self.switch_object_list]
+        child_sentence_list = [self.object_word_mapping.get(child_obj, []) for child_obj in child_list]
+
+        # every word gets its own sign, so scores of a child do not depend on other children
+        word_dict = WordDict()
+        for sentence in switch_sentence_list + child_sentence_list:
+            word_dict.add_words(sentence)
+        word_dict.create_mapping()
+
+        return WordDict.cal_sentence_similarity_matrix(word_dict, switch_sentence_list, child_sentence_list).tolist()
@@ -0,0 +1,124 @@
+import re
+
+from log import LOGGER
+
+LITERAL_GROUP_NAME = "literal"
+REGEX_GROUP_NAME_PREFIX = "regex_"
+TRIE_END_KEY = ""
+
+# global inline flags like (?i) are only allowed at the start of the combined regex,
+# so they are moved into a scoped flag group of their rule
+GLOBAL_FLAGS_PATTERN = re.compile(r"^(?:\(\?[aiLmsux]+\))+")
+SCOPED_FLAG_LIST = [(re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"), (re.ASCII, "a")]
+
+# lookarounds see text outside their alternative, may give false positives like \(?= which only stop merging
+LOOKAROUND_PATTERN = re.compile(r"\(\?<?[=!]")
+
+# matches a whole matched str with no group, like a merged rule, to expand its template
+WHOLE_STR_PATTERN = re.compile(r".*", re.DOTALL)
+
+
+# replace parts of object names with object_name_replacement (literal rules)
+# and object_name_regex_replacement (regex pattern -> replacement template) of user config
+# literal rules and regex rules without groups or lookarounds are compiled into one regex and a name is scanned once:
+# the leftmost match wins, longer literal rules win over shorter ones and over regex rules at the same position
+# other regex rules depend on their own groups or on text around the match, they are applied one by one afterwards
+# alias names are memoized, so names shared by containers are replaced once per run
+class NameAliasReplacer(object):
+
+    def __init__(self, replacement_dict: dict[str, str], regex_replacement_dict: dict[str, str] | None = None):
+        self.replacement_dict: dict[str, str] = {
+            old_str: new_str for old_str, new_str in replacement_dict.items() if len(old_str) > 0
+        }
+        self.merged_regex_replacement_list: list[tuple[re.Pattern, str]] = []
+        self.single_regex_replacement_list: list[tuple[re.Pattern, str]] = []
+        for pattern_str, template in (regex_replacement_dict or {}).items():
+            try:
+                rule_pattern = re.compile(pattern_str)
+            except re.error as e:
+                LOGGER.error(f"Invalid name replacement regex {pattern_str}: {e}")
+                continue
+            if self.can_merge(rule_pattern):
+                self.merged_regex_replacement_list.append((rule_pattern, template))
+            else:
+                self.single_regex_replacement_list.append((rule_pattern, template))
+
+        # name -> alias name
+        self.alias_name_dict: dict[str, str] = {}
+
+        self.pattern: re.Pattern | None = self.compile_pattern()
+
+    # group numbers and names of a rule change in the combined regex, and lookarounds would see other alternatives
+    @staticmethod
+    def can_merge(rule_pattern: re.Pattern) -> bool:
+        return rule_pattern.groups == 0 and LOOKAROUND_PATTERN.search(rule_pattern.pattern) is None
+
+    def compile_pattern(self) -> re.Pattern | None:
+        pattern_str_list: list[str] = []
+        if len(self.replacement_dict) > 0:
+            literal_pattern_str = self.get_trie_pattern_str(self.create_trie(list(self.replacement_dict.keys())))
+            pattern_str_list.append(f"(?P<{LITERAL_GROUP_NAME}>{literal_pattern_str})")
+        for rule_idx, (rule_pattern, _) in enumerate(self.merged_regex_replacement_list):
+            rule_pattern_str = GLOBAL_FLAGS_PATTERN.sub("", rule_pattern.pattern)
+            flag_str = "".join(flag_char for flag, flag_char in SCOPED_FLAG_LIST if rule_pattern.flags & flag)
+            if len(flag_str) > 0:
+                rule_pattern_str = f"(?{flag_str}:{rule_pattern_str})"
+            pattern_str_list.append(f"(?P<{REGEX_GROUP_NAME_PREFIX}{rule_idx}>{rule_pattern_str})")
+        if len(pattern_str_list) == 0:
+            return None
+        try:
+            return re.compile("|".join(pattern_str_list))
+        except re.error as e:
+            # apply regex rules one by one, literal rules alone cannot fail
+            LOGGER.error(f"Cannot combine name replacement regex rules, applying them one by one: {e}")
+            self.single_regex_replacement_list[:0] = self.merged_regex_replacement_list
+            self.merged_regex_replacement_list.clear()
+            return re.compile(pattern_str_list[0]) if len(self.replacement_dict) > 0 else None
+
+    # char -> child node, TRIE_END_KEY marks the end of a literal
+    @staticmethod
+    def create_trie(literal_list: list[str]) -> dict:
+        trie: dict = {}
+        for literal in literal_list:
+            node = trie
+            for char in literal:
+                node = node.setdefault(char, {})
+            node[TRIE_END_KEY] = True
+        return trie
+
+    # literals sharing a prefix are merged, so the regex engine does not try every literal at every position
+    # longer literals are tried first by greedy optional groups, which gives longest-match semantics
+    @staticmethod
+    def get_trie_pattern_str(node: dict) -> str:
+        branch_list: list[str] = [
+            re.escape(char) + NameAliasReplacer.get_trie_pattern_str(child_node)
+            for char, child_node in sorted((key, value) for key, value in node.items() if key != TRIE_END_KEY)
+        ]
+        if len(branch_list) == 0:
+            return ""
+        branch_str = branch_list[0] if len(branch_list) == 1 else f"(?:{'|'.join(branch_list)})"
+        if TRIE_END_KEY in node:
+            return f"(?:{branch_str})?" if len(branch_list) == 1 else f"{branch_str}?"
+        return branch_str
+
+    def get_alias_name(self, name: str) -> str:
+        alias_name = self.alias_name_dict.get(name, None)
+        if alias_name is not None:
+            return alias_name
+
+        alias_name = self.pattern.sub(self.replace_match, name) if self.pattern is not None else name
+        for rule_pattern, template in self.single_regex_replacement_list:
+            alias_name = rule_pattern.sub(template, alias_name)
+        if alias_name != name:
+            LOGGER.debug(f"Replace {name} to {alias_name}.")
+        self.alias_name_dict[name] = alias_name
+        return alias_name
+
+    def replace_match(self, match: re.Match) -> str:
+        matched_str = match.group(0)
+        if match.lastgroup == LITERAL_GROUP_NAME:
+            return self.replacement_dict[matched_str]
+
+        # merged rules have no group, so their template can only refer to the whole matched str
+        _, template = self.merged_regex_replacement_list[int(match.lastgroup[len(REGEX_GROUP_NAME_PREFIX):])]
+        return WHOLE_STR_PATTERN.fullmatch(matched_str).expand(template)
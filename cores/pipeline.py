@@ -0,0 +1,106 @@
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator
+
+# seconds between checks of the stop event while a stage waits for a full or empty queue
+PIPELINE_POLL_INTERVAL = 0.1
+
+
+# marks the end of items in a queue
+class _PipelineEnd(object):
+    pass
+
+
+PIPELINE_END = _PipelineEnd()
+
+
+# stages of a stream connected by bounded queues, every stage runs in its own thread
+# a stage function takes one item and returns the items for the next stage, items keep their order
+# items of the last stage are iterated by the caller thread, so at most queue_size items wait between two stages
+# exception of any stage stops every stage and is raised to the caller thread, items not read yet are dropped
+class StreamPipeline(object):
+
+    def __init__(
+        self,
+        source_iterable: Iterable,
+        stage_func_list: list[Callable[[Any], Iterable]],
+        queue_size: int
+    ):
+        self.source_iterable: Iterable = source_iterable
+        self.stage_func_list: list[Callable[[Any], Iterable]] = stage_func_list
+        self.queue_list: list[queue.Queue] = [queue.Queue(maxsize=max(1, queue_size)) for _ in stage_func_list]
+
+        self._stop_event: threading.Event = threading.Event()
+        self._exception: BaseException | None = None
+        self._thread_list: list[threading.Thread] = []
+
+    def start(self):
+        for stage_idx, stage_func in enumerate(self.stage_func_list):
+            thread = threading.Thread(
+                target=self.run_stage, args=(stage_idx, stage_func),
+                name=f"PipelineStage{stage_idx}", daemon=True
+            )
+            self._thread_list.append(thread)
+            thread.start()
+
+    def run_stage(self, stage_idx: int, stage_func: Callable[[Any], Iterable]):
+        output_queue = self.queue_list[stage_idx]
+        try:
+            input_iterable = self.source_iterable if stage_idx == 0 else self.iter_queue(self.queue_list[stage_idx - 1])
+            for item in input_iterable:
+                for output_item in stage_func(item):
+                    if not self.put(output_queue, output_item):
+                        return
+        except BaseException as e:
+            if self._exception is None:
+                self._exception = e
+            self._stop_event.set()
+        finally:
+            self.put(output_queue, PIPELINE_END, force=True)
+
+    # return: False if pipeline is stopped before the item is put
+    def put(self, item_queue: queue.Queue, item: Any, force: bool = False) -> bool:
+        while force or not self._stop_event.is_set():
+            try:
+                item_queue.put(item, timeout=PIPELINE_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                if force and self._stop_event.is_set():
+                    # nobody reads a stopped pipeline, drop a waiting item to make room for the end mark
+                    self.drop_one(item_queue)
+        return False
+
+    @staticmethod
+    def drop_one(item_queue: queue.Queue):
+        try:
+            item_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    # items of a queue until the end mark or stop
+    def iter_queue(self, item_queue: queue.Queue) -> Iterator:
+        while not self._stop_event.is_set():
+            try:
+                item = item_queue.get(timeout=PIPELINE_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if item is PIPELINE_END:
+                return
+            yield item
+
+    def __iter__(self) -> Iterator:
+        yield from self.iter_queue(self.queue_list[-1])
+        if self._exception is not None:
+            raise self._exception
+
+    def stop(self):
+        self._stop_event.set()
+        for thread in self._thread_list:
+            thread.join()
+
+    def __enter__(self) -> "StreamPipeline":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,39 @@
+# cut the longest common word prefix of a child and its parent switch container from the child words,
+# only for children of switch containers using switch groups in special_switch_group_cut_words
+# foley children repeat the words of their parent, so matching is done on the short distinctive words left
+class ParentPrefixCutter(object):
+
+    def __init__(self, switch_group_name_list: list[str]):
+        self.switch_group_name_set: set[str] = set(switch_group_name_list)
+
+        # parent words -> child words -> cut child words, shared by every container of a run
+        self.cut_word_dict: dict[tuple[str, ...], dict[tuple[str, ...], tuple[str, ...]]] = {}
+
+    def need_cut(self, switch_group_name: str) -> bool:
+        return switch_group_name in self.switch_group_name_set
+
+    # one dict per parent, filled once for each child name under the parent
+    def get_parent_cut_word_dict(self, parent_word_tuple: tuple[str, ...]) -> dict[tuple[str, ...], tuple[str, ...]]:
+        parent_cut_word_dict = self.cut_word_dict.get(parent_word_tuple, None)
+        if parent_cut_word_dict is None:
+            parent_cut_word_dict = {}
+            self.cut_word_dict[parent_word_tuple] = parent_cut_word_dict
+        return parent_cut_word_dict
+
+    # at least one word of child is kept
+    @staticmethod
+    def cut_prefix(parent_word_tuple: tuple[str, ...], child_word_tuple: tuple[str, ...]) -> tuple[str, ...]:
+        max_cut_count = min(len(parent_word_tuple), len(child_word_tuple) - 1)
+        cut_count = 0
+        while cut_count < max_cut_count and parent_word_tuple[cut_count] == child_word_tuple[cut_count]:
+            cut_count += 1
+        return child_word_tuple[cut_count:]
+
+    def get_cut_word_list(self, parent_word_tuple: tuple[str, ...], child_word_list: list[str]) -> list[str]:
+        parent_cut_word_dict = self.get_parent_cut_word_dict(parent_word_tuple)
+        child_word_tuple = tuple(child_word_list)
+        cut_word_tuple = parent_cut_word_dict.get(child_word_tuple, None)
+        if cut_word_tuple is None:
+            cut_word_tuple = self.cut_prefix(parent_word_tuple, child_word_tuple)
+            parent_cut_word_dict[child_word_tuple] = cut_word_tuple
+        return list(cut_word_tuple)
@@ -0,0 +1,242 @@
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable
+
+from cores.waapi import WaapiWampClient
+from log import CLEAN_LOGGER
+
+# upper bounds of latency histogram buckets in milliseconds, the last bucket has no upper bound
+LATENCY_BUCKET_MS_LIST = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+# waapi client methods not worth timing
+UNPROFILED_WAAPI_METHOD_SET = {"connect", "disconnect", "reconnect", "is_connected", "has_subscriptions", "undo_group"}
+
+# stage of the current thread, waapi calls are added to it
+# stages of a pipeline run in several threads, and calls sent concurrently by waapi client run in their context
+CURRENT_STAGE_STATS: ContextVar["StageStats | None"] = ContextVar("CURRENT_STAGE_STATS", default=None)
+
+
+# count, latency histogram and payload size of one waapi uri or client method
+class CallStats(object):
+
+    def __init__(self):
+        self.count: int = 0
+        self.total_time: float = 0.0
+        self.max_time: float = 0.0
+        self.bucket_count_list: list[int] = [0] * (len(LATENCY_BUCKET_MS_LIST) + 1)
+        self.request_bytes: int = 0
+        self.response_bytes: int = 0
+
+    def add(self, elapsed: float, request_bytes: int = 0, response_bytes: int = 0):
+        self.count += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        elapsed_ms = elapsed * 1000
+        bucket_idx = next(
+            (idx for idx, bound_ms in enumerate(LATENCY_BUCKET_MS_LIST) if elapsed_ms <= bound_ms),
+            len(LATENCY_BUCKET_MS_LIST)
+        )
+        self.bucket_count_list[bucket_idx] += 1
+        self.request_bytes += request_bytes
+        self.response_bytes += response_bytes
+
+    def to_dict(self) -> dict:
+        bucket_name_list = [f"<={bound_ms}ms" for bound_ms in LATENCY_BUCKET_MS_LIST] + \
+                           [f">{LATENCY_BUCKET_MS_LIST[-1]}ms"]
+        return {
+            "count": self.count,
+            "total_ms": self.total_time * 1000,
+            "mean_ms": self.total_time * 1000 / self.count if self.count > 0 else 0.0,
+            "max_ms": self.max_time * 1000,
+            "histogram": {
+                bucket_name: bucket_count
+                for bucket_name, bucket_count in zip(bucket_name_list, self.bucket_count_list)
+                if bucket_count > 0
+            },
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+        }
+
+
+# time and waapi round trips spent in one stage of one container
+class StageStats(object):
+
+    def __init__(self):
+        self.time: float = 0.0
+        self.waapi_time: float = 0.0
+        self.waapi_call_count: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "ms": self.time * 1000,
+            "waapi_ms": self.waapi_time * 1000,
+            "waapi_calls": self.waapi_call_count,
+        }
+
+
+# records stage timings and waapi calls of one job, does nothing if not enabled
+class Profiler(object):
+
+    # scope of stages not belonging to one switch container
+    JOB_SCOPE = "job"
+
+    def __init__(self, enabled: bool = False):
+        self.enabled: bool = enabled
+
+        # waapi uri or client method name -> stats
+        self.call_stats_dict: dict[str, CallStats] = {}
+
+        # scope -> stage name -> stats, scope is the job or a switch container name
+        self.stage_stats_dict: dict[str, dict[str, StageStats]] = {}
+
+        # stages and waapi calls run in several threads
+        self._lock: threading.Lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, stage_name: str, scope: str = JOB_SCOPE):
+        if not self.enabled:
+            yield
+            return
+
+        with self._lock:
+            stage_stats = self.stage_stats_dict.setdefault(scope, {}).setdefault(stage_name, StageStats())
+        token = CURRENT_STAGE_STATS.set(stage_stats)
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start_time
+            CURRENT_STAGE_STATS.reset(token)
+            with self._lock:
+                stage_stats.time += elapsed
+
+    def record_call(self, name: str, elapsed: float, request_bytes: int = 0, response_bytes: int = 0):
+        with self._lock:
+            self.call_stats_dict.setdefault(name, CallStats()).add(elapsed, request_bytes, response_bytes)
+
+    def record_waapi_call(self, uri: str, elapsed: float, args: dict | None, result: dict | None):
+        request_bytes = len(json.dumps(args)) if args is not None else 0
+        response_bytes = len(json.dumps(result)) if result is not None else 0
+        self.record_call(uri, elapsed, request_bytes, response_bytes)
+        stage_stats = CURRENT_STAGE_STATS.get()
+        with self._lock:
+            if stage_stats is not None:
+                stage_stats.waapi_time += elapsed
+                stage_stats.waapi_call_count += 1
+
+    def wrap_method(self, name: str, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start_time = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record_call(name, time.perf_counter() - start_time)
+        return wrapper
+
+    def wrap_waapi_call(self, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(uri: str, args: dict = None) -> dict | None:
+            start_time = time.perf_counter()
+            result = None
+            try:
+                result = func(uri, args)
+                return result
+            finally:
+                self.record_waapi_call(uri, time.perf_counter() - start_time, args, result)
+        return wrapper
+
+    # wrap public methods of waapi client while the job runs, the client is kept by the session after job
+    @contextmanager
+    def instrument_waapi_client(self, waapi_client: WaapiWampClient):
+        if not self.enabled:
+            yield
+            return
+
+        method_name_list: list[str] = [
+            name for name in dir(type(waapi_client))
+            if not name.startswith("_") and name not in UNPROFILED_WAAPI_METHOD_SET
+            and callable(getattr(type(waapi_client), name))
+        ]
+        for name in method_name_list:
+            func = getattr(waapi_client, name)
+            if name == "call":
+                setattr(waapi_client, name, self.wrap_waapi_call(func))
+            else:
+                setattr(waapi_client, name, self.wrap_method(f"{type(waapi_client).__name__}.{name}", func))
+        try:
+            yield
+        finally:
+            for name in method_name_list:
+                delattr(waapi_client, name)
+
+    # stage name -> stats summed over every scope
+    def get_stage_total_dict(self) -> dict[str, StageStats]:
+        stage_total_dict: dict[str, StageStats] = {}
+        for stage_dict in self.stage_stats_dict.values():
+            for stage_name, stage_stats in stage_dict.items():
+                total_stats = stage_total_dict.setdefault(stage_name, StageStats())
+                total_stats.time += stage_stats.time
+                total_stats.waapi_time += stage_stats.waapi_time
+                total_stats.waapi_call_count += stage_stats.waapi_call_count
+        return stage_total_dict
+
+    def to_dict(self) -> dict:
+        return {
+            "stages": {
+                stage_name: stage_stats.to_dict()
+                for stage_name, stage_stats in self.get_stage_total_dict().items()
+            },
+            "scopes": {
+                scope: {stage_name: stage_stats.to_dict() for stage_name, stage_stats in stage_dict.items()}
+                for scope, stage_dict in self.stage_stats_dict.items()
+            },
+            "calls": {name: call_stats.to_dict() for name, call_stats in self.call_stats_dict.items()},
+        }
+
+    def dump(self, file_path: str):
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=4, ensure_ascii=False)
+        CLEAN_LOGGER.info(f"Profile saved to {file_path}.")
+
+    def print_summary(self, slowest_scope_count: int = 10):
+        # only imported when profile is printed
+        from tabulate import tabulate
+
+        CLEAN_LOGGER.info("Stage profile:")
+        CLEAN_LOGGER.info(tabulate(
+            [
+                [stage_name, stage_stats.time * 1000, stage_stats.waapi_time * 1000, stage_stats.waapi_call_count]
+                for stage_name, stage_stats in self.get_stage_total_dict().items()
+            ],
+            headers=["stage", "ms", "waapi ms", "waapi calls"], floatfmt=".1f"
+        ))
+
+        scope_time_list = sorted(
+            (
+                (scope, sum(stage_stats.time for stage_stats in stage_dict.values()))
+                for scope, stage_dict in self.stage_stats_dict.items() if scope != self.JOB_SCOPE
+            ),
+            key=lambda x: x[1], reverse=True
+        )
+        if len(scope_time_list) > 0:
+            CLEAN_LOGGER.info(f"Slowest switch containers:")
+            CLEAN_LOGGER.info(tabulate(
+                [[scope, scope_time * 1000] for scope, scope_time in scope_time_list[:slowest_scope_count]],
+                headers=["switch container", "ms"], floatfmt=".1f"
+            ))
+
+        CLEAN_LOGGER.info("WAAPI profile:")
+        CLEAN_LOGGER.info(tabulate(
+            [
+                [name, stats.count, stats.total_time * 1000, stats.total_time * 1000 / stats.count,
+                 stats.max_time * 1000, stats.request_bytes, stats.response_bytes]
+                for name, stats in sorted(self.call_stats_dict.items(), key=lambda x: x[1].total_time, reverse=True)
+            ],
+            headers=["call", "count", "total ms", "mean ms", "max ms", "request bytes", "response bytes"],
+            floatfmt=".2f"
+        ))
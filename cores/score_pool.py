@@ -0,0 +1,124 @@
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from cores.match import SwitchChildrenMatcher
+from cores.match_registry import get_matcher_class
+from cores.name_alias import NameAliasReplacer
+from cores.prefix_cut import ParentPrefixCutter
+from cores.switch_group_cache import SwitchGroupCache
+from cores.tokenizer import Tokenizer
+from log import LOGGER
+from models.config import UserConfig
+from models.wwise_object import WwiseSwitchContainerInfo
+
+
+# names of one switch container in, sent to a scoring process
+class ScoreTask(object):
+
+    def __init__(
+        self,
+        switch_container_info: WwiseSwitchContainerInfo,
+        only_unassigned: bool,
+        assignment_solver: str,
+        column_dict: dict[str, list] | None = None
+    ):
+        self.switch_container_info: WwiseSwitchContainerInfo = switch_container_info
+        self.only_unassigned: bool = only_unassigned
+        self.assignment_solver: str = assignment_solver
+        # cached columns of match cache, None if match cache is not used
+        self.column_dict: dict[str, list] | None = column_dict
+
+
+# score matrix and chosen rows out, index of children is the same as the matcher of main process
+class ScoreResult(object):
+
+    def __init__(self):
+        self.match_score_matrix: list[list] = []
+        self.best_match_row_list: list[int] = []
+        # cached columns with new columns, None if match cache is not used
+        self.column_dict: dict[str, list] | None = None
+
+
+# state of one scoring process, shared by every switch container scored in the process like in main process
+class ScoreWorker(object):
+
+    def __init__(self, match_method: str, user_config: UserConfig):
+        self.matcher_class: type[SwitchChildrenMatcher] = get_matcher_class(match_method)
+        self.user_config: UserConfig = user_config
+        self.name_alias_replacer: NameAliasReplacer = NameAliasReplacer(
+            user_config.object_name_replacement, user_config.object_name_regex_replacement
+        )
+        self.tokenizer: Tokenizer = Tokenizer.from_dict(user_config.tokenizer)
+        self.prefix_cutter: ParentPrefixCutter = ParentPrefixCutter(user_config.special_switch_group_cut_words)
+        self.switch_group_cache: SwitchGroupCache = SwitchGroupCache()
+
+    # same steps as main process from query to solving, without any waapi call
+    def score(self, task: ScoreTask) -> ScoreResult:
+        info = task.switch_container_info
+        matcher = self.matcher_class(
+            switch_container_obj=info.switch_container_obj,
+            user_config=self.user_config,
+            waapi_client=None,
+            switch_container_info=info,
+            switch_group_cache=self.switch_group_cache,
+            name_alias_replacer=self.name_alias_replacer,
+            tokenizer=self.tokenizer,
+            prefix_cutter=self.prefix_cutter
+        )
+        matcher.query_switch_container()
+        if task.only_unassigned:
+            matcher.drop_assigned_children()
+        matcher.apply_name_alias()
+        matcher.create_object_word_mapping()
+        matcher.cut_parent_name_prefix()
+        if task.column_dict is not None:
+            matcher.cal_match_score_matrix_with_column_dict(task.column_dict)
+        else:
+            matcher.cal_match_score_matrix()
+
+        result = ScoreResult()
+        result.match_score_matrix = matcher.match_score_matrix
+        result.best_match_row_list = matcher.get_best_match_row_list(task.assignment_solver)
+        result.column_dict = task.column_dict
+        return result
+
+
+# set by initializer of every scoring process
+SCORE_WORKER: ScoreWorker | None = None
+
+
+def init_score_worker(match_method: str, user_config: UserConfig):
+    global SCORE_WORKER
+    SCORE_WORKER = ScoreWorker(match_method, user_config)
+    # errors of the same names and config are logged by main process, exceptions are raised by result of future
+    LOGGER.setLevel(logging.CRITICAL)
+
+
+def run_score_task(task: ScoreTask) -> ScoreResult:
+    return SCORE_WORKER.score(task)
+
+
+# score switch containers in other processes, waapi session and assignments stay in main process
+class ScorePool(object):
+
+    def __init__(self, process_count: int, match_method: str, user_config: UserConfig):
+        # spawn on every platform, so processes do not inherit waapi connections and threads of main process
+        self._executor: ProcessPoolExecutor = ProcessPoolExecutor(
+            max_workers=process_count,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_score_worker,
+            initargs=(match_method, user_config)
+        )
+
+    def submit(self, task: ScoreTask) -> Future:
+        return self._executor.submit(run_score_task, task)
+
+    def shutdown(self):
+        self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> "ScorePool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class WordFreqCounter(object):
 
     def __init__(self):
@@ -24,6 +27,10 @@ class WordDict(object):
     SPECIAL_SIGN_LIST_C = [f"{chr(i)}" for i in range(ord("["), ord("`") + 1)]
     SPECIAL_SIGN_LIST_D = [f"{chr(i)}" for i in range(ord("{"), ord("~") + 1)]
 
+    # signs of words beyond default sign list are code points from CJK unified ideographs on,
+    # enough for every word of a project
+    EXTRA_SIGN_START = 0x4E00
+
     def __init__(
         self,
         non_word_sign: str = " ",
@@ -31,6 +38,10 @@ class WordDict(object):
     ):
         self.non_word_sign = non_word_sign
         self.available_sign_set = set()
+
+        # default sign list is extended with extra signs, given sign list is not
+        self.use_extra_signs: bool = sign_list is None
+        self._extra_sign_count: int = 0
         if sign_list is not None:
             self.available_sign_set.update(sign_list)
         else:
@@ -44,6 +55,7 @@ class WordDict(object):
                 WordDict.SPECIAL_SIGN_LIST_D
             ]:
                 self.available_sign_set.update(signs)
+            self.available_sign_set.discard(non_word_sign)
 
         self.word_freq_counter: WordFreqCounter = WordFreqCounter()
         self.word_sign_dict: dict[str, str] = {}
@@ -65,14 +77,24 @@ class WordDict(object):
             reverse=False
         )
 
+        # words already mapped keep their signs
+        sorted_word_list = [(word, freq) for word, freq in sorted_word_list if word not in self.word_sign_dict]
+
         # remove most frequent words until the sign set is enough
-        while len(sorted_word_list) > len(self.available_sign_set):
-            sorted_word_list.pop(-1)
+        if not self.use_extra_signs:
+            while len(sorted_word_list) > len(self.available_sign_set):
+                sorted_word_list.pop(-1)
 
         # create mapping
         for word, _ in sorted_word_list:
-            sign = self.available_sign_set.pop()
-            self.word_sign_dict[word] = sign
+            self.word_sign_dict[word] = self.pop_sign()
+
+    def pop_sign(self) -> str:
+        if len(self.available_sign_set) > 0:
+            return self.available_sign_set.pop()
+        sign = chr(WordDict.EXTRA_SIGN_START + self._extra_sign_count)
+        self._extra_sign_count += 1
+        return sign
 
     # get sign str of a sentence
     def encode_sentence(self, sentence_word_list: list[str]) -> str:
@@ -143,3 +165,55 @@ class WordDict(object):
 
         # intersection / subset length, subset length
         return len(subset_sign_set & superset_sign_set) / len(subset_sign_set), len(subset_sign_set)
+
+    # similarity of every pair of sentences, same as cal_sentence_similarity
+    # multiset intersection is counted with matrix products: min(a, b) = sum of [a >= k] * [b >= k] for k >= 1
+    # return: matrix, index: (index in sentence_list_a, index in sentence_list_b)
+    @staticmethod
+    def cal_sentence_similarity_matrix(
+        word_dict: "WordDict",
+        sentence_list_a: list[list[str]],
+        sentence_list_b: list[list[str]],
+    ) -> np.ndarray:
+        encoded_sentence_list_a = [word_dict.encode_sentence(sentence) for sentence in sentence_list_a]
+        encoded_sentence_list_b = [word_dict.encode_sentence(sentence) for sentence in sentence_list_b]
+        if len(word_dict.non_word_sign) > 0:
+            # remove non-word sign in encoded sentence
+            encoded_sentence_list_a = [sentence.replace(word_dict.non_word_sign, "")
+                                       for sentence in encoded_sentence_list_a]
+            encoded_sentence_list_b = [sentence.replace(word_dict.non_word_sign, "")
+                                       for sentence in encoded_sentence_list_b]
+
+        # sign -> column of count matrix
+        sign_index_dict: dict[str, int] = {}
+        for encoded_sentence in encoded_sentence_list_a + encoded_sentence_list_b:
+            for sign in encoded_sentence:
+                sign_index_dict.setdefault(sign, len(sign_index_dict))
+
+        count_array_a = WordDict.get_sign_count_array(encoded_sentence_list_a, sign_index_dict)
+        count_array_b = WordDict.get_sign_count_array(encoded_sentence_list_b, sign_index_dict)
+        intersection_array = np.zeros((len(sentence_list_a), len(sentence_list_b)), dtype=np.float64)
+        max_count = min(count_array_a.max(initial=0), count_array_b.max(initial=0))
+        for count in range(1, int(max_count) + 1):
+            intersection_array += (count_array_a >= count).astype(np.float64) @ \
+                                  (count_array_b >= count).astype(np.float64).T
+
+        length_array_a = count_array_a.sum(axis=1, dtype=np.float64)
+        length_array_b = count_array_b.sum(axis=1, dtype=np.float64)
+        union_array = length_array_a[:, None] + length_array_b[None, :] - intersection_array
+
+        # empty sentence has 0 similarity with every sentence
+        similarity_array = np.zeros_like(intersection_array)
+        np.divide(intersection_array, union_array, out=similarity_array, where=union_array > 0)
+        similarity_array[length_array_a == 0, :] = 0
+        similarity_array[:, length_array_b == 0] = 0
+        return similarity_array
+
+    # sign count of every sentence, index: (sentence index, sign index)
+    @staticmethod
+    def get_sign_count_array(encoded_sentence_list: list[str], sign_index_dict: dict[str, int]) -> np.ndarray:
+        row_list = [row_idx for row_idx, sentence in enumerate(encoded_sentence_list) for _ in sentence]
+        col_list = [sign_index_dict[sign] for sentence in encoded_sentence_list for sign in sentence]
+        count_array = np.zeros((len(encoded_sentence_list), len(sign_index_dict)), dtype=np.int32)
+        np.add.at(count_array, (row_list, col_list), 1)
+        return count_array
@@ -0,0 +1,87 @@
+import logging
+import socketserver
+import threading
+from typing import Callable
+
+from cores.server_protocol import SERVER_HOST, send_message, read_messages
+from log import LOGGER, CLEAN_LOGGER
+
+
+# send log records of a job to the client
+class SocketLogHandler(logging.Handler):
+
+    def __init__(self, handler: "AssignJobHandler", fmt: str):
+        super().__init__()
+        self.handler: AssignJobHandler = handler
+        self.setFormatter(logging.Formatter(fmt=fmt))
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            send_message(self.handler.wfile, {"log": self.format(record), "level": record.levelname})
+        except OSError:
+            # client is gone, keep running the job
+            pass
+
+
+class AssignJobHandler(socketserver.StreamRequestHandler):
+
+    server: "AssignServer"
+
+    def handle(self):
+        for message in read_messages(self.rfile):
+            if message.get("command", "") == "stop":
+                LOGGER.info("Stopping server...")
+                send_message(self.wfile, {"exit_code": 0})
+                # shutdown waits for serve_forever to return, so it cannot run in this thread
+                threading.Thread(target=self.server.shutdown).start()
+                return
+
+            argv: list[str] = message.get("argv", [])
+            self.run_job(argv)
+            return
+
+    def run_job(self, argv: list[str]):
+        log_handler = SocketLogHandler(self, "%(levelname)s - %(message)s")
+        clean_log_handler = SocketLogHandler(self, "%(message)s")
+        LOGGER.addHandler(log_handler)
+        CLEAN_LOGGER.addHandler(clean_log_handler)
+        try:
+            LOGGER.info(f"Running job: {' '.join(argv)}")
+            exit_code = self.server.run_job_func(argv, self.read_input)
+        except SystemExit as e:
+            # bad args
+            exit_code = e.code if isinstance(e.code, int) else -1
+        except Exception as e:
+            LOGGER.exception(e)
+            exit_code = -1
+        finally:
+            LOGGER.removeHandler(log_handler)
+            CLEAN_LOGGER.removeHandler(clean_log_handler)
+
+        try:
+            send_message(self.wfile, {"exit_code": exit_code})
+        except OSError:
+            pass
+
+    # ask the client for one line of keyboard input, empty if the client is gone
+    def read_input(self) -> str:
+        try:
+            send_message(self.wfile, {"input": True})
+            for message in read_messages(self.rfile):
+                return str(message.get("input", ""))
+        except OSError:
+            pass
+        return ""
+
+
+# resident server running jobs one by one with a warm waapi session and caches
+class AssignServer(socketserver.TCPServer):
+
+    allow_reuse_address = True
+
+    # clients of one context menu click with many selected objects connect at the same time
+    request_queue_size = 64
+
+    def __init__(self, port: int, run_job_func: Callable[[list[str], Callable[[], str]], int]):
+        super().__init__((SERVER_HOST, port), AssignJobHandler)
+        self.run_job_func: Callable[[list[str], Callable[[], str]], int] = run_job_func
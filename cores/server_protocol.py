@@ -0,0 +1,34 @@
+import json
+import socket
+from typing import IO, Iterator
+
+# resident server only accepts local connections
+SERVER_HOST = "127.0.0.1"
+DEFAULT_SERVER_PORT = 18080
+
+# messages are json objects, one per line
+# client -> server: {"argv": [...]} to run a job, {"command": "stop"} to stop server,
+#                   {"input": "..."} to answer an input request
+# server -> client: {"log": "..."} for every log line, {"input": true} when job waits for keyboard input,
+#                   {"exit_code": 0} when job finished
+
+
+def send_message(stream: IO[bytes], message: dict):
+    stream.write((json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8"))
+    stream.flush()
+
+
+def read_messages(stream: IO[bytes]) -> Iterator[dict]:
+    for line in stream:
+        line = line.strip()
+        if len(line) == 0:
+            continue
+        yield json.loads(line.decode("utf-8"))
+
+
+# return None if server is not running
+def connect_server(port: int, timeout: float | None = None) -> socket.socket | None:
+    try:
+        return socket.create_connection((SERVER_HOST, port), timeout=timeout)
+    except OSError:
+        return None
@@ -0,0 +1,86 @@
+import threading
+
+from cores.match_cache import MatchCache
+from cores.switch_group_cache import SwitchGroupCache
+from cores.tokenizer import Tokenizer
+from cores.waapi import WaapiWampClient
+from log import LOGGER
+from models.config import UserConfig
+
+
+# state shared by every job of one process, kept warm between jobs of the resident server
+class AssignSession(object):
+
+    # topics meaning cached switch groups may be outdated
+    OBJECT_CHANGED_TOPIC_LIST = [
+        "ak.wwise.core.object.created",
+        "ak.wwise.core.object.preDeleted",
+        "ak.wwise.core.object.nameChanged",
+        "ak.wwise.core.object.childAdded",
+        "ak.wwise.core.object.childRemoved",
+    ]
+
+    def __init__(self, waapi_client: WaapiWampClient):
+        self.waapi_client: WaapiWampClient = waapi_client
+        self.switch_group_cache: SwitchGroupCache = SwitchGroupCache()
+
+        # token ids cached in switch groups belong to this tokenizer, so both are replaced together
+        self.tokenizer: Tokenizer = Tokenizer()
+
+        # match cache file path -> match cache
+        self.match_cache_dict: dict[str, MatchCache] = {}
+
+        # alias names and words of cached switch groups depend on user config of the job
+        self._user_config_fingerprint: str = ""
+
+        # set by waapi notification thread
+        self._object_changed_event: threading.Event = threading.Event()
+
+    def get_match_cache(self, file_path: str) -> MatchCache:
+        match_cache = self.match_cache_dict.get(file_path, None)
+        if match_cache is None:
+            match_cache = MatchCache()
+            match_cache.load(file_path)
+            self.match_cache_dict[file_path] = match_cache
+        return match_cache
+
+    # clear cached switch groups and create tokenizer when user config differs from the last job
+    def check_user_config(self, user_config: UserConfig):
+        user_config_fingerprint = MatchCache.get_fingerprint([user_config.__dict__])
+        if user_config_fingerprint != self._user_config_fingerprint:
+            if len(self._user_config_fingerprint) > 0:
+                LOGGER.debug("User config changed. Clearing cached switch groups...")
+            self.switch_group_cache.clear()
+            self.tokenizer = Tokenizer.from_dict(user_config.tokenizer)
+            self._user_config_fingerprint = user_config_fingerprint
+
+    # clear cached switch groups when objects are changed in wwise
+    def watch_object_changes(self):
+        for topic in self.OBJECT_CHANGED_TOPIC_LIST:
+            if not self.waapi_client.subscribe(topic, self.on_object_changed):
+                LOGGER.warning(f"Cannot subscribe {topic}. Cached switch groups are cleared before every job.")
+                self._object_changed_event.set()
+                return
+
+    def on_object_changed(self, *args, **kwargs):
+        self._object_changed_event.set()
+
+    # call before every job
+    # return: False if WAAPI is disconnected and cannot reconnect, the job cannot run
+    def clear_outdated_cache(self) -> bool:
+        if not self.waapi_client.is_connected():
+            LOGGER.warning("WAAPI is disconnected. Reconnecting...")
+            self.switch_group_cache.clear()
+            if not self.waapi_client.reconnect():
+                LOGGER.error("Cannot reconnect to WAAPI. Is Wwise running with WAAPI enabled?")
+                return False
+            self.watch_object_changes()
+            return True
+
+        if self._object_changed_event.is_set():
+            LOGGER.debug("Objects changed in wwise. Clearing cached switch groups...")
+            # keep the event set if subscribing failed
+            if self.waapi_client.has_subscriptions():
+                self._object_changed_event.clear()
+            self.switch_group_cache.clear()
+        return True
@@ -0,0 +1,58 @@
+from typing import TYPE_CHECKING
+
+from models.wwise_object import WwiseObject
+
+# tf-idf index pulls scipy, only imported by tf-idf matcher
+if TYPE_CHECKING:
+    from cores.tfidf import SentenceIndex
+
+
+# data of one switch group shared by every switch container using it
+class SwitchGroupCacheEntry(object):
+
+    def __init__(self, switch_group_object: WwiseObject):
+        self.switch_group_object: WwiseObject = switch_group_object
+        self.switch_object_list: list[WwiseObject] = []
+
+        # name replacement of switches, filled by the first matcher using this group
+        self.name_alias_applied: bool = False
+        self.name_alias_dict: dict[WwiseObject, str] = {}
+
+        # words mapping of switches, filled by the first matcher using this group
+        self.word_mapping_created: bool = False
+        self.object_word_mapping: dict[WwiseObject, list[str]] = {}
+
+        # tf-idf index of switch names
+        self.switch_name_sentence_index: "SentenceIndex | None" = None
+
+        # inverted index of inclusion matcher: token id -> indexes of switches with the token, and token count of switches
+        self.switch_token_index: dict[int, list[int]] | None = None
+        self.switch_token_count_list: list[int] = []
+
+
+# switch group id -> cache entry, lives for the whole run
+class SwitchGroupCache(object):
+
+    def __init__(self):
+        self.entry_dict: dict[str, SwitchGroupCacheEntry] = {}
+
+    def get(self, switch_group_id: str) -> SwitchGroupCacheEntry | None:
+        return self.entry_dict.get(switch_group_id, None)
+
+    # add switch group with its switches, return existing entry if already cached
+    def add(
+        self,
+        switch_group_object: WwiseObject,
+        switch_object_list: list[WwiseObject]
+    ) -> SwitchGroupCacheEntry:
+        entry = self.entry_dict.get(switch_group_object.id, None)
+        if entry is not None:
+            return entry
+
+        entry = SwitchGroupCacheEntry(switch_group_object)
+        entry.switch_object_list.extend(switch_object_list)
+        self.entry_dict[switch_group_object.id] = entry
+        return entry
+
+    def clear(self):
+        self.entry_dict.clear()
@@ -1,5 +1,8 @@
 import math
 
+import numpy as np
+from scipy import sparse
+
 from log import LOGGER
 
 
@@ -51,3 +54,42 @@ class SentenceIndex(object):
             similarity += self.tf_idf_dict.get(word, 0)
 
         return similarity
+
+
+# calculate similarity of every sentence pair of two indexes with one sparse matrix product
+# same as row_index.get_similarity(col sentence, row key) + col_index.get_similarity(row sentence, col key)
+# return: similarity matrix, index: (row_key_index, col_key_index)
+def cal_similarity_matrix(
+    row_index: SentenceIndex,
+    row_key_list: list,
+    col_index: SentenceIndex,
+    col_key_list: list
+) -> np.ndarray:
+
+    # shared vocabulary of both indexes: word -> column of term matrix
+    vocabulary_dict: dict[str, int] = {}
+
+    # binary term matrix, element is 1 if the word is in the sentence
+    def create_term_matrix(index: SentenceIndex, key_list: list) -> sparse.csr_matrix:
+        row_list: list[int] = []
+        col_list: list[int] = []
+        for row, key in enumerate(key_list):
+            for word in set(index.sentence_dict.get(key, [])):
+                row_list.append(row)
+                col_list.append(vocabulary_dict.setdefault(word, len(vocabulary_dict)))
+        return sparse.csr_matrix(
+            (np.ones(len(row_list)), (row_list, col_list)),
+            shape=(len(key_list), len(vocabulary_dict))
+        )
+
+    row_term_matrix = create_term_matrix(row_index, row_key_list)
+    col_term_matrix = create_term_matrix(col_index, col_key_list)
+    row_term_matrix.resize((len(row_key_list), len(vocabulary_dict)))
+
+    # a shared word scores its tf-idf in both indexes
+    word_weight_array = np.zeros(len(vocabulary_dict))
+    for word, col in vocabulary_dict.items():
+        word_weight_array[col] = row_index.tf_idf_dict.get(word, 0) + col_index.tf_idf_dict.get(word, 0)
+
+    similarity_matrix = row_term_matrix @ sparse.diags(word_weight_array) @ col_term_matrix.T
+    return similarity_matrix.toarray()
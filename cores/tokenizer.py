@@ -0,0 +1,91 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+
+# count of names whose tokens are kept, shared by every container of a run
+TOKENIZER_CACHE_SIZE = 65536
+
+CAMEL_CASE_SPLIT_PATTERN = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+DIGIT_SPLIT_PATTERN = re.compile(r"(?<=\D)(?=\d)|(?<=\d)(?=\D)")
+
+# light suffix stemmer without dictionary: (suffix, replacement), first matching suffix is replaced
+STEM_SUFFIX_LIST = [("sses", "ss"), ("ies", "y"), ("ing", ""), ("ed", ""), ("s", "")]
+STEM_MIN_LENGTH = 3
+
+
+# split names into words: separators -> camelCase -> digits -> lower case -> stop words -> stemming
+# default config splits by "_" only, same as former name.lower().split("_")
+class Tokenizer(object):
+
+    def __init__(self):
+        self.separators: str = "_"
+        self.split_camel_case: bool = False
+        self.split_digits: bool = False
+        self.stop_words: set[str] = set()
+        self.stemming: bool = False
+
+        # token -> token id, ids are indexes of token_list
+        self.token_id_dict: dict[str, int] = {}
+        self.token_list: list[str] = []
+
+        self._separator_pattern: re.Pattern | None = None
+        self.get_word_tuple = lru_cache(maxsize=TOKENIZER_CACHE_SIZE)(self.tokenize)
+        self.get_token_id_array = lru_cache(maxsize=TOKENIZER_CACHE_SIZE)(self.create_token_id_array)
+
+    @staticmethod
+    def from_dict(data: dict) -> "Tokenizer":
+        obj = Tokenizer()
+        obj.separators = data.get("separators", obj.separators)
+        obj.split_camel_case = data.get("split_camel_case", obj.split_camel_case)
+        obj.split_digits = data.get("split_digits", obj.split_digits)
+        obj.stop_words = set(word.lower() for word in data.get("stop_words", []))
+        obj.stemming = data.get("stemming", obj.stemming)
+        if len(obj.separators) > 1:
+            obj._separator_pattern = re.compile(f"[{re.escape(obj.separators)}]")
+        return obj
+
+    def split(self, name: str) -> list[str]:
+        if self._separator_pattern is not None:
+            return self._separator_pattern.split(name)
+        if len(self.separators) == 1:
+            return name.split(self.separators)
+        return [name]
+
+    def tokenize(self, name: str) -> tuple[str, ...]:
+        word_list = self.split(name)
+        if self.split_camel_case:
+            word_list = [part for word in word_list for part in CAMEL_CASE_SPLIT_PATTERN.split(word)]
+        if self.split_digits:
+            word_list = [part for word in word_list for part in DIGIT_SPLIT_PATTERN.split(word)]
+        word_list = [word.lower() for word in word_list]
+        if len(self.stop_words) > 0:
+            word_list = [word for word in word_list if word not in self.stop_words]
+        if self.stemming:
+            word_list = [self.stem(word) for word in word_list]
+        return tuple(word_list)
+
+    @staticmethod
+    def stem(word: str) -> str:
+        for suffix, replacement in STEM_SUFFIX_LIST:
+            if word.endswith(suffix) and len(word) - len(suffix) + len(replacement) >= STEM_MIN_LENGTH:
+                if suffix == "s" and word.endswith("ss"):
+                    return word
+                return word[:-len(suffix)] + replacement
+        return word
+
+    def get_token_id(self, token: str) -> int:
+        token_id = self.token_id_dict.get(token, None)
+        if token_id is None:
+            token_id = len(self.token_list)
+            self.token_id_dict[token] = token_id
+            self.token_list.append(token)
+        return token_id
+
+    # token ids of name in word order, read only since it is shared by the cache
+    def create_token_id_array(self, name: str) -> np.ndarray:
+        token_id_array = np.fromiter(
+            (self.get_token_id(word) for word in self.get_word_tuple(name)), dtype=np.int32
+        )
+        token_id_array.setflags(write=False)
+        return token_id_array
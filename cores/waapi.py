@@ -1,28 +1,125 @@
+import contextvars
+import queue
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
 from waapi import WaapiClient
 
+from cores.switch_group_cache import SwitchGroupCache
 from log import LOGGER
-from models.wwise_object import WwiseObject, WwiseProjectInfo, WwiseSwitchContainerAssignmentEntry
+from models.wwise_object import WwiseObject, WwiseProjectInfo, WwiseSwitchContainerAssignmentEntry, \
+    WwiseSwitchContainerInfo
 
 
 class WaapiWampClient(object):
 
+    # max object count in "from object" of one waql query
+    WAQL_OBJECT_CHUNK_SIZE = 200
+
+    # seconds a call waits for an idle session before it fails
+    IDLE_SESSION_TIMEOUT = 120.0
+
     def __init__(self):
         self._waapi_client: WaapiClient | None = None
+        self._url: str = ""
+        self._connection_count: int = 1
+        self._subscription_count: int = 0
 
-    def connect(self, url: str) -> bool:
+        # one waapi session handles one call at a time,
+        # extra sessions are opened to keep several calls in flight
+        self._waapi_client_list: list[WaapiClient] = []
+        self._idle_waapi_client_queue: queue.Queue[WaapiClient] = queue.Queue()
+        self._executor: ThreadPoolExecutor | None = None
+
+    # connection_count: count of waapi sessions used by concurrent calls
+    def connect(self, url: str, connection_count: int = 1) -> bool:
+        self._url = url
+        self._connection_count = connection_count
         self._waapi_client = WaapiClient(url=url)
         if not self._waapi_client.is_connected():
             LOGGER.error("Cannot connect to WAAPI.")
             self._waapi_client = None
             return False
+        self._waapi_client_list.append(self._waapi_client)
+
+        for _ in range(connection_count - 1):
+            waapi_client = WaapiClient(url=url)
+            if not waapi_client.is_connected():
+                LOGGER.warning(f"Cannot open more WAAPI connections. "
+                               f"Using {len(self._waapi_client_list)} connections.")
+                break
+            self._waapi_client_list.append(waapi_client)
+
+        for waapi_client in self._waapi_client_list:
+            self._idle_waapi_client_queue.put(waapi_client)
+        if len(self._waapi_client_list) > 1:
+            self._executor = ThreadPoolExecutor(max_workers=len(self._waapi_client_list))
         return True
 
     def disconnect(self):
-        if self._waapi_client is not None:
-            self._waapi_client.disconnect()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for waapi_client in self._waapi_client_list:
+            waapi_client.disconnect()
+        self._waapi_client_list.clear()
+        self._idle_waapi_client_queue = queue.Queue()
+        self._waapi_client = None
+        self._subscription_count = 0
+
+    def is_connected(self) -> bool:
+        return self._waapi_client is not None and self._waapi_client.is_connected()
+
+    # connect again with url and connection count of last connect
+    def reconnect(self) -> bool:
+        self.disconnect()
+        return self.connect(self._url, self._connection_count)
+
+    # callback is called in another thread
+    def subscribe(self, topic: str, callback: Callable) -> bool:
+        if self._waapi_client is None:
+            return False
+        event_handler = self._waapi_client.subscribe(topic, callback)
+        if event_handler is None:
+            return False
+        self._subscription_count += 1
+        return True
+
+    def has_subscriptions(self) -> bool:
+        return self._subscription_count > 0
+
+    # call waapi with an idle session
+    # return: None if not connected or no session is idle in time, same as a failed call
+    def call(self, uri: str, args: dict = None) -> dict | None:
+        if len(self._waapi_client_list) == 0:
+            LOGGER.error(f"Cannot call {uri}. WAAPI is not connected.")
+            return None
+        # sessions of this connection go back to its own queue, even if reconnected meanwhile
+        idle_waapi_client_queue = self._idle_waapi_client_queue
+        try:
+            waapi_client = idle_waapi_client_queue.get(timeout=self.IDLE_SESSION_TIMEOUT)
+        except queue.Empty:
+            LOGGER.error(f"Cannot call {uri}. No WAAPI session is idle in {self.IDLE_SESSION_TIMEOUT:.0f}s.")
+            return None
+        try:
+            if args is None:
+                return waapi_client.call(uri)
+            return waapi_client.call(uri, args)
+        finally:
+            idle_waapi_client_queue.put(waapi_client)
+
+    # run func with every args in arg_list, concurrently if several sessions are connected
+    # every call runs in a copy of the caller context, so context variables like profiler stage are kept
+    # return: results in order of arg_list
+    def call_concurrently(self, func: Callable, arg_list: list[tuple]) -> list:
+        if self._executor is None or len(arg_list) <= 1:
+            return [func(*args) for args in arg_list]
+        future_list = [self._executor.submit(contextvars.copy_context().run, func, *args) for args in arg_list]
+        return [future.result() for future in future_list]
 
     def get_project_info(self) -> WwiseProjectInfo | None:
-        result = self._waapi_client.call("ak.wwise.core.getProjectInfo")
+        result = self.call("ak.wwise.core.getProjectInfo")
         if not isinstance(result, dict):
             return None
         return WwiseProjectInfo.from_dict(result)
@@ -35,7 +132,7 @@ class WaapiWampClient(object):
         if return_key_list is None:
             return_key_list = ["name", "id", "type", "path"]
 
-        result = self._waapi_client.call(
+        result = self.call(
             "ak.wwise.core.object.get",
             {
                 "waql": waql_query,
@@ -53,15 +150,138 @@ class WaapiWampClient(object):
             LOGGER.error(f"Cannot get object info by WAAPI. Return field is not a list.")
             return []
 
-        wwise_object_list: list[WwiseObject] = [
-            WwiseObject.from_dict(obj_info)
-            for obj_info in object_info_list
-        ]
+        wwise_object_list: list[WwiseObject] = WwiseObject.from_dict_list(object_info_list)
+
+        return wwise_object_list
+
+    # query objects with "from object" of every id, split into chunks to keep waql short
+    def query_waql_from_objects(
+        self,
+        object_id_list: list[str],
+        waql_select: str = "",
+        return_key_list: list[str] = None
+    ) -> list[WwiseObject]:
+        waql_arg_list: list[tuple[str, list[str]]] = []
+        for chunk_start in range(0, len(object_id_list), self.WAQL_OBJECT_CHUNK_SIZE):
+            chunk_id_list = object_id_list[chunk_start:chunk_start + self.WAQL_OBJECT_CHUNK_SIZE]
+            waql = "from object " + ", ".join(f'"{object_id}"' for object_id in chunk_id_list)
+            if len(waql_select) > 0:
+                waql += f" {waql_select}"
+            waql_arg_list.append((waql, return_key_list))
 
+        wwise_object_list: list[WwiseObject] = []
+        for chunk_object_list in self.call_concurrently(self.query_waql, waql_arg_list):
+            wwise_object_list.extend(chunk_object_list)
         return wwise_object_list
 
+    # objects of ids which still exist, in order of ids
+    # "from object" fails for every id if any id does not exist, so ids of a chunk with missing objects are queried one by one
+    def query_existing_objects(self, object_id_list: list[str]) -> list[WwiseObject]:
+        chunk_id_list_list = [
+            object_id_list[chunk_start:chunk_start + self.WAQL_OBJECT_CHUNK_SIZE]
+            for chunk_start in range(0, len(object_id_list), self.WAQL_OBJECT_CHUNK_SIZE)
+        ]
+        object_dict: dict[str, WwiseObject] = {}
+        missing_id_list: list[str] = []
+        for chunk_id_list, chunk_object_list in zip(chunk_id_list_list, self.call_concurrently(
+            self.query_waql,
+            [("from object " + ", ".join(f'"{object_id}"' for object_id in chunk_id_list),)
+             for chunk_id_list in chunk_id_list_list]
+        )):
+            object_dict.update((wwise_object.id, wwise_object) for wwise_object in chunk_object_list)
+            missing_id_list.extend(object_id for object_id in chunk_id_list if object_id not in object_dict)
+
+        for object_id, wwise_object_list in zip(missing_id_list, self.call_concurrently(
+            self.query_waql,
+            [(f'from project where id = "{object_id}"',) for object_id in missing_id_list]
+        )):
+            if len(wwise_object_list) == 0:
+                LOGGER.error(f"Object {object_id} not found with waapi.")
+                continue
+            object_dict[object_id] = wwise_object_list[0]
+        return [object_dict[object_id] for object_id in object_id_list if object_id in object_dict]
+
+    # collect switch group, switches, children and assignments of many switch containers
+    # with a few wide queries instead of several queries for each container
+    # switch groups already in switch_group_cache are not queried again
+    # return: switch container id -> info
+    def get_switch_container_info_dict(
+        self,
+        switch_container_list: list[WwiseObject],
+        switch_group_cache: SwitchGroupCache | None = None
+    ) -> dict[str, WwiseSwitchContainerInfo]:
+        info_dict: dict[str, WwiseSwitchContainerInfo] = {}
+        for switch_container_obj in switch_container_list:
+            info_dict[switch_container_obj.id] = WwiseSwitchContainerInfo(switch_container_obj)
+        if len(info_dict) == 0:
+            return info_dict
+        container_id_list = list(info_dict.keys())
+
+        # get switch group of every container
+        container_with_group_list = self.query_waql_from_objects(
+            container_id_list,
+            return_key_list=["name", "id", "type", "path", "@SwitchGroupOrStateGroup"]
+        )
+        group_id_to_container_id_list: dict[str, list[str]] = {}
+        for container_obj in container_with_group_list:
+            if container_obj.id not in info_dict or len(container_obj.switch_group_id) == 0:
+                continue
+            group_id_to_container_id_list.setdefault(container_obj.switch_group_id, []).append(container_obj.id)
+
+        # get switch groups and their switches, skip cached switch groups
+        group_object_dict: dict[str, WwiseObject] = {}
+        group_switch_dict: dict[str, list[WwiseObject]] = {}
+        group_id_list: list[str] = []
+        for group_id in group_id_to_container_id_list.keys():
+            cache_entry = switch_group_cache.get(group_id) if switch_group_cache is not None else None
+            if cache_entry is None:
+                group_id_list.append(group_id)
+                continue
+            group_object_dict[group_id] = cache_entry.switch_group_object
+            group_switch_dict[group_id] = cache_entry.switch_object_list
+        if len(group_id_list) > 0:
+            for group_obj in self.query_waql_from_objects(group_id_list):
+                group_object_dict[group_obj.id] = group_obj
+            for switch_obj in self.query_waql_from_objects(
+                group_id_list, "select children",
+                return_key_list=["name", "id", "type", "path", "parent"]
+            ):
+                group_switch_dict.setdefault(switch_obj.parent_id, []).append(switch_obj)
+
+        for group_id, group_container_id_list in group_id_to_container_id_list.items():
+            group_obj = group_object_dict.get(group_id, None)
+            if group_obj is None:
+                continue
+            switch_object_list = group_switch_dict.get(group_id, [])
+            if switch_group_cache is not None:
+                switch_object_list = switch_group_cache.add(group_obj, switch_object_list).switch_object_list
+            for container_id in group_container_id_list:
+                info = info_dict[container_id]
+                info.switch_group_object = group_obj
+                info.switch_object_list = list(switch_object_list)
+
+        # get children of every container
+        for child_obj in self.query_waql_from_objects(
+            container_id_list, "select children",
+            return_key_list=["name", "id", "type", "path", "parent"]
+        ):
+            info = info_dict.get(child_obj.parent_id, None)
+            if info is not None:
+                info.container_child_list.append(child_obj)
+
+        # assignments can only be got by container, skip containers without switch group
+        assignment_info_list = [info for info in info_dict.values() if info.switch_group_object is not None]
+        assignment_list_list = self.call_concurrently(
+            self.get_switch_container_assignments,
+            [(info.switch_container_obj.id,) for info in assignment_info_list]
+        )
+        for info, assignment_list in zip(assignment_info_list, assignment_list_list):
+            info.assignment_list = assignment_list
+
+        return info_dict
+
     def get_switch_container_assignments(self, switch_container_id: str) -> list[WwiseSwitchContainerAssignmentEntry]:
-        result = self._waapi_client.call(
+        result = self.call(
             "ak.wwise.core.switchContainer.getAssignments",
             {
                 "id": switch_container_id
@@ -82,7 +302,7 @@ class WaapiWampClient(object):
         ]
 
     def set_switch_container_assignment(self, child_id: str, switch_id: str) -> bool:
-        result = self._waapi_client.call(
+        result = self.call(
             "ak.wwise.core.switchContainer.addAssignment",
             {
                 "child": child_id,
@@ -94,7 +314,7 @@ class WaapiWampClient(object):
         return isinstance(result, dict) and len(result) == 0
 
     def remove_switch_container_assignment(self, child_id: str, switch_id: str) -> bool:
-        result = self._waapi_client.call(
+        result = self.call(
             "ak.wwise.core.switchContainer.removeAssignment",
             {
                 "child": child_id,
@@ -104,3 +324,49 @@ class WaapiWampClient(object):
 
         # result is an empty dict if succeeded
         return isinstance(result, dict) and len(result) == 0
+
+    # assign every (child id, switch id) pair, return result of each pair
+    def set_switch_container_assignment_list(self, assignment_list: list[tuple[str, str]]) -> list[bool]:
+        return self.call_concurrently(self.set_switch_container_assignment, assignment_list)
+
+    # remove every (child id, switch id) pair, return result of each pair
+    def remove_switch_container_assignment_list(self, assignment_list: list[tuple[str, str]]) -> list[bool]:
+        return self.call_concurrently(self.remove_switch_container_assignment, assignment_list)
+
+    def begin_undo_group(self) -> bool:
+        result = self.call("ak.wwise.core.undo.beginGroup")
+        return isinstance(result, dict)
+
+    def end_undo_group(self, display_name: str) -> bool:
+        result = self.call("ak.wwise.core.undo.endGroup", {"displayName": display_name})
+        return isinstance(result, dict)
+
+    # cancel the undo group and revert operations made in it
+    def cancel_undo_group(self) -> bool:
+        result = self.call("ak.wwise.core.undo.cancelGroup", {"rollback": True})
+        return isinstance(result, dict)
+
+    # automation mode disables some UI refresh and dialogs of wwise authoring while running
+    def enable_automation_mode(self, enable: bool) -> bool:
+        result = self.call("ak.wwise.debug.enableAutomationMode", {"enable": enable})
+        return isinstance(result, dict)
+
+    # all operations in the block are committed as one undo step,
+    # or reverted if an exception is raised
+    @contextmanager
+    def undo_group(self, display_name: str, automation_mode: bool = False):
+        if automation_mode and not self.enable_automation_mode(True):
+            LOGGER.warning("Cannot enable automation mode.")
+        if not self.begin_undo_group():
+            LOGGER.warning("Cannot begin undo group.")
+        try:
+            yield
+        except BaseException:
+            LOGGER.error(f"Reverting undo group {display_name}...")
+            self.cancel_undo_group()
+            raise
+        else:
+            self.end_undo_group(display_name)
+        finally:
+            if automation_mode:
+                self.enable_automation_mode(False)
@@ -1,28 +1,64 @@
 import os
+import re
 import sys
+import time
 import argparse
+import contextlib
+import multiprocessing
+from concurrent.futures import Future
+from typing import Callable, Iterator
 
+from cores.assign_plan import AssignPlanEntry, AssignPlanWriter, read_assign_plan
+from cores.assignment_solver import ASSIGNMENT_SOLVER, GREEDY_ASSIGNMENT_SOLVER
+from cores.match_cache import MatchCache
+from cores.server import AssignServer
+from cores.server_protocol import DEFAULT_SERVER_PORT
+from cores.session import AssignSession
 from cores.waapi import WaapiWampClient
-from cores.match import SwitchChildrenMatcher, SwitchChildrenInclusionMatcher, \
-    SwitchChildrenTfidfMatcher, SwitchChildrenLevenshteinMatcher
-from log import LOGGER, CLEAN_LOGGER
+from cores.match import SwitchChildrenMatcher
+from cores.match_registry import MATCH_METHOD, get_matcher_class
+from cores.name_alias import NameAliasReplacer
+from cores.pipeline import StreamPipeline
+from cores.prefix_cut import ParentPrefixCutter
+from cores.score_pool import ScorePool, ScoreResult, ScoreTask
+from cores.profiler import Profiler
+from log import LOGGER, CLEAN_LOGGER, LOG_DIR_PATH
 from models.auto_assign_result import AutoAssignTask, AutoAssignTaskStatus
-from models.wwise_object import WwiseObject, WwiseObjectType, WwiseProjectInfo
+from models.wwise_object import WwiseObject, WwiseObjectType, WwiseProjectInfo, WwiseSwitchContainerInfo
 from models.config import UserConfig
 
 WAAPI_PORT = 8080
-WAAPI_CLIENT: WaapiWampClient | None = None
+WAAPI_CONNECTION_COUNT = 1
+UNDO_GROUP_NAME = "Switch Auto Assign"
+MATCH_CACHE_FILE_NAME = "match_cache.json"
+PROFILE_FILE_NAME = "profile.json"
+PLAN_FILE_NAME = "assign_plan.jsonl"
+CPROFILE_TOP_COUNT = 30
+
+# switch containers prefetched by one group of wide queries, and containers waiting between two pipeline stages
+PIPELINE_PREFETCH_CHUNK_SIZE = 16
+PIPELINE_QUEUE_SIZE = 32
 
-# method_name -> (method, min_value)
-MATCH_METHOD: dict[str, type[SwitchChildrenMatcher]] = {
-    "tfidf": SwitchChildrenTfidfMatcher,
-    "levenshtein": SwitchChildrenLevenshteinMatcher,
-    "inclusion": SwitchChildrenInclusionMatcher,
-}
+# how to handle assignments not matching expected switch
+OVERWRITE_POLICY_NEVER = "never"
+OVERWRITE_POLICY_ALWAYS = "always"
+OVERWRITE_POLICY_ASK = "ask"
+OVERWRITE_POLICY_LIST = [OVERWRITE_POLICY_NEVER, OVERWRITE_POLICY_ALWAYS, OVERWRITE_POLICY_ASK]
+
+# how to output matching matrix of every switch container
+MATRIX_OUTPUT_OFF = "off"
+MATRIX_OUTPUT_TOP_K = "top_k"
+MATRIX_OUTPUT_FULL = "full"
+MATRIX_OUTPUT_LIST = [MATRIX_OUTPUT_OFF, MATRIX_OUTPUT_TOP_K, MATRIX_OUTPUT_FULL]
+MATRIX_TOP_K = 3
+MATRIX_OUTPUT_DIR = os.path.join(LOG_DIR_PATH, "matrix")
+WAAPI_CLIENT: WaapiWampClient | None = None
 
 
 def print_assign_result(assign_result: AutoAssignTask):
-    if assign_result.status.value >= AutoAssignTaskStatus.Assigned.value:
+    # pending tasks are only left by dry run, they would be assigned
+    if assign_result.status.value >= AutoAssignTaskStatus.Assigned.value \
+            or assign_result.status == AutoAssignTaskStatus.Pending:
         CLEAN_LOGGER.info(f"{assign_result.status.name}: "
                           f"{assign_result.wwise_object.name} "
                           f"-> {assign_result.expect_switch_name}")
@@ -37,113 +73,367 @@ def print_assign_result(assign_result: AutoAssignTask):
                                f"{assign_result.wwise_object.name}")
 
 
-def main() -> int:
-
-    global WAAPI_CLIENT
-
-    # parse args
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     parser.add_argument("--project_root", type=str,
                         help="Project root path to check if WAAPI is connected to the correct project.")
-    parser.add_argument("--object_id", type=str, help="Object ID to handle.")
+    parser.add_argument("--object_id", type=str, nargs="+", default=[], help="Object IDs to handle.")
+    parser.add_argument("--object_id_file", type=str,
+                        help="File of object IDs to handle, one ID per line.")
     parser.add_argument("--match_method", type=str, default="tfidf", choices=MATCH_METHOD.keys(),
                         help=f"Method to match names of switch and switch container child. "
                              f"Choices: {', '.join(MATCH_METHOD.keys())}.")
     parser.add_argument("--recursive", action="store_true", help="Handle object recursively.")
+    parser.add_argument("--only_unassigned", action="store_true",
+                        help="Only match and assign children not assigned to any switch.")
+    parser.add_argument("--assignment_solver", type=str, default=GREEDY_ASSIGNMENT_SOLVER,
+                        choices=[GREEDY_ASSIGNMENT_SOLVER] + list(ASSIGNMENT_SOLVER.keys()),
+                        help="Method to choose switch of every child with match scores. "
+                             "greedy: best switch per child; argmax: vectorized greedy; "
+                             "hungarian: optimal one-to-one assignment of switches and children.")
     parser.add_argument("--user_config", type=str, help="User config file path.")
-    args = parser.parse_args()
+    parser.add_argument("--waapi_connections", type=int, default=WAAPI_CONNECTION_COUNT,
+                        help="Count of WAAPI connections to keep several calls in flight.")
+    parser.add_argument("--no_match_cache", action="store_true",
+                        help=f"Do not reuse or save match scores in {MATCH_CACHE_FILE_NAME} next to user config.")
+    parser.add_argument("--no_undo_group", action="store_true",
+                        help="Do not wrap all assignments in one undo group.")
+    parser.add_argument("--automation_mode", action="store_true",
+                        help="Enable WAAPI automation mode while assigning.")
+    parser.add_argument("--overwrite_policy", type=str, choices=OVERWRITE_POLICY_LIST,
+                        help="Whether to overwrite assignments not matching expected switch. "
+                             "Default: never in batch mode, ask otherwise.")
+    parser.add_argument("--batch", action="store_true",
+                        help="Run without waiting for any keyboard input.")
+    parser.add_argument("--serve", action="store_true",
+                        help="Keep running and handle jobs sent by client.py, other args are given by every job.")
+    parser.add_argument("--server_port", type=int, default=DEFAULT_SERVER_PORT,
+                        help="Local port of the resident server.")
+    parser.add_argument("--matrix_output", type=str, default=MATRIX_OUTPUT_TOP_K, choices=MATRIX_OUTPUT_LIST,
+                        help=f"off: no matching matrix; top_k: log best switches of every child; "
+                             f"full: write whole matrix of every switch container to a csv file "
+                             f"in --matrix_output_dir. Default: {MATRIX_OUTPUT_TOP_K}.")
+    parser.add_argument("--matrix_top_k", type=int, default=MATRIX_TOP_K,
+                        help="Count of best switches logged for every child in top_k matrix output.")
+    parser.add_argument("--matrix_output_dir", type=str, default=MATRIX_OUTPUT_DIR,
+                        help="Dir of csv files written by full matrix output.")
+    parser.add_argument("--score_processes", type=int, default=1,
+                        help="Count of processes scoring switch containers while main process assigns, "
+                             "1 scores in main process, 0 uses every CPU core. Default: 1.")
+    parser.add_argument("--dry_run", type=str, nargs="?", const=PLAN_FILE_NAME,
+                        help=f"Match every switch container without writing anything, and save the assignment plan "
+                             f"of every child to this path, csv if it ends with .csv, json lines otherwise. "
+                             f"Default path: {PLAN_FILE_NAME}.")
+    parser.add_argument("--apply_plan", type=str,
+                        help="Assign children as planned in a plan file saved by --dry_run, without matching. "
+                             "Object IDs are not needed.")
+    parser.add_argument("--profile", type=str, nargs="?", const=PROFILE_FILE_NAME,
+                        help=f"Print time of every stage and WAAPI call, and save them as json. "
+                             f"Default path: {PROFILE_FILE_NAME}.")
+    parser.add_argument("--cprofile", type=str,
+                        help="Save cProfile stats of the run to this path, readable by pstats.")
+    return parser.parse_args(argv)
+
+
+# one csv file per switch container, id keeps names shared by several containers apart
+def get_matrix_file_path(matrix_output_dir: str, switch_container_obj: WwiseObject) -> str:
+    file_name = re.sub(r"[^\w\-]", "_", f"{switch_container_obj.name}_{switch_container_obj.id.strip('{}')}")
+    return os.path.join(matrix_output_dir, f"{file_name}.csv")
+
+
+# read object ids of a file, one id per line, empty lines and lines starting with # are skipped
+def read_object_id_file(file_path: str) -> list[str]:
+    object_id_list: list[str] = []
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if len(line) == 0 or line.startswith("#"):
+                continue
+            object_id_list.append(line)
+    return object_id_list
+
+
+# handle switch containers of one run with the waapi session and caches of session
+# input_func: reads one answer of the user, the console of main process by default or the client of a server job
+def run_job(args: argparse.Namespace, session: AssignSession, input_func: Callable[[], str] = input) -> int:
+    profiler = Profiler(enabled=args.profile is not None)
+
+    cprofile = None
+    if args.cprofile is not None:
+        import cProfile
+        cprofile = cProfile.Profile()
+        cprofile.enable()
+
+    try:
+        with profiler.instrument_waapi_client(session.waapi_client):
+            return run_assign_job(args, session, profiler, input_func)
+    finally:
+        if cprofile is not None:
+            cprofile.disable()
+            save_cprofile(cprofile, args.cprofile)
+        if profiler.enabled:
+            profiler.print_summary()
+            profiler.dump(args.profile)
+
+
+def save_cprofile(cprofile, file_path: str):
+    import io
+    import pstats
+
+    cprofile.dump_stats(file_path)
+    stats_stream = io.StringIO()
+    pstats.Stats(cprofile, stream=stats_stream).sort_stats("cumulative").print_stats(CPROFILE_TOP_COUNT)
+    CLEAN_LOGGER.info(stats_stream.getvalue())
+    CLEAN_LOGGER.info(f"cProfile stats saved to {file_path}.")
+
+
+# collect switch containers of root objects, and their descendants if recursive
+# return: None if no root object is found
+def collect_switch_container_list(
+    waapi_client: WaapiWampClient,
+    object_id_list: list[str],
+    recursive: bool
+) -> list[WwiseObject] | None:
+    # get object info by waapi
+    if len(object_id_list) == 0:
+        LOGGER.error("No object ID to handle.")
+        return None
+    root_wwise_object_list: list[WwiseObject] = waapi_client.query_existing_objects(object_id_list)
+    if len(root_wwise_object_list) == 0:
+        return None
+
+    # collect switch container to be handled, containers under several roots are handled once
+    switch_container_dict: dict[str, WwiseObject] = {}
+    for root_wwise_object in root_wwise_object_list:
+        if root_wwise_object.type == WwiseObjectType.SwitchContainer:
+            switch_container_dict.setdefault(root_wwise_object.id, root_wwise_object)
+            LOGGER.debug(f"Collect root switch container: {root_wwise_object.name}")
+    if recursive:
+        wwise_object_list = waapi_client.query_waql_from_objects(
+            [root_wwise_object.id for root_wwise_object in root_wwise_object_list],
+            'select descendants where type = "SwitchContainer"'
+        )
+        for wwise_object in wwise_object_list:
+            switch_container_dict.setdefault(wwise_object.id, wwise_object)
+            LOGGER.debug(f"Collect descendant switch container: {wwise_object.name}")
+    return list(switch_container_dict.values())
+
+
+def run_assign_job(
+    args: argparse.Namespace,
+    session: AssignSession,
+    profiler: Profiler,
+    input_func: Callable[[], str] = input
+) -> int:
+
+    waapi_client: WaapiWampClient = session.waapi_client
 
     # args
     LOGGER.info("Parsing args...")
     project_root: str = args.project_root
-    object_id: str = args.object_id
+    object_id_list: list[str] = list(args.object_id)
+    if args.object_id_file is not None:
+        object_id_list.extend(read_object_id_file(args.object_id_file))
+    object_id_list = list(dict.fromkeys(object_id_list))
     recursive: bool = args.recursive
     match_method_str: str = args.match_method
-    match_method_matcher: type[SwitchChildrenMatcher] = MATCH_METHOD[match_method_str]
+    match_method_matcher: type[SwitchChildrenMatcher] = get_matcher_class(match_method_str)
+    assignment_solver: str = args.assignment_solver
+    only_unassigned: bool = args.only_unassigned
     user_config_path: str = args.user_config
+    use_match_cache: bool = not args.no_match_cache
+    use_undo_group: bool = not args.no_undo_group
+    automation_mode: bool = args.automation_mode
+    batch: bool = args.batch
+    overwrite_policy: str = args.overwrite_policy
+    matrix_output: str = args.matrix_output
+    matrix_top_k: int = max(1, args.matrix_top_k)
+    matrix_output_dir: str = args.matrix_output_dir
+    score_process_count: int = args.score_processes if args.score_processes > 0 else os.cpu_count() or 1
+    dry_run_plan_path: str | None = args.dry_run
+    apply_plan_path: str | None = args.apply_plan
+    if overwrite_policy is None:
+        overwrite_policy = OVERWRITE_POLICY_NEVER if batch else OVERWRITE_POLICY_ASK
+    elif batch and overwrite_policy == OVERWRITE_POLICY_ASK:
+        LOGGER.warning(f"Cannot ask for overwriting in batch mode. Use overwrite policy {OVERWRITE_POLICY_NEVER}.")
+        overwrite_policy = OVERWRITE_POLICY_NEVER
     for arg_name, arg_value in [
         ("project_root", project_root),
-        ("object_id", object_id),
+        ("object_id", object_id_list),
         ("recursive", recursive),
         ("match_method", match_method_str),
-        ("user_config", user_config_path)
+        ("only_unassigned", only_unassigned),
+        ("assignment_solver", assignment_solver),
+        ("user_config", user_config_path),
+        ("match_cache", use_match_cache),
+        ("undo_group", use_undo_group),
+        ("automation_mode", automation_mode),
+        ("batch", batch),
+        ("overwrite_policy", overwrite_policy),
+        ("matrix_output", matrix_output),
+        ("matrix_top_k", matrix_top_k),
+        ("matrix_output_dir", matrix_output_dir),
+        ("score_processes", score_process_count),
+        ("dry_run", dry_run_plan_path),
+        ("apply_plan", apply_plan_path),
+        ("profile", args.profile),
+        ("cprofile", args.cprofile)
     ]:
         LOGGER.debug(f"{arg_name}: {arg_value}")
 
-    # load user config
-    LOGGER.info("Loading user config...")
-    user_config: UserConfig = UserConfig()
-    user_config.load(user_config_path)
-    user_config.save(user_config_path)  # save to add new config keys if not exist
-
-    # connect to waapi
-    WAAPI_CLIENT = WaapiWampClient()
-    if not WAAPI_CLIENT.connect(f"ws://127.0.0.1:{WAAPI_PORT}/waapi"):
-        LOGGER.error("Cannot connect to WAAPI.")
+    if dry_run_plan_path is not None and apply_plan_path is not None:
+        LOGGER.error("Cannot run dry run and apply plan at the same time.")
         return -1
 
-    # get project info by waapi
-    project_info: WwiseProjectInfo = WAAPI_CLIENT.get_project_info()
-    if project_info is None:
-        LOGGER.error("Cannot get project info by WAAPI.")
-        return -1
-    project_root_waapi = project_info.directories.root
-    if os.path.normpath(project_root) != os.path.normpath(project_root_waapi):
-        LOGGER.error(f"Project root not match. WAAPI is connected to: {project_root_waapi}")
-        return -1
-    LOGGER.info(f"WAAPI is connected to project root: {project_root}.")
+    with profiler.stage("config"):
+        # load user config
+        LOGGER.info("Loading user config...")
+        user_config: UserConfig = UserConfig()
+        user_config.load(user_config_path)
+        user_config.save(user_config_path)  # save to add new config keys if not exist
+        name_alias_replacer = NameAliasReplacer(
+            user_config.object_name_replacement, user_config.object_name_regex_replacement
+        )
+        prefix_cutter = ParentPrefixCutter(user_config.special_switch_group_cut_words)
+        session.check_user_config(user_config)
+        # token ids in cached switch groups are only valid with the tokenizer of the session
+        tokenizer = session.tokenizer
 
-    # get object info by waapi
-    waql = f'from project where id = "{object_id}"'
-    wwise_object_list = WAAPI_CLIENT.query_waql(waql)
-    if len(wwise_object_list) == 0:
-        LOGGER.error(f"Object {object_id} not found with waapi.")
-        return -1
-    root_wwise_object = wwise_object_list[0]
+        # load match cache saved by last runs
+        match_cache_path = os.path.join(os.path.dirname(user_config_path), MATCH_CACHE_FILE_NAME)
+        match_cache: MatchCache = session.get_match_cache(match_cache_path) if use_match_cache else MatchCache()
 
-    # collect switch container to be handled
-    switch_container_list: list[WwiseObject] = []
-    if root_wwise_object.type == WwiseObjectType.SwitchContainer:
-        switch_container_list.append(root_wwise_object)
-        LOGGER.debug(f"Collect root switch container: {root_wwise_object.name}")
-    if recursive:
-        waql = f'from object "{object_id}" select descendants where type = "SwitchContainer"'
-        wwise_object_list = WAAPI_CLIENT.query_waql(waql)
-        for wwise_object in wwise_object_list:
-            switch_container_list.append(wwise_object)
-            LOGGER.debug(f"Collect descendant switch container: {wwise_object.name}")
+    if matrix_output == MATRIX_OUTPUT_FULL:
+        os.makedirs(matrix_output_dir, exist_ok=True)
+
+    with profiler.stage("project_check"):
+        # get project info by waapi
+        project_info: WwiseProjectInfo = waapi_client.get_project_info()
+        if project_info is None:
+            LOGGER.error("Cannot get project info by WAAPI.")
+            return -1
+        project_root_waapi = project_info.directories.root
+        if os.path.normpath(project_root) != os.path.normpath(project_root_waapi):
+            LOGGER.error(f"Project root not match. WAAPI is connected to: {project_root_waapi}")
+            return -1
+        LOGGER.info(f"WAAPI is connected to project root: {project_root}.")
 
-    # handle each switch container
+    # switch container id -> plan entries of its children, only filled if applying a plan
+    plan_entry_dict: dict[str, list[AssignPlanEntry]] = {}
+    # planned children which cannot be assigned, set by pipeline stages and read after the pipeline
+    skipped_plan_entry_count: int = 0
+    with profiler.stage("collect"):
+        if apply_plan_path is not None:
+            # switch containers of the plan, their switches, children and assignments are got again by prefetch
+            LOGGER.info(f"Reading assignment plan {apply_plan_path}...")
+            for plan_entry in read_assign_plan(apply_plan_path):
+                plan_entry_dict.setdefault(plan_entry.container_id, []).append(plan_entry)
+            # containers deleted since the dry run would fail the prefetch of every container in their chunk
+            switch_container_list: list[WwiseObject] = [
+                wwise_object for wwise_object in waapi_client.query_existing_objects(list(plan_entry_dict.keys()))
+                if wwise_object.type == WwiseObjectType.SwitchContainer
+            ]
+            existing_container_id_set = set(wwise_object.id for wwise_object in switch_container_list)
+            for container_id, container_plan_entry_list in plan_entry_dict.items():
+                if container_id in existing_container_id_set:
+                    continue
+                apply_entry_count = sum(1 for plan_entry in container_plan_entry_list if plan_entry.need_apply())
+                skipped_plan_entry_count += apply_entry_count
+                LOGGER.error(f"Switch container {container_plan_entry_list[0].container_name}({container_id}) "
+                             f"of the plan is not found. Skip its {apply_entry_count} planned children.")
+        else:
+            switch_container_list: list[WwiseObject] | None = collect_switch_container_list(
+                waapi_client, object_id_list, recursive
+            )
+            if switch_container_list is None:
+                return -1
+        # switch groups shared by containers are queried and indexed once
+        switch_group_cache = session.switch_group_cache
+
+    # handle switch containers as a stream: prefetch -> score -> assign
+    # container N + 1 is prefetched while container N is scored and container N - 1 is assigned,
+    # at most PIPELINE_QUEUE_SIZE containers wait between two stages whatever the project size is
+    # all assignments of the run are one undo step in wwise
     LOGGER.info(f"Start handling {len(switch_container_list)} switch containers...")
     all_assign_result_list: list[AutoAssignTask] = []
-    for switch_container_object in switch_container_list:
-        LOGGER.info(f"Handling switch container: {switch_container_object.name}")
-        match_method_matcher_instance = match_method_matcher(
-            switch_container_obj=switch_container_object,
-            user_config=user_config,
-            waapi_client=WAAPI_CLIENT
-        )
+    assign_time: float = 0.0
 
-        # generate match matrix
-        match_method_matcher_instance.query_switch_container()
-        match_method_matcher_instance.apply_name_alias()
-        match_method_matcher_instance.create_object_word_mapping()
-        match_method_matcher_instance.cal_match_score_matrix()
-        matching_matrix_text = match_method_matcher_instance.get_matching_matrix_text()
-        CLEAN_LOGGER.info(f"Matching matrix:\n{matching_matrix_text}")
+    def create_matcher(
+        switch_container_object: WwiseObject,
+        switch_container_info: WwiseSwitchContainerInfo | None,
+        profile_scope: str
+    ) -> SwitchChildrenMatcher:
+        with profiler.stage("query", profile_scope):
+            matcher = match_method_matcher(
+                switch_container_obj=switch_container_object,
+                user_config=user_config,
+                waapi_client=waapi_client,
+                switch_container_info=switch_container_info,
+                switch_group_cache=switch_group_cache,
+                name_alias_replacer=name_alias_replacer,
+                tokenizer=tokenizer,
+                prefix_cutter=prefix_cutter
+            )
+            matcher.query_switch_container()
+            if only_unassigned:
+                matcher.drop_assigned_children()
+        return matcher
 
-        # run assign
-        match_method_matcher_instance.prepare_assign_task()
-        match_method_matcher_instance.run_all_assign_tasks()
+    # generate match matrix in main process
+    def score_matcher(matcher: SwitchChildrenMatcher, profile_scope: str):
+        with profiler.stage("alias", profile_scope):
+            matcher.apply_name_alias()
+        with profiler.stage("tokenize", profile_scope):
+            matcher.create_object_word_mapping()
+            matcher.cut_parent_name_prefix()
+        with profiler.stage("score", profile_scope):
+            if use_match_cache:
+                matcher.cal_match_score_matrix_with_cache(match_cache)
+            else:
+                matcher.cal_match_score_matrix()
 
-        # check assign result
-        LOGGER.info(f"Checking assign result for {switch_container_object.name}...")
+    def output_matrix(matcher: SwitchChildrenMatcher, profile_scope: str):
+        with profiler.stage("matrix_output", profile_scope):
+            if matrix_output == MATRIX_OUTPUT_TOP_K:
+                top_match_text = matcher.get_top_match_text(matrix_top_k)
+                CLEAN_LOGGER.info(f"Top {matrix_top_k} matches:\n{top_match_text}")
+            elif matrix_output == MATRIX_OUTPUT_FULL:
+                matrix_file_path = get_matrix_file_path(matrix_output_dir, matcher.switch_container_obj)
+                matcher.write_matching_matrix_csv(matrix_file_path)
+                LOGGER.info(f"Matching matrix saved to {matrix_file_path}.")
+
+    # print assign tasks of a switch container and keep them for summary
+    def collect_assign_results(matcher: SwitchChildrenMatcher) -> list[AutoAssignTask]:
+        LOGGER.info(f"Checking assign result for {matcher.switch_container_obj.name}...")
         assign_task_list = sorted(
-            match_method_matcher_instance.assign_task_dict.values(),
+            matcher.assign_task_dict.values(),
             key=lambda x: x.status.value, reverse=True
         )
         for assign_task in assign_task_list:
             print_assign_result(assign_task)
+        all_assign_result_list.extend(assign_task_list)
+        return assign_task_list
+
+    # output matrix, assign and check results of a scored switch container
+    def assign_matcher(
+        matcher: SwitchChildrenMatcher,
+        profile_scope: str,
+        best_match_row_list: list[int] | None = None
+    ):
+        output_matrix(matcher, profile_scope)
+        with profiler.stage("assign", profile_scope):
+            matcher.prepare_assign_task(assignment_solver, best_match_row_list)
+        write_matcher(matcher, profile_scope)
+
+    # write prepared assign tasks of a switch container by waapi
+    def write_matcher(matcher: SwitchChildrenMatcher, profile_scope: str):
+        nonlocal assign_time
+        with profiler.stage("assign", profile_scope):
+            assign_start_time = time.perf_counter()
+            matcher.run_all_assign_tasks()
+            assign_time += time.perf_counter() - assign_start_time
+
+        assign_task_list = collect_assign_results(matcher)
 
         # let user decide if overwrite non-expected assignments
         unexpected_assign_list = [
@@ -151,14 +441,144 @@ def main() -> int:
             if result.status == AutoAssignTaskStatus.AlreadyAssignedUnexpect
         ]
         if len(unexpected_assign_list) > 0:
-            CLEAN_LOGGER.warning(
-                f"Found {len(unexpected_assign_list)} unexpected assignments. "
-                f"Overwrite them? (y/n, default: n)")
-            user_input = input()
-            if user_input.lower() == "y":
-                match_method_matcher_instance.run_all_assign_tasks(overwrite_unexpect=True)
+            overwrite_unexpect = overwrite_policy == OVERWRITE_POLICY_ALWAYS
+            if overwrite_policy == OVERWRITE_POLICY_ASK:
+                CLEAN_LOGGER.warning(
+                    f"Found {len(unexpected_assign_list)} unexpected assignments. "
+                    f"Overwrite them? (y/n, default: n)")
+                user_input = input_func()
+                overwrite_unexpect = user_input.lower() == "y"
+            else:
+                CLEAN_LOGGER.warning(
+                    f"Found {len(unexpected_assign_list)} unexpected assignments. "
+                    f"Overwrite policy: {overwrite_policy}.")
+            if overwrite_unexpect:
+                with profiler.stage("overwrite", profile_scope):
+                    assign_start_time = time.perf_counter()
+                    matcher.run_all_assign_tasks(overwrite_unexpect=True)
+                    assign_time += time.perf_counter() - assign_start_time
 
-        all_assign_result_list.extend(assign_task_list)
+    # output matrix and save assign tasks of a scored switch container to plan, without writing by waapi
+    # tasks to be written are kept Pending, already assigned children get the status they would get
+    def plan_matcher(
+        matcher: SwitchChildrenMatcher,
+        profile_scope: str,
+        best_match_row_list: list[int] | None = None
+    ):
+        output_matrix(matcher, profile_scope)
+        with profiler.stage("plan", profile_scope):
+            matcher.prepare_assign_task(assignment_solver, best_match_row_list)
+            for assign_task in matcher.assign_task_dict.values():
+                matcher.check_assign_task(assign_task)
+            expect_switch_score_dict = matcher.get_expect_switch_score_dict()
+            for assign_task in matcher.assign_task_dict.values():
+                plan_writer.write(AssignPlanEntry.from_assign_task(
+                    matcher.switch_container_obj, assign_task,
+                    expect_switch_score_dict.get(assign_task.wwise_object, None),
+                    matcher.assigned_child_to_switch_dict.get(assign_task.wwise_object, None)
+                ))
+        collect_assign_results(matcher)
+
+    # prefetch stage: switch group, switches, children and assignments of a chunk of switch containers
+    def prefetch_stage(switch_container_chunk: list[WwiseObject]) -> Iterator[SwitchChildrenMatcher]:
+        with profiler.stage("prefetch"):
+            switch_container_info_dict = waapi_client.get_switch_container_info_dict(
+                switch_container_chunk, switch_group_cache
+            )
+        for switch_container_object in switch_container_chunk:
+            yield create_matcher(
+                switch_container_object,
+                switch_container_info_dict.get(switch_container_object.id, None),
+                switch_container_object.path or switch_container_object.name
+            )
+
+    # score stage in main process
+    def score_stage(matcher: SwitchChildrenMatcher) -> list[tuple[SwitchChildrenMatcher, Future | None, dict | None]]:
+        score_matcher(matcher, matcher.switch_container_obj.path or matcher.switch_container_obj.name)
+        return [(matcher, None, None)]
+
+    # score stage sending containers to scoring processes, scores are waited by assign stage
+    def score_pool_stage(
+        matcher: SwitchChildrenMatcher
+    ) -> list[tuple[SwitchChildrenMatcher, Future | None, dict | None]]:
+        profile_scope = matcher.switch_container_obj.path or matcher.switch_container_obj.name
+        # alias names are only used by logs here
+        with profiler.stage("alias", profile_scope):
+            matcher.apply_name_alias()
+        column_dict = matcher.get_match_cache_column_dict(match_cache) if use_match_cache else None
+        future = score_pool.submit(ScoreTask(
+            matcher.switch_container_info, only_unassigned, assignment_solver, column_dict
+        ))
+        return [(matcher, future, column_dict)]
+
+    # score stage adding assign tasks of the plan instead of scoring
+    def apply_plan_stage(
+        matcher: SwitchChildrenMatcher
+    ) -> list[tuple[SwitchChildrenMatcher, Future | None, dict | None]]:
+        nonlocal skipped_plan_entry_count
+        # alias names are only used by logs here
+        with profiler.stage("alias", matcher.switch_container_obj.path or matcher.switch_container_obj.name):
+            matcher.apply_name_alias()
+        for plan_entry in plan_entry_dict.get(matcher.switch_container_obj.id, []):
+            if plan_entry.need_apply() and \
+                    not matcher.add_planned_assign_task(plan_entry.child_id, plan_entry.expect_switch_id):
+                skipped_plan_entry_count += 1
+        return [(matcher, None, None)]
+
+    use_score_pool = score_process_count > 1 and len(switch_container_list) > 1 and apply_plan_path is None
+    if use_score_pool:
+        LOGGER.info(f"Scoring with {score_process_count} processes...")
+    score_pool = ScorePool(score_process_count, match_method_str, user_config) if use_score_pool \
+        else contextlib.nullcontext()
+    # nothing is written in dry run
+    assign_undo_group = waapi_client.undo_group(UNDO_GROUP_NAME, automation_mode) \
+        if use_undo_group and dry_run_plan_path is None else contextlib.nullcontext()
+    plan_writer = AssignPlanWriter(dry_run_plan_path) if dry_run_plan_path is not None else contextlib.nullcontext()
+    if apply_plan_path is not None:
+        score_stage_func = apply_plan_stage
+    elif use_score_pool:
+        score_stage_func = score_pool_stage
+    else:
+        score_stage_func = score_stage
+    switch_container_chunk_list = [
+        switch_container_list[chunk_start:chunk_start + PIPELINE_PREFETCH_CHUNK_SIZE]
+        for chunk_start in range(0, len(switch_container_list), PIPELINE_PREFETCH_CHUNK_SIZE)
+    ]
+    with assign_undo_group, plan_writer, score_pool, StreamPipeline(
+        switch_container_chunk_list,
+        [prefetch_stage, score_stage_func],
+        PIPELINE_QUEUE_SIZE
+    ) as pipeline:
+        # assign stage in main thread, which may wait for keyboard input
+        for match_method_matcher_instance, score_future, column_dict in pipeline:
+            switch_container_object = match_method_matcher_instance.switch_container_obj
+            LOGGER.info(f"Handling switch container: {switch_container_object.name}")
+            profile_scope = switch_container_object.path or switch_container_object.name
+            best_match_row_list: list[int] | None = None
+            if score_future is not None:
+                # time of main process waiting for scoring processes
+                with profiler.stage("score_wait"):
+                    score_result: ScoreResult = score_future.result()
+                if column_dict is not None:
+                    column_dict.update(score_result.column_dict)
+                match_method_matcher_instance.match_score_matrix = score_result.match_score_matrix
+                best_match_row_list = score_result.best_match_row_list
+            if apply_plan_path is not None:
+                write_matcher(match_method_matcher_instance, profile_scope)
+            elif dry_run_plan_path is not None:
+                plan_matcher(match_method_matcher_instance, profile_scope, best_match_row_list)
+            else:
+                assign_matcher(match_method_matcher_instance, profile_scope, best_match_row_list)
+
+    # compare with --no_undo_group to see time saved by undo group and automation mode
+    if dry_run_plan_path is None:
+        LOGGER.info(f"Assignment took {assign_time:.3f}s "
+                    f"(undo group: {use_undo_group}, automation mode: {automation_mode}).")
+
+    # nothing is scored when applying a plan
+    if use_match_cache and apply_plan_path is None:
+        with profiler.stage("save_cache"):
+            match_cache.save(match_cache_path)
 
     # print all assign results
     LOGGER.info("Print all assign results...")
@@ -174,13 +594,48 @@ def main() -> int:
     for result_type, count in assign_result_count_dict.items():
         CLEAN_LOGGER.info(f"{result_type.name}: {count}")
 
+    if skipped_plan_entry_count > 0:
+        LOGGER.error(f"{skipped_plan_entry_count} planned children cannot be applied, see errors above.")
+        return -1
+    return 0
+
+
+def main(args: argparse.Namespace) -> int:
+
+    global WAAPI_CLIENT
+
+    # connect to waapi
+    WAAPI_CLIENT = WaapiWampClient()
+    if not WAAPI_CLIENT.connect(f"ws://127.0.0.1:{WAAPI_PORT}/waapi", max(1, args.waapi_connections)):
+        LOGGER.error("Cannot connect to WAAPI.")
+        return -1
+    session = AssignSession(WAAPI_CLIENT)
+
+    if not args.serve:
+        return run_job(args, session)
+
+    # run jobs sent by client until stopped, keyboard input of jobs is read by the client
+    session.watch_object_changes()
+
+    def run_server_job(argv: list[str], input_func: Callable[[], str]) -> int:
+        if not session.clear_outdated_cache():
+            return -1
+        return run_job(parse_args(argv), session, input_func)
+
+    with AssignServer(args.server_port, run_server_job) as server:
+        LOGGER.info(f"Server is listening on port {args.server_port}.")
+        server.serve_forever()
     return 0
 
 
 if __name__ == '__main__':
 
+    # scoring processes of packaged exe start by running the exe again
+    multiprocessing.freeze_support()
+
+    main_args = parse_args()
     try:
-        exit_code = main()
+        exit_code = main(main_args)
     except Exception as e:
         LOGGER.exception(e)
         exit_code = -1
@@ -189,5 +644,6 @@ if __name__ == '__main__':
         LOGGER.info("Disconnecting WAAPI client...")
         WAAPI_CLIENT.disconnect()
 
-    input(f"Finished with exit code {exit_code}. Press any key to exit...")
+    if not main_args.batch:
+        input(f"Finished with exit code {exit_code}. Press any key to exit...")
     sys.exit(exit_code)
@@ -10,6 +10,16 @@ class UserConfig(object):
         self.object_name_replacement: dict[str, str] = {
             "example_name_replacement_switch_auto_assigner": "example_new_name"
         }
+        # regex pattern -> replacement template, rules with groups or lookarounds are applied after the others
+        self.object_name_regex_replacement: dict[str, str] = {}
+        # options of splitting names into words, see cores.tokenizer.Tokenizer
+        self.tokenizer: dict = {
+            "separators": "_",
+            "split_camel_case": False,
+            "split_digits": False,
+            "stop_words": [],
+            "stemming": False,
+        }
         self.special_switch_group_cut_words: list[str] = [
             "write_switch_group_name_here",
             "and_switch_container_child_name_will_be_cut",
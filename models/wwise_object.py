@@ -1,3 +1,4 @@
+import sys
 from enum import Enum
 
 
@@ -11,29 +12,77 @@ class WwiseObjectType(Enum):
     Switch = 20
 
 
+# type name returned by waapi -> type
+WWISE_OBJECT_TYPE_DICT: dict[str, WwiseObjectType] = {obj_type.name: obj_type for obj_type in WwiseObjectType}
+
+NULL_GUID = "{00000000-0000-0000-0000-000000000000}"
+
+
+# objects of project-wide queries are many, so attributes are slotted
+# and ids are interned, the same guid returned by several queries is kept once in memory
 class WwiseObject(object):
 
+    __slots__ = ("id", "name", "type", "path", "parent_id", "switch_group_id")
+
     def __init__(self):
         self.id: str = ""
         self.name: str = ""
         self.type: WwiseObjectType = WwiseObjectType.Unknown
         self.path: str = ""
 
+        # only filled if "parent" or "@SwitchGroupOrStateGroup" is in the returned keys
+        self.parent_id: str = ""
+        self.switch_group_id: str = ""
+
     @staticmethod
     def from_dict(data: dict) -> "WwiseObject":
         obj = WwiseObject()
-        obj.id = data.get("id", "")
+        obj.id = sys.intern(data.get("id", ""))
         obj.name = data.get("name", "")
         obj.path = data.get("path", "")
-
-        object_type_str = data.get("type", "")
-        for obj_type in WwiseObjectType:
-            if obj_type.name == object_type_str:
-                obj.type = obj_type
-                break
-
+        obj.parent_id = WwiseObject.get_reference_id(data.get("parent", None))
+        obj.switch_group_id = WwiseObject.get_reference_id(data.get("@SwitchGroupOrStateGroup", None))
+        obj.type = WWISE_OBJECT_TYPE_DICT.get(data.get("type", ""), WwiseObjectType.Unknown)
         return obj
 
+    # same as from_dict for every item, for results of one query
+    # globals and attributes are looked up once and __init__ defaults are not assigned twice
+    @staticmethod
+    def from_dict_list(data_list: list[dict]) -> list["WwiseObject"]:
+        new_object = WwiseObject.__new__
+        get_reference_id = WwiseObject.get_reference_id
+        intern = sys.intern
+        type_dict_get = WWISE_OBJECT_TYPE_DICT.get
+        unknown_type = WwiseObjectType.Unknown
+
+        obj_list: list[WwiseObject] = []
+        append = obj_list.append
+        for data in data_list:
+            obj = new_object(WwiseObject)
+            get = data.get
+            obj.id = intern(get("id", ""))
+            obj.name = get("name", "")
+            obj.type = type_dict_get(get("type", ""), unknown_type)
+            obj.path = get("path", "")
+            obj.parent_id = get_reference_id(get("parent", None))
+            obj.switch_group_id = get_reference_id(get("@SwitchGroupOrStateGroup", None))
+            append(obj)
+        return obj_list
+
+    # reference value returned by waapi is an object like {"id": ..., "name": ...}
+    # return empty str if reference is not set
+    @staticmethod
+    def get_reference_id(reference_data: dict | str | None) -> str:
+        if isinstance(reference_data, dict):
+            reference_id = reference_data.get("id", "")
+        elif isinstance(reference_data, str):
+            reference_id = reference_data
+        else:
+            return ""
+        if reference_id == NULL_GUID:
+            return ""
+        return sys.intern(reference_id)
+
     def __str__(self):
         return f"{self.name} {self.id}"
 
@@ -160,6 +209,8 @@ class WwiseConversionInfo(object):
 
 class WwiseSwitchContainerAssignmentEntry(object):
 
+    __slots__ = ("child", "state_or_switch")
+
     def __init__(self):
         self.child: str = ""
         self.state_or_switch: str = ""
@@ -167,6 +218,17 @@ class WwiseSwitchContainerAssignmentEntry(object):
     @staticmethod
     def from_dict(data: dict) -> "WwiseSwitchContainerAssignmentEntry":
         obj = WwiseSwitchContainerAssignmentEntry()
-        obj.child = data.get("child", "")
-        obj.state_or_switch = data.get("stateOrSwitch", "")
+        obj.child = sys.intern(data.get("child", ""))
+        obj.state_or_switch = sys.intern(data.get("stateOrSwitch", ""))
         return obj
+
+
+# everything needed to match a switch container, queried by waapi
+class WwiseSwitchContainerInfo(object):
+
+    def __init__(self, switch_container_obj: WwiseObject):
+        self.switch_container_obj: WwiseObject = switch_container_obj
+        self.switch_group_object: WwiseObject | None = None
+        self.switch_object_list: list[WwiseObject] = []
+        self.container_child_list: list[WwiseObject] = []
+        self.assignment_list: list[WwiseSwitchContainerAssignmentEntry] = []
@@ -1,39 +1,115 @@
+import argparse
 import os
 import shutil
 import stat
 
 import PyInstaller.__main__
 
+from cores.match_registry import MATCHER_MODULE_LIST
+
 INPUT_PY = "main.py"
+CLIENT_INPUT_PY = "client.py"
 BUILD_CACHE_DIR = "__build_cache__"
 SPEC_DIR = os.path.join(BUILD_CACHE_DIR, "spec")
 WORK_DIR = os.path.join(BUILD_CACHE_DIR, "build")
 DIST_DIR = os.path.join(BUILD_CACHE_DIR, "dist")
 RELEASE_DIR = "."
 EXE_NAME = "SwitchAutoAssigner"
+CLIENT_EXE_NAME = "SwitchAutoAssignerClient"
 
+# onefile: one exe extracted to a temp dir on every launch
+# onedir: exe with unpacked libraries next to it, starts without extracting
+PACKAGE_PROFILE_ONEFILE = "onefile"
+PACKAGE_PROFILE_ONEDIR = "onedir"
+PACKAGE_PROFILE_LIST = [PACKAGE_PROFILE_ONEDIR, PACKAGE_PROFILE_ONEFILE]
 
-if __name__ == '__main__':
+# modules pulled by hooks of dependencies but never used
+EXCLUDE_MODULE_LIST = [
+    "tkinter",
+    "matplotlib",
+    "pandas",
+    "IPython",
+    "PIL",
+    "pytest",
+    "scipy.io",
+    "scipy.signal",
+    "scipy.stats",
+    "scipy.integrate",
+    "scipy.interpolate",
+    "scipy.ndimage",
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile", type=str, default=PACKAGE_PROFILE_ONEDIR, choices=PACKAGE_PROFILE_LIST,
+                        help="onedir starts faster, onefile is a single exe.")
+    return parser.parse_args()
 
-    # prepare build cache dir
-    os.makedirs(BUILD_CACHE_DIR, exist_ok=True)
 
-    # run pyinstaller
+def remove_path(path: str):
+    if os.path.isdir(path):
+        # remove read-only attribute of every file and remove dir
+        shutil.rmtree(path, onerror=lambda func, p, _: (os.chmod(p, stat.S_IWRITE), func(p)))
+    elif os.path.exists(path):
+        # remove read-only attribute and remove file
+        os.chmod(path, stat.S_IWRITE)
+        os.remove(path)
+
+
+def build(input_py: str, exe_name: str, profile: str, extra_params: list[str]):
     params = [
-        "-F", INPUT_PY,
-        "-n", EXE_NAME,
+        input_py,
+        "-n", exe_name,
         "--specpath", SPEC_DIR,
         "--distpath", DIST_DIR,
         "--workpath", WORK_DIR,
+        "--noconfirm",
     ]
+    params.append("-F" if profile == PACKAGE_PROFILE_ONEFILE else "-D")
+    PyInstaller.__main__.run(params + extra_params)
 
-    PyInstaller.__main__.run(params)
 
-    # copy exe to release dir
-    exe_src_path = os.path.join(DIST_DIR, f"{EXE_NAME}.exe")
-    exe_aim_path = os.path.join(RELEASE_DIR, f"{EXE_NAME}.exe")
-    if os.path.exists(exe_aim_path):
-        # remove read-only attribute and remove file
-        os.chmod(exe_aim_path, stat.S_IWRITE)
-        os.remove(exe_aim_path)
-    shutil.copy(exe_src_path, exe_aim_path)
+# copy exe, or exe with its contents directory, to release dir
+def release(exe_name: str, profile: str):
+    if profile == PACKAGE_PROFILE_ONEFILE:
+        exe_src_path = os.path.join(DIST_DIR, f"{exe_name}.exe")
+        exe_aim_path = os.path.join(RELEASE_DIR, f"{exe_name}.exe")
+        remove_path(exe_aim_path)
+        shutil.copy(exe_src_path, exe_aim_path)
+        return
+
+    dist_dir = os.path.join(DIST_DIR, exe_name)
+    for file_name in os.listdir(dist_dir):
+        aim_path = os.path.join(RELEASE_DIR, file_name)
+        remove_path(aim_path)
+        src_path = os.path.join(dist_dir, file_name)
+        if os.path.isdir(src_path):
+            shutil.copytree(src_path, aim_path)
+        else:
+            shutil.copy(src_path, aim_path)
+
+
+if __name__ == '__main__':
+
+    args = parse_args()
+
+    # prepare build cache dir
+    os.makedirs(BUILD_CACHE_DIR, exist_ok=True)
+
+    # run pyinstaller, matcher modules are imported by name so they are listed explicitly
+    main_params: list[str] = []
+    for module_name in MATCHER_MODULE_LIST:
+        main_params.extend(["--hidden-import", module_name])
+    for module_name in EXCLUDE_MODULE_LIST:
+        main_params.extend(["--exclude-module", module_name])
+    build(INPUT_PY, EXE_NAME, args.profile, main_params)
+
+    # client only needs stdlib, its own contents directory keeps both exe in one release dir
+    client_params: list[str] = ["--exclude-module", "numpy", "--exclude-module", "scipy"]
+    if args.profile == PACKAGE_PROFILE_ONEDIR:
+        client_params.extend(["--contents-directory", "_client_internal"])
+    build(CLIENT_INPUT_PY, CLIENT_EXE_NAME, args.profile, client_params)
+
+    release(EXE_NAME, args.profile)
+    release(CLIENT_EXE_NAME, args.profile)
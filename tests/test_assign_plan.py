@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+
+from cores.assign_plan import AssignPlanEntry, AssignPlanWriter, read_assign_plan
+from models.auto_assign_result import AutoAssignTask, AutoAssignTaskStatus
+from models.wwise_object import WwiseObject
+
+
+def create_object(object_id: str, name: str) -> WwiseObject:
+    return WwiseObject.from_dict({"id": object_id, "name": name})
+
+
+def create_plan_entry_list() -> list[AssignPlanEntry]:
+    container_obj = create_object("{C}", "Foot, \"Grass\"")
+    grass_obj = create_object("{S0}", "Grass")
+    wood_obj = create_object("{S1}", "Wood")
+
+    pending_task = AutoAssignTask(create_object("{K0}", "Foot_Grass_01"))
+    pending_task.expect_switch_object = grass_obj
+    unexpect_task = AutoAssignTask(create_object("{K1}", "Foot_Wood_02"))
+    unexpect_task.expect_switch_object = wood_obj
+    unexpect_task.status = AutoAssignTaskStatus.AlreadyAssignedUnexpect
+    no_match_task = AutoAssignTask(create_object("{K2}", "Foot_02"))
+    no_match_task.status = AutoAssignTaskStatus.NoMatchSwitch
+    no_group_task = AutoAssignTask(container_obj)
+    no_group_task.status = AutoAssignTaskStatus.SwitchGroupNotSet
+
+    return [
+        AssignPlanEntry.from_assign_task(container_obj, pending_task, 0.75, None),
+        AssignPlanEntry.from_assign_task(container_obj, unexpect_task, 1.0, grass_obj),
+        AssignPlanEntry.from_assign_task(container_obj, no_match_task, None, None),
+        AssignPlanEntry.from_assign_task(container_obj, no_group_task, None, None),
+    ]
+
+
+class AssignPlanTest(unittest.TestCase):
+
+    def assert_round_trip(self, file_name: str):
+        plan_entry_list = create_plan_entry_list()
+        with tempfile.TemporaryDirectory() as dir_path:
+            file_path = os.path.join(dir_path, "plans", file_name)
+            with AssignPlanWriter(file_path) as plan_writer:
+                for plan_entry in plan_entry_list:
+                    plan_writer.write(plan_entry)
+            self.assertEqual(plan_writer.entry_count, len(plan_entry_list))
+            read_entry_list = read_assign_plan(file_path)
+        self.assertEqual([entry.to_dict() for entry in read_entry_list],
+                         [entry.to_dict() for entry in plan_entry_list])
+        self.assertEqual([entry.need_apply() for entry in read_entry_list], [True, True, False, False])
+
+    def test_jsonl_round_trip(self):
+        self.assert_round_trip("assign_plan.jsonl")
+
+    def test_csv_round_trip(self):
+        self.assert_round_trip("assign_plan.CSV")
+
+    def test_container_task_has_no_child(self):
+        plan_entry = create_plan_entry_list()[3]
+        self.assertEqual(plan_entry.child_id, "")
+        self.assertEqual(plan_entry.status, AutoAssignTaskStatus.SwitchGroupNotSet.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
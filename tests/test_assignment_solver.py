@@ -0,0 +1,60 @@
+import itertools
+import unittest
+
+import numpy as np
+
+from cores.assignment_solver import INVALID_INDEX, solve_many_to_one, solve_one_to_one
+
+
+# best (assigned child count, score sum) of one-to-one assignments by trying every assignment, for small matrices
+# the solver assigns as many children as possible first, scores of levenshtein are all negative
+def get_brute_force_result(score_array: np.ndarray) -> tuple[int, float]:
+    switch_count, child_count = score_array.shape
+    best_result = (0, 0.0)
+    for assign_count in range(min(switch_count, child_count) + 1):
+        for child_tuple in itertools.combinations(range(child_count), assign_count):
+            for switch_tuple in itertools.permutations(range(switch_count), assign_count):
+                score_sum = sum(score_array[switch_idx, child_idx]
+                                for switch_idx, child_idx in zip(switch_tuple, child_tuple))
+                if np.isfinite(score_sum):
+                    best_result = max(best_result, (assign_count, float(score_sum)))
+    return best_result
+
+
+def get_result(score_array: np.ndarray, best_row_list: list[int]) -> tuple[int, float]:
+    assigned_list = [(row, col) for col, row in enumerate(best_row_list) if row != INVALID_INDEX]
+    return len(assigned_list), float(sum(score_array[row, col] for row, col in assigned_list))
+
+
+class AssignmentSolverTest(unittest.TestCase):
+
+    def test_empty_matrix(self):
+        for solver in [solve_many_to_one, solve_one_to_one]:
+            self.assertEqual(solver(np.zeros((0, 3))), [INVALID_INDEX] * 3)
+            self.assertEqual(solver(np.zeros((3, 0))), [])
+            self.assertEqual(solver(np.zeros((0, 0))), [])
+            self.assertEqual(solver(np.full((2, 3), -np.inf)), [INVALID_INDEX] * 3)
+            self.assertEqual(solver(np.full((3, 2), -np.inf)), [INVALID_INDEX] * 2)
+
+    def test_many_to_one_rectangular(self):
+        score_array = np.array([[1.0, -np.inf, 0.2], [0.5, -np.inf, 0.9]])
+        self.assertEqual(solve_many_to_one(score_array), [0, INVALID_INDEX, 1])
+        self.assertEqual(solve_many_to_one(score_array.T), [0, 2])
+
+    def test_one_to_one_same_as_brute_force(self):
+        rnd = np.random.default_rng(0)
+        for shape in [(1, 4), (4, 1), (2, 5), (5, 2), (3, 3), (4, 3)]:
+            for _ in range(10):
+                score_array = rnd.integers(-4, 5, shape).astype(np.float64)
+                score_array[rnd.random(shape) < 0.3] = -np.inf
+                best_row_list = solve_one_to_one(score_array)
+                self.assertEqual(len(best_row_list), shape[1])
+                assigned_row_list = [row for row in best_row_list if row != INVALID_INDEX]
+                self.assertEqual(len(assigned_row_list), len(set(assigned_row_list)))
+                self.assertTrue(all(np.isfinite(score_array[row, col])
+                                    for col, row in enumerate(best_row_list) if row != INVALID_INDEX))
+                self.assertEqual(get_result(score_array, best_row_list), get_brute_force_result(score_array))
+
+
+if __name__ == '__main__':
+    unittest.main()
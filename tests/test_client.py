@@ -0,0 +1,28 @@
+import os
+import unittest
+
+from client import get_absolute_path_argv
+
+
+class ClientPathArgTest(unittest.TestCase):
+
+    def test_relative_paths_made_absolute(self):
+        argv = get_absolute_path_argv(["--user_config", "user_config.json", "--object_id", "{A}", "{B}",
+                                       "--apply_plan=plans/plan.csv", "--object_id_file", "ids.txt"])
+        self.assertEqual(argv, ["--user_config", os.path.abspath("user_config.json"), "--object_id", "{A}", "{B}",
+                                f"--apply_plan={os.path.abspath('plans/plan.csv')}",
+                                "--object_id_file", os.path.abspath("ids.txt")])
+
+    def test_absolute_path_kept(self):
+        path = os.path.abspath("plan.jsonl")
+        self.assertEqual(get_absolute_path_argv(["--dry_run", path]), ["--dry_run", path])
+
+    def test_optional_path_without_value(self):
+        self.assertEqual(get_absolute_path_argv(["--dry_run", "--recursive", "--profile"]),
+                         ["--dry_run", "--recursive", "--profile"])
+        self.assertEqual(get_absolute_path_argv(["--dry_run", "plan.csv", "--recursive"]),
+                         ["--dry_run", os.path.abspath("plan.csv"), "--recursive"])
+
+
+if __name__ == '__main__':
+    unittest.main()
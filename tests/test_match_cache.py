@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+from cores.match_cache import MatchCache
+
+
+class MatchCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "match_cache.json")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_methods_keep_own_columns(self):
+        match_cache = MatchCache()
+        match_cache.get_column_dict("{C}", "TfidfMatcher", "f1", ["a"])["a"] = [0.5]
+        match_cache.get_column_dict("{C}", "LevenshteinMatcher", "f2", ["a"])["a"] = [0.25]
+        match_cache.save(self.file_path)
+
+        loaded_cache = MatchCache()
+        loaded_cache.load(self.file_path)
+        self.assertEqual(loaded_cache.get_column_dict("{C}", "TfidfMatcher", "f1", ["a"]), {"a": [0.5]})
+        self.assertEqual(loaded_cache.get_column_dict("{C}", "LevenshteinMatcher", "f2", ["a"]), {"a": [0.25]})
+
+    def test_fingerprint_change_drops_columns(self):
+        match_cache = MatchCache()
+        match_cache.get_column_dict("{C}", "TfidfMatcher", "f1", ["a"])["a"] = [0.5]
+        self.assertEqual(match_cache.get_column_dict("{C}", "TfidfMatcher", "f2", ["a"]), {})
+
+    def test_save_drops_columns_of_removed_children(self):
+        match_cache = MatchCache()
+        column_dict = match_cache.get_column_dict("{C}", "TfidfMatcher", "f1", ["a", "b"])
+        column_dict["a"] = [0.5]
+        column_dict["b"] = [0.25]
+        match_cache.save(self.file_path)
+
+        loaded_cache = MatchCache()
+        loaded_cache.load(self.file_path)
+        # child b is deleted
+        loaded_cache.get_column_dict("{C}", "TfidfMatcher", "f1", ["a"])
+        # container not handled in this run keeps its columns
+        loaded_cache.container_dict[("{D}", "TfidfMatcher")] = ("f1", {"x": [1.0]})
+        loaded_cache.save(self.file_path)
+
+        reloaded_cache = MatchCache()
+        reloaded_cache.load(self.file_path)
+        self.assertEqual(reloaded_cache.get_column_dict("{C}", "TfidfMatcher", "f1", ["a"]), {"a": [0.5]})
+        self.assertEqual(reloaded_cache.get_column_dict("{D}", "TfidfMatcher", "f1", ["x"]), {"x": [1.0]})
+
+
+if __name__ == "__main__":
+    unittest.main()
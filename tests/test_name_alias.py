@@ -0,0 +1,67 @@
+import re
+import unittest
+
+from cores.name_alias import NameAliasReplacer
+
+NAME_LIST = ["Foot_Grass_01", "Foot_Wood_02", "foley_cloth_fast_03", "Amb_Wind_Loop", "vo_hero_00", "Foot__Snow"]
+
+
+class NameAliasReplacerTest(unittest.TestCase):
+
+    # every name replaced by the rule alone with re.sub, the behaviour of applying rules one by one
+    def assert_same_as_single_rule(self, pattern_str: str, template: str):
+        replacer = NameAliasReplacer({}, {pattern_str: template})
+        for name in NAME_LIST:
+            self.assertEqual(replacer.get_alias_name(name), re.sub(pattern_str, template, name), name)
+
+    def test_longer_literal_wins(self):
+        replacer = NameAliasReplacer({"Foot": "F", "Foot_Grass": "Step_Grass", "": "ignored"})
+        self.assertEqual(replacer.get_alias_name("Foot_Grass_01"), "Step_Grass_01")
+        self.assertEqual(replacer.get_alias_name("Foot_Wood_02"), "F_Wood_02")
+
+    def test_merged_rules_same_as_single_rules(self):
+        for pattern_str, template in [
+            (r"\d+", "N"),
+            (r"(?i)foot", "step"),
+            (r"_+", "_"),
+            (r"^vo", "voice"),
+            (r"\bLoop$", "L"),
+            (r"o", r"[\g<0>]"),
+        ]:
+            self.assert_same_as_single_rule(pattern_str, template)
+
+    def test_rules_with_groups_same_as_single_rules(self):
+        for pattern_str, template in [
+            (r"(\w)\1", r"\1"),
+            (r"(?P<literal>Foot)", r"\g<literal>Step"),
+            (r"(?P<word>[A-Z])(?P<rest>[a-z]+)", r"\g<rest>\g<word>"),
+            (r"(?P<a>_)(?P=a)", "-"),
+        ]:
+            self.assert_same_as_single_rule(pattern_str, template)
+
+    def test_lookaround_rules_same_as_single_rules(self):
+        for pattern_str, template in [
+            (r"(?<=_)Grass", "Turf"),
+            (r"(?<!_)o", "0"),
+            (r"Foot(?=_W)", "Step"),
+            (r"\d(?!\d)", "#"),
+        ]:
+            self.assert_same_as_single_rule(pattern_str, template)
+
+    def test_rules_sharing_group_names(self):
+        replacer = NameAliasReplacer({"Foot": "Step"}, {r"(?P<a>Grass)": "Turf", r"(?P<a>Wood)": "Plank"})
+        self.assertEqual(replacer.get_alias_name("Foot_Grass_01"), "Step_Turf_01")
+        self.assertEqual(replacer.get_alias_name("Foot_Wood_02"), "Step_Plank_02")
+
+    def test_literal_and_merged_rules_in_one_scan(self):
+        replacer = NameAliasReplacer({"Foot": "Step"}, {r"\d+": "N", r"Grass|Wood": "Ground"})
+        self.assertEqual(replacer.get_alias_name("Foot_Grass_01"), "Step_Ground_N")
+        self.assertEqual(replacer.get_alias_name("Foot_Wood_02"), "Step_Ground_N")
+
+    def test_invalid_rule_skipped(self):
+        replacer = NameAliasReplacer({}, {r"(": "x", r"\d+": "N"})
+        self.assertEqual(replacer.get_alias_name("Foot_Grass_01"), "Foot_Grass_N")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import itertools
+import time
+import unittest
+
+from cores.pipeline import StreamPipeline
+
+
+class StageError(Exception):
+    pass
+
+
+class StreamPipelineTest(unittest.TestCase):
+
+    def assert_stopped(self, pipeline: StreamPipeline):
+        for thread in pipeline._thread_list:
+            self.assertFalse(thread.is_alive(), thread.name)
+
+    def test_items_keep_order(self):
+        with StreamPipeline(range(100), [lambda x: [x, x + 0.5], lambda x: [x * 2]], 2) as pipeline:
+            item_list = list(pipeline)
+        self.assertEqual(item_list, [value * 2 for x in range(100) for value in (x, x + 0.5)])
+        self.assert_stopped(pipeline)
+
+    def test_empty_source(self):
+        with StreamPipeline([], [lambda x: [x]], 1) as pipeline:
+            self.assertEqual(list(pipeline), [])
+        self.assert_stopped(pipeline)
+
+    def test_stage_exception_raised_to_caller(self):
+        def raise_stage(x):
+            if x == 5:
+                raise StageError(x)
+            return [x]
+
+        # endless source, stages before the failing one wait for full queues
+        item_list = []
+        with self.assertRaises(StageError):
+            with StreamPipeline(itertools.count(), [lambda x: [x], raise_stage, lambda x: [x]], 1) as pipeline:
+                for item in pipeline:
+                    item_list.append(item)
+        # items waiting in queues when the stage fails may be dropped, but never reordered
+        self.assertEqual(item_list, list(range(len(item_list))))
+        self.assertLessEqual(len(item_list), 5)
+        self.assert_stopped(pipeline)
+
+    def test_source_exception_raised_to_caller(self):
+        def source():
+            yield 1
+            raise StageError()
+
+        with self.assertRaises(StageError):
+            with StreamPipeline(source(), [lambda x: [x]], 1) as pipeline:
+                list(pipeline)
+        self.assert_stopped(pipeline)
+
+    def test_caller_exception_stops_stages(self):
+        start_time = time.perf_counter()
+        with self.assertRaises(StageError):
+            with StreamPipeline(itertools.count(), [lambda x: [x], lambda x: [x]], 1) as pipeline:
+                for item in pipeline:
+                    if item == 3:
+                        raise StageError()
+        self.assert_stopped(pipeline)
+        self.assertLess(time.perf_counter() - start_time, 5)
+
+    def test_caller_break_stops_stages(self):
+        with StreamPipeline(itertools.count(), [lambda x: [x], lambda x: [x, x]], 1) as pipeline:
+            for item in pipeline:
+                if item == 3:
+                    break
+        self.assert_stopped(pipeline)
+
+if __name__ == '__main__':
+    unittest.main()
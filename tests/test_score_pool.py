@@ -0,0 +1,47 @@
+import unittest
+
+from cores.score_pool import ScoreTask, ScoreWorker
+from models.config import UserConfig
+from models.wwise_object import WwiseObject, WwiseSwitchContainerInfo
+
+
+def create_switch_container_info(switch_name_list: list[str], child_name_list: list[str]) -> WwiseSwitchContainerInfo:
+    info = WwiseSwitchContainerInfo(WwiseObject.from_dict({"id": "{C}", "name": "Foot", "type": "SwitchContainer"}))
+    # switch groups are cached by id, one group for every switch list
+    group_id = "{G_" + "_".join(switch_name_list) + "}"
+    info.switch_group_object = WwiseObject.from_dict({"id": group_id, "name": "Surface", "type": "SwitchGroup"})
+    info.switch_object_list = [
+        WwiseObject.from_dict({"id": f"{{S{idx}}}", "name": name, "type": "Switch"})
+        for idx, name in enumerate(switch_name_list)
+    ]
+    info.container_child_list = [
+        WwiseObject.from_dict({"id": f"{{K{idx}}}", "name": name, "type": "Sound"})
+        for idx, name in enumerate(child_name_list)
+    ]
+    return info
+
+
+class ScoreWorkerTest(unittest.TestCase):
+
+    def test_empty_and_rectangular_containers(self):
+        for match_method in ["levenshtein", "levenshtein_normalized", "partial_ratio", "word_dict", "tfidf"]:
+            worker = ScoreWorker(match_method, UserConfig())
+            for assignment_solver in ["greedy", "argmax", "hungarian"]:
+                for switch_name_list, child_name_list in [
+                    ([], ["Foot_Grass_01"]),
+                    (["Grass", "Wood"], []),
+                    (["Grass", "Wood"], ["Foot_Grass_01", "Foot_Wood_02", "Foot_Grass_03"]),
+                    (["Grass", "Wood", "Metal", "Snow"], ["Foot_Metal_01"]),
+                ]:
+                    result = worker.score(ScoreTask(
+                        create_switch_container_info(switch_name_list, child_name_list), False, assignment_solver
+                    ))
+                    message = f"{match_method} {assignment_solver} {len(switch_name_list)}x{len(child_name_list)}"
+                    self.assertEqual(len(result.best_match_row_list), len(child_name_list), message)
+                    self.assertEqual(len(result.match_score_matrix), len(switch_name_list), message)
+                    self.assertTrue(all(-1 <= row < len(switch_name_list) for row in result.best_match_row_list),
+                                    message)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import random
+import unittest
+
+from cores.sentence_diff import WordDict
+
+
+def create_word_dict(sentence_list: list[list[str]], sign_list: list[str] | None = None) -> WordDict:
+    word_dict = WordDict(sign_list=sign_list)
+    for sentence in sentence_list:
+        word_dict.add_words(sentence)
+    word_dict.create_mapping()
+    return word_dict
+
+
+class WordDictSimilarityMatrixTest(unittest.TestCase):
+
+    def assert_same_as_pairs(self, word_dict: WordDict, sentence_list_a: list[list[str]],
+                             sentence_list_b: list[list[str]]):
+        similarity_array = WordDict.cal_sentence_similarity_matrix(word_dict, sentence_list_a, sentence_list_b)
+        self.assertEqual(similarity_array.shape, (len(sentence_list_a), len(sentence_list_b)))
+        for idx_a, sentence_a in enumerate(sentence_list_a):
+            for idx_b, sentence_b in enumerate(sentence_list_b):
+                self.assertAlmostEqual(similarity_array[idx_a, idx_b],
+                                       WordDict.cal_sentence_similarity(word_dict, sentence_a, sentence_b),
+                                       msg=f"{sentence_a} {sentence_b}")
+
+    def test_empty_and_rectangular(self):
+        sentence_list_a = [["grass"], ["wood", "wood"], []]
+        sentence_list_b = [["foot", "grass", "01"], ["foot", "wood", "wood", "wood"], [], ["grass", "grass"]]
+        word_dict = create_word_dict(sentence_list_a + sentence_list_b)
+        self.assert_same_as_pairs(word_dict, sentence_list_a, sentence_list_b)
+        self.assert_same_as_pairs(word_dict, sentence_list_b, sentence_list_a)
+        self.assert_same_as_pairs(word_dict, [], sentence_list_b)
+        self.assert_same_as_pairs(word_dict, sentence_list_a, [])
+
+    def test_random_sentences_with_repeated_words(self):
+        rnd = random.Random(0)
+        word_list = [f"w{idx}" for idx in range(8)]
+        sentence_list_a = [rnd.choices(word_list, k=rnd.randint(0, 5)) for _ in range(7)]
+        sentence_list_b = [rnd.choices(word_list, k=rnd.randint(0, 6)) for _ in range(11)]
+        self.assert_same_as_pairs(create_word_dict(sentence_list_a + sentence_list_b), sentence_list_a, sentence_list_b)
+
+    def test_words_without_sign(self):
+        # a given sign list is not extended, words beyond it become the non-word sign and are ignored
+        sentence_list_a = [["grass", "foot"], ["wood"]]
+        sentence_list_b = [["foot", "foot", "grass"], ["metal", "wood"], ["snow"]]
+        word_dict = create_word_dict(sentence_list_a + sentence_list_b, sign_list=["a", "b", "c"])
+        self.assert_same_as_pairs(word_dict, sentence_list_a, sentence_list_b)
+
+
+if __name__ == '__main__':
+    unittest.main()
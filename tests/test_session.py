@@ -0,0 +1,66 @@
+import unittest
+
+from cores.session import AssignSession
+from models.config import UserConfig
+
+
+class AssignSessionTokenizerTest(unittest.TestCase):
+
+    def test_tokenizer_kept_while_user_config_is_same(self):
+        session = AssignSession(None)
+        session.check_user_config(UserConfig())
+        tokenizer = session.tokenizer
+        token_id_list = tokenizer.get_token_id_array("Foot_Grass").tolist()
+
+        session.check_user_config(UserConfig())
+        self.assertIs(session.tokenizer, tokenizer)
+        self.assertEqual(session.tokenizer.get_token_id_array("Foot_Grass").tolist(), token_id_list)
+
+    def test_tokenizer_replaced_with_switch_groups(self):
+        session = AssignSession(None)
+        session.check_user_config(UserConfig())
+        tokenizer = session.tokenizer
+
+        user_config = UserConfig()
+        user_config.tokenizer = {"separators": "_-"}
+        session.check_user_config(user_config)
+        self.assertIsNot(session.tokenizer, tokenizer)
+        self.assertEqual(session.tokenizer.separators, "_-")
+        self.assertEqual(len(session.switch_group_cache.entry_dict), 0)
+
+
+
+class DisconnectedWaapiClient(object):
+
+    def __init__(self, can_reconnect: bool):
+        self.can_reconnect: bool = can_reconnect
+        self.subscribed_topic_list: list[str] = []
+
+    def is_connected(self) -> bool:
+        return False
+
+    def reconnect(self) -> bool:
+        return self.can_reconnect
+
+    def subscribe(self, topic: str, callback) -> bool:
+        self.subscribed_topic_list.append(topic)
+        return True
+
+
+class AssignSessionReconnectTest(unittest.TestCase):
+
+    def test_job_cannot_run_if_reconnect_fails(self):
+        waapi_client = DisconnectedWaapiClient(can_reconnect=False)
+        session = AssignSession(waapi_client)
+        self.assertFalse(session.clear_outdated_cache())
+        self.assertEqual(waapi_client.subscribed_topic_list, [])
+
+    def test_subscribe_again_after_reconnect(self):
+        waapi_client = DisconnectedWaapiClient(can_reconnect=True)
+        session = AssignSession(waapi_client)
+        self.assertTrue(session.clear_outdated_cache())
+        self.assertEqual(waapi_client.subscribed_topic_list, AssignSession.OBJECT_CHANGED_TOPIC_LIST)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import random
+import unittest
+
+from cores.tfidf import SentenceIndex, cal_similarity_matrix
+
+
+class SimilarityMatrixTest(unittest.TestCase):
+
+    @staticmethod
+    def create_index(rng: random.Random, word_list: list[str], sentence_count: int) -> SentenceIndex:
+        index = SentenceIndex()
+        for key in range(sentence_count):
+            # repeated words and empty sentences included
+            index.add_sentence(key, [rng.choice(word_list) for _ in range(rng.randint(0, 6))])
+        index.generate_index()
+        return index
+
+    # matrix product gives the same scores as get_similarity of both indexes on every pair
+    def test_matrix_equals_per_pair(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            row_word_list = [f"w{i}" for i in range(rng.randint(1, 12))]
+            col_word_list = [f"w{i}" for i in range(rng.randint(1, 12))]
+            row_index = self.create_index(rng, row_word_list, rng.randint(1, 8))
+            col_index = self.create_index(rng, col_word_list, rng.randint(1, 8))
+            row_key_list = list(row_index.sentence_dict.keys())
+            col_key_list = list(col_index.sentence_dict.keys())
+
+            similarity_matrix = cal_similarity_matrix(row_index, row_key_list, col_index, col_key_list)
+
+            self.assertEqual(similarity_matrix.shape, (len(row_key_list), len(col_key_list)))
+            for row, row_key in enumerate(row_key_list):
+                for col, col_key in enumerate(col_key_list):
+                    expected_similarity = \
+                        row_index.get_similarity(col_index.sentence_dict[col_key], row_key) + \
+                        col_index.get_similarity(row_index.sentence_dict[row_key], col_key)
+                    self.assertAlmostEqual(similarity_matrix[row, col], expected_similarity, delta=1e-9)
+
+
+if __name__ == "__main__":
+    unittest.main()
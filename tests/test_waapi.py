@@ -0,0 +1,86 @@
+import re
+import unittest
+
+from cores.waapi import WaapiWampClient
+
+
+class FakeSession(object):
+
+    def __init__(self):
+        self.uri_list: list[str] = []
+
+    def call(self, uri: str, args: dict = None) -> dict:
+        self.uri_list.append(uri)
+        return {"uri": uri}
+
+
+# answers "from object" and "from project where id" queries, fails the whole query if any id does not exist
+class FakeWaqlSession(FakeSession):
+
+    def __init__(self, object_id_list: list[str]):
+        super().__init__()
+        self.object_id_set: set[str] = set(object_id_list)
+
+    def call(self, uri: str, args: dict = None) -> dict | None:
+        self.uri_list.append(args["waql"])
+        object_id_list = re.findall(r'"(\{[^"]*\})"', args["waql"])
+        if any(object_id not in self.object_id_set for object_id in object_id_list):
+            return None
+        return {"return": [{"id": object_id, "name": object_id.strip("{}")} for object_id in object_id_list]}
+
+
+def create_waapi_client(session: FakeSession) -> WaapiWampClient:
+    waapi_client = WaapiWampClient()
+    waapi_client._waapi_client_list.append(session)
+    waapi_client._idle_waapi_client_queue.put(session)
+    return waapi_client
+
+
+class WaapiWampClientCallTest(unittest.TestCase):
+
+    def test_call_without_connection_fails(self):
+        waapi_client = WaapiWampClient()
+        self.assertIsNone(waapi_client.call("ak.wwise.core.getProjectInfo"))
+        self.assertIsNone(waapi_client.get_project_info())
+
+    def test_call_without_idle_session_times_out(self):
+        waapi_client = WaapiWampClient()
+        waapi_client.IDLE_SESSION_TIMEOUT = 0.1
+        # the only session is busy and never comes back
+        waapi_client._waapi_client_list.append(FakeSession())
+        self.assertIsNone(waapi_client.call("ak.wwise.core.getProjectInfo"))
+
+    def test_session_returned_after_call(self):
+        waapi_client = WaapiWampClient()
+        session = FakeSession()
+        waapi_client._waapi_client_list.append(session)
+        waapi_client._idle_waapi_client_queue.put(session)
+        for _ in range(3):
+            self.assertEqual(waapi_client.call("ak.wwise.core.getInfo"), {"uri": "ak.wwise.core.getInfo"})
+        self.assertEqual(len(session.uri_list), 3)
+
+
+
+class QueryExistingObjectsTest(unittest.TestCase):
+
+    def test_chunks_without_missing_objects(self):
+        object_id_list = [f"{{O{idx}}}" for idx in range(5)]
+        session = FakeWaqlSession(object_id_list)
+        waapi_client = create_waapi_client(session)
+        waapi_client.WAQL_OBJECT_CHUNK_SIZE = 2
+        self.assertEqual([obj.id for obj in waapi_client.query_existing_objects(object_id_list)], object_id_list)
+        self.assertEqual(len(session.uri_list), 3)
+
+    def test_chunk_with_missing_object_queried_one_by_one(self):
+        object_id_list = [f"{{O{idx}}}" for idx in range(6)]
+        session = FakeWaqlSession([object_id for object_id in object_id_list if object_id != "{O3}"])
+        waapi_client = create_waapi_client(session)
+        waapi_client.WAQL_OBJECT_CHUNK_SIZE = 2
+        self.assertEqual([obj.id for obj in waapi_client.query_existing_objects(object_id_list)],
+                         ["{O0}", "{O1}", "{O2}", "{O4}", "{O5}"])
+        # 3 chunks, then 2 ids of the failed chunk
+        self.assertEqual(len(session.uri_list), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()